@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+"""Benchmark the Python fetch pipeline against the TS one on the same captured Apify runs
+
+Both pipelines fetch every case in the capture (X handle or LinkedIn profile plus limit)
+--rounds times, --concurrency at a time, through one Apify stand-in, and serialize each
+bundle the way their tools do. The stand-in is `npm run upstream-stub` (started here unless
+--base-url points at one already running), so both sides see identical upstream latency.
+
+Usage:
+    python benchmark_pipeline.py [golden/captures.jsonl] [--rounds 20] [--concurrency 4]
+                                 [--base-url http://127.0.0.1:9900] [--python-only] [--tsx PATH]
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from social_mcp_server.config import Config
+from social_mcp_server.engine import SocialEngine, SocialFetchError
+from social_mcp_server.serialize import bundle_to_json
+
+ROOT = Path(__file__).parent
+TSX = ROOT / "node_modules" / ".bin" / "tsx"
+
+
+def load_cases(capture_path: Path, settings: Config) -> List[Dict]:
+    """One case per captured X or LinkedIn run, as the TS golden command derives them"""
+    cases = []
+    for line in capture_path.read_text(encoding="utf-8").splitlines():
+        record = json.loads(line) if line.strip() else {}
+        if record.get("type") != "apify_run":
+            continue
+        run_input = record.get("input") or {}
+        if record["actor_id"] == settings.apify_twitter_actor and isinstance(run_input.get("handles"), list):
+            cases.append({"platform": "x", "target": str(run_input["handles"][0]), "limit": run_input["tweetsPerQuery"]})
+        elif record["actor_id"] == settings.apify_linkedin_posts_actor and isinstance(run_input.get("profileUrl"), str):
+            cases.append({"platform": "linkedin", "target": run_input["profileUrl"], "limit": run_input["postsCount"]})
+    return cases
+
+
+def percentile(ordered: List[float], p: float) -> float:
+    if not ordered:
+        return 0
+    return ordered[min(len(ordered) - 1, math.ceil(p / 100 * len(ordered)) - 1)]
+
+
+async def run_python(cases: List[Dict], base_url: str, rounds: int, concurrency: int) -> Dict:
+    """Time the Python pipeline: one engine, one connection pool, for every call"""
+    engine = SocialEngine(Config(
+        apify_token="benchmark", apify_base_url=base_url, apify_max_concurrent_runs=max(8, concurrency)
+    ))
+    calls = [case for _ in range(rounds) for case in cases]
+    latencies: List[float] = []
+    errors = 0
+    slots = asyncio.Semaphore(concurrency)
+
+    async def call(case: Dict) -> None:
+        nonlocal errors
+        async with slots:
+            sent_at = time.perf_counter()
+            try:
+                if case["platform"] == "x":
+                    bundle_to_json(await engine.x_bundle(case["target"], case["limit"]))
+                else:
+                    bundle_to_json(await engine.linkedin_bundle(case["target"], case["limit"]))
+            except SocialFetchError:
+                errors += 1
+            finally:
+                latencies.append((time.perf_counter() - sent_at) * 1000)
+
+    started_at = time.perf_counter()
+    try:
+        await asyncio.gather(*(call(case) for case in calls))
+    finally:
+        await engine.aclose()
+    wall_ms = (time.perf_counter() - started_at) * 1000
+
+    latencies.sort()
+    return {
+        "pipeline": "python",
+        "calls": len(calls),
+        "errors": errors,
+        "concurrency": concurrency,
+        "wall_ms": round(wall_ms),
+        "latency_ms": {
+            "p50": round(percentile(latencies, 50), 1),
+            "p95": round(percentile(latencies, 95), 1),
+            "p99": round(percentile(latencies, 99), 1),
+            "max": round(latencies[-1] if latencies else 0, 1),
+        },
+    }
+
+
+def run_typescript(tsx: str, capture_path: Path, base_url: str, rounds: int, concurrency: int) -> Dict:
+    """Time the TS pipeline with its golden command (its report is pretty-printed among log lines)"""
+    completed = subprocess.run(
+        [tsx, "src/cli/golden.ts", str(capture_path), "--rounds", str(rounds),
+         "--concurrency", str(concurrency), "--base-url", base_url],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    report, _ = json.JSONDecoder().raw_decode(completed.stdout, completed.stdout.rindex('{\n  "pipeline"'))
+    return report
+
+
+def start_stand_in(tsx: str, capture_path: Path) -> "tuple[subprocess.Popen, str]":
+    """Start the upstream stub on a free port, answering runs without their captured delay"""
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    process = subprocess.Popen(
+        [tsx, "src/cli/upstream-stub.ts", str(capture_path), "--port", str(port), "--speed", "Infinity"],
+        cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    for _ in range(100):
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+            return process, f"http://127.0.0.1:{port}"
+        except OSError:
+            time.sleep(0.1)
+    process.terminate()
+    raise RuntimeError("Upstream stub did not start")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("capture", nargs="?", default=str(ROOT / "golden" / "captures.jsonl"))
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--base-url", help="Apify stand-in already running (default: start one)")
+    parser.add_argument("--python-only", action="store_true", help="skip the TS pipeline")
+    parser.add_argument("--tsx", default=str(TSX), help="command that runs the TS sources (default: the local tsx)")
+    args = parser.parse_args(argv)
+
+    capture_path = Path(args.capture).resolve()
+    cases = load_cases(capture_path, Config())
+    if not cases:
+        sys.exit(f"No X or LinkedIn runs in {capture_path}")
+
+    stand_in, base_url = (None, args.base_url) if args.base_url else start_stand_in(args.tsx, capture_path)
+    try:
+        reports = [asyncio.run(run_python(cases, base_url, args.rounds, args.concurrency))]
+        if not args.python_only:
+            reports.append(run_typescript(args.tsx, capture_path, base_url, args.rounds, args.concurrency))
+    finally:
+        if stand_in:
+            stand_in.terminate()
+
+    print(json.dumps(reports, indent=2))
+    if len(reports) == 2 and reports[1]["wall_ms"]:
+        print(f"python/ts wall time: {reports[0]['wall_ms'] / reports[1]['wall_ms']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -19,8 +19,8 @@ logger = logging.getLogger(__name__)
 # Single consolidated server
 SERVER_APP = social_app
 SERVERS = {
-    'x': x_app,
-    'linkedin': linkedin_app,
+    'x': social_app,
+    'linkedin': social_app,
 }
 
 def get_server_type() -> str:
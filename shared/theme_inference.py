@@ -3,63 +3,34 @@ Theme inference system for ColdOpen Coach.
 Deterministic keyword-based theme detection from social media posts.
 """
 
-import re
-from typing import List, Set
+from typing import List, Tuple
 from .models import Post
 
 
 class ThemeInferenceEngine:
     """Simple keyword-based theme detection"""
 
-    # Theme keywords mapping
-    THEME_KEYWORDS = {
-        "ai_agents": [
-            "ai agent", "ai agents", "llm", "gpt", "claude", "chatgpt",
-            "artificial intelligence", "machine learning", "ml", "neural network"
-        ],
-        "shipping_quality": [
-            "ship", "shipping", "deploy", "deployment", "launch", "release",
-            "quality", "testing", "qa", "bug", "fix", "build"
-        ],
-        "product_experiments": [
-            "experiment", "a/b test", "feature flag", "mvp", "prototype",
-            "user research", "product", "feedback", "iterate", "validation"
-        ],
-        "fundraising": [
-            "fundraising", "funding", "investor", "series a", "series b", "seed",
-            "vc", "venture capital", "pitch", "valuation", "raise"
-        ],
-        "hiring": [
-            "hiring", "recruiting", "job", "position", "team", "engineer",
-            "developer", "designer", "pm", "product manager", "we're hiring"
-        ],
-        "open_source": [
-            "open source", "oss", "github", "contribution", "maintainer",
-            "pull request", "pr", "commit", "repository", "license"
-        ],
-        "design_systems": [
-            "design system", "ui", "ux", "user interface", "user experience",
-            "component library", "figma", "design", "prototype", "wireframe"
-        ],
-        "sports": [
-            "football", "basketball", "soccer", "baseball", "tennis", "golf",
-            "olympics", "championship", "game", "match", "season", "playoffs"
-        ],
-        "crypto": [
-            "bitcoin", "ethereum", "crypto", "cryptocurrency", "blockchain",
-            "defi", "nft", "web3", "dao", "smart contract"
-        ],
-        "career": [
-            "career", "job search", "interview", "resume", "linkedin",
-            "networking", "promotion", "skills", "growth", "mentor"
-        ]
-    }
+    # Theme keywords and weights, kept identical to src/utils/theme-inference.ts
+    # so both pipelines tag the same posts with the same themes
+    THEMES = [
+        ("technology", ["ai", "ml", "tech", "software", "coding", "programming", "developer", "startup", "saas"], 1.0),
+        ("business", ["business", "strategy", "growth", "revenue", "marketing", "sales", "leadership", "management"], 1.0),
+        ("career", ["job", "career", "hiring", "interview", "promotion", "salary", "remote", "work"], 0.9),
+        ("entrepreneurship", ["entrepreneur", "startup", "founder", "venture", "funding", "investment", "pitch"], 0.9),
+        ("personal_development", ["learning", "growth", "skill", "education", "course", "book", "productivity"], 0.8),
+        ("finance", ["finance", "money", "investment", "trading", "crypto", "bitcoin", "market"], 0.8),
+        ("social_impact", ["climate", "sustainability", "social", "impact", "charity", "volunteer", "community"], 0.7),
+        ("health_fitness", ["health", "fitness", "wellness", "exercise", "diet", "nutrition", "mental health"], 0.6),
+    ]
 
     @classmethod
-    def infer_themes(cls, post: Post, max_themes: int = 5) -> List[str]:
+    def infer_themes(cls, post: Post, max_themes: int = 3) -> List[str]:
         """
         Infer themes from a post using keyword matching.
 
+        Each keyword found in the text or hashtags adds its theme's weight;
+        themes are returned highest score first (ties in declaration order).
+
         Args:
             post: Post to analyze
             max_themes: Maximum number of themes to return
@@ -67,34 +38,22 @@ class ThemeInferenceEngine:
         Returns:
             List of detected theme names
         """
-        if not post.text:
-            return []
-
-        text_lower = post.text.lower()
-        detected_themes: Set[str] = set()
+        text = f"{post.text} {' '.join(post.hashtags)}".lower()
+        scores: List[Tuple[str, float]] = []
 
-        for theme_name, keywords in cls.THEME_KEYWORDS.items():
+        for theme_name, keywords, weight in cls.THEMES:
+            score = 0.0
             for keyword in keywords:
-                # Use word boundaries to avoid partial matches
-                pattern = r'\b' + re.escape(keyword.lower()) + r'\b'
-                if re.search(pattern, text_lower):
-                    detected_themes.add(theme_name)
-                    break  # Found one keyword for this theme, move to next theme
-
-        # Also check hashtags for additional themes
-        for hashtag in post.hashtags:
-            hashtag_lower = hashtag.lower().replace('#', '')
-            for theme_name, keywords in cls.THEME_KEYWORDS.items():
-                for keyword in keywords:
-                    keyword_normalized = keyword.replace(' ', '').lower()
-                    if hashtag_lower == keyword_normalized or keyword_normalized in hashtag_lower:
-                        detected_themes.add(theme_name)
+                if keyword in text:
+                    score += weight
+            if score > 0:
+                scores.append((theme_name, score))
 
-        # Return sorted list, limited to max_themes
-        return sorted(list(detected_themes))[:max_themes]
+        scores.sort(key=lambda entry: entry[1], reverse=True)
+        return [theme_name for theme_name, _ in scores[:max_themes]]
 
     @classmethod
-    def infer_themes_bulk(cls, posts: List[Post], max_themes: int = 5) -> List[Post]:
+    def infer_themes_bulk(cls, posts: List[Post], max_themes: int = 3) -> List[Post]:
         """
         Infer themes for multiple posts and update them in place.
 
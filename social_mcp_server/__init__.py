@@ -0,0 +1,6 @@
+"""
+Social MCP server for ColdOpen Coach.
+Fetches recent X/Twitter and LinkedIn posts through Apify and serves them as normalized bundles.
+"""
+
+__version__ = "0.1.0"
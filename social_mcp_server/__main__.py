@@ -0,0 +1,8 @@
+"""
+Run the social MCP server over stdio: `python -m social_mcp_server`.
+"""
+
+from .cli_main import main
+
+
+main()
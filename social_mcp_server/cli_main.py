@@ -0,0 +1,41 @@
+"""
+Command line entry point: `social-mcp-server [--http] [--host HOST] [--port PORT] [--debug]`.
+Serves MCP over stdio by default, or over HTTP with --http.
+"""
+
+import argparse
+import logging
+import sys
+from typing import List, Optional
+
+from .config import config
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Parse arguments and run the server until it is stopped"""
+    parser = argparse.ArgumentParser(prog="social-mcp-server", description="Social media MCP server for Le Chat")
+    parser.add_argument("--http", action="store_true", help="serve over HTTP instead of stdio")
+    parser.add_argument("--host", default=config.host, help="HTTP host (default: HOST or 0.0.0.0)")
+    parser.add_argument("--port", type=int, default=config.port, help="HTTP port (default: PORT or 8080)")
+    parser.add_argument("--debug", action="store_true", help="log at debug level")
+    args = parser.parse_args(argv)
+
+    # stdout carries the protocol in stdio mode, so logs go to stderr
+    logging.basicConfig(
+        level=logging.DEBUG if args.debug else logging.INFO,
+        stream=sys.stderr,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+
+    from .server import app, mcp
+
+    if args.http:
+        import uvicorn
+
+        uvicorn.run(app, host=args.host, port=args.port, log_level="debug" if args.debug else "info")
+    else:
+        mcp.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Configuration for the social MCP server.
+Read from the environment (and .env) with the same variable names as the TypeScript server.
+"""
+
+import os
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from dotenv import load_dotenv
+
+
+load_dotenv()
+
+
+def _env_int(name: str, default: int) -> int:
+    return int(os.getenv(name) or default)
+
+
+@dataclass
+class Config:
+    """Server settings; see .env.example for what each variable does"""
+
+    # Apify configuration
+    apify_token: Optional[str] = None
+    apify_twitter_actor: str = "apidojo/tweet-scraper"
+    apify_linkedin_posts_actor: str = "your_linkedin_posts_actor"
+    # Alternative Apify API base URL, e.g. the replay stand-in from `npm run upstream-stub`
+    apify_base_url: str = "https://api.apify.com"
+
+    # Deadlines and retries
+    request_timeout_ms: int = 25000
+    apify_max_attempts: int = 3
+    apify_retry_base_ms: int = 500
+    # Actor runs in flight per actor, and the size of the shared connection pool
+    apify_max_concurrent_runs: int = 8
+
+    # Server configuration
+    server_name: str = "Social Snapshot Hub"
+    host: str = "0.0.0.0"
+    port: int = 8080
+    server_token: Optional[str] = None
+    allowed_origins: List[str] = field(default_factory=lambda: ["https://chat.mistral.ai"])
+
+    @classmethod
+    def from_env(cls) -> "Config":
+        """Build the settings from environment variables"""
+        return cls(
+            apify_token=os.getenv("APIFY_TOKEN") or None,
+            apify_twitter_actor=os.getenv("APIFY_TWITTER_ACTOR") or cls.apify_twitter_actor,
+            apify_linkedin_posts_actor=os.getenv("APIFY_LINKEDIN_POSTS_ACTOR") or cls.apify_linkedin_posts_actor,
+            apify_base_url=os.getenv("APIFY_BASE_URL") or cls.apify_base_url,
+            request_timeout_ms=_env_int("REQUEST_TIMEOUT_MS", cls.request_timeout_ms),
+            apify_max_attempts=_env_int("APIFY_MAX_ATTEMPTS", cls.apify_max_attempts),
+            apify_retry_base_ms=_env_int("APIFY_RETRY_BASE_MS", cls.apify_retry_base_ms),
+            apify_max_concurrent_runs=_env_int("APIFY_MAX_CONCURRENT_RUNS", cls.apify_max_concurrent_runs),
+            server_name=os.getenv("SERVER_NAME") or cls.server_name,
+            host=os.getenv("HOST") or cls.host,
+            port=_env_int("PORT", cls.port),
+            server_token=os.getenv("SERVER_TOKEN") or None,
+            allowed_origins=[
+                origin.strip()
+                for origin in (os.getenv("ALLOWED_ORIGINS") or "https://chat.mistral.ai").split(",")
+            ],
+        )
+
+
+config = Config.from_env()
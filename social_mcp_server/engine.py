@@ -0,0 +1,362 @@
+"""
+Fetch pipeline for the social MCP server: Apify run, normalization, themes and bundle assembly.
+One engine per process owns a pooled HTTP client, so every tool call reuses the same
+connections to Apify instead of setting up a client of its own.
+"""
+
+import asyncio
+import json
+import logging
+import math
+import random
+import re
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from shared.models import Bundle, Meta, Person, Platform, Post
+
+from .config import Config, config
+from .normalize import ItemConverter, iso_now, linkedin_converter, x_converter
+
+
+logger = logging.getLogger(__name__)
+
+SOURCE = "social-snapshot-hub"
+LINKEDIN_PROFILE_PATTERN = re.compile(r"linkedin\.com/in/([^/]+)")
+
+# Connect/read timeout for single Apify API calls (long polls add their wait on top)
+APIFY_IO_TIMEOUT_S = 10.0
+# Longest single waitForFinish long poll Apify allows
+APIFY_MAX_WAIT_S = 60
+
+
+class ErrorType(str, Enum):
+    """Error types shared with the TypeScript server"""
+    NOT_FOUND = "NOT_FOUND"
+    RATE_LIMITED = "RATE_LIMITED"
+    PRIVATE_PROFILE = "PRIVATE_PROFILE"
+    INVALID_INPUT = "INVALID_INPUT"
+    API_ERROR = "API_ERROR"
+    APIFY_RUN_ERROR = "APIFY_RUN_ERROR"
+    DEADLINE_EXCEEDED = "DEADLINE_EXCEEDED"
+
+
+RETRYABLE_ERRORS = {ErrorType.RATE_LIMITED, ErrorType.APIFY_RUN_ERROR, ErrorType.API_ERROR}
+
+
+class SocialFetchError(Exception):
+    """A classified fetch failure, rendered as "<TYPE>: <message>" like the TypeScript errors"""
+
+    def __init__(self, error_type: ErrorType, message: str):
+        super().__init__(f"{error_type.value}: {message}")
+        self.error_type = error_type
+
+
+def classify_error(error: Exception) -> SocialFetchError:
+    """
+    Wrap an error with its type, judged from the message.
+
+    Args:
+        error: Error raised while fetching
+
+    Returns:
+        The error itself if already classified, else a SocialFetchError around it
+    """
+    if isinstance(error, SocialFetchError):
+        return error
+
+    message = str(error)
+    lowered = message.lower()
+    if "rate limit" in lowered:
+        error_type = ErrorType.RATE_LIMITED
+    elif "private" in lowered or "protected" in lowered:
+        error_type = ErrorType.PRIVATE_PROFILE
+    elif "not found" in lowered:
+        error_type = ErrorType.NOT_FOUND
+    elif "actor run failed" in lowered:
+        error_type = ErrorType.APIFY_RUN_ERROR
+    else:
+        error_type = ErrorType.API_ERROR
+    return SocialFetchError(error_type, message)
+
+
+class SocialEngine:
+    """Fetches posts through Apify and turns them into bundles over one shared connection pool"""
+
+    def __init__(self, settings: Optional[Config] = None, client: Optional[httpx.AsyncClient] = None):
+        """
+        Args:
+            settings: Server settings; the environment's by default
+            client: HTTP client to use instead of a pooled one built from the settings
+        """
+        self.settings = settings or config
+        self._client = client
+        self._owns_client = client is None
+        self._run_slots: Dict[str, asyncio.Semaphore] = {}
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The pooled Apify API client, created on first use"""
+        if self._client is None:
+            pool_size = self.settings.apify_max_concurrent_runs * 2
+            self._client = httpx.AsyncClient(
+                base_url=f"{self.settings.apify_base_url.rstrip('/')}/v2",
+                headers={"Authorization": f"Bearer {self.settings.apify_token}"},
+                limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+                timeout=httpx.Timeout(APIFY_IO_TIMEOUT_S),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled client (an injected client is left to its owner)"""
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+            self._client = None
+
+    async def fetch_x_posts(self, handle: str, limit: int = 20) -> List[Post]:
+        """
+        Fetch X/Twitter posts with the tweet scraper actor.
+
+        Args:
+            handle: X handle, with or without @
+            limit: Maximum number of posts
+
+        Returns:
+            Normalized, themed posts in the order the actor returned them
+        """
+        clean_handle = handle.replace("@", "", 1)
+        logger.info("Fetching %s X posts for @%s", limit, clean_handle)
+
+        run_input = {
+            "handles": [clean_handle],
+            "tweetsPerQuery": limit,
+            "includeReplies": False,
+            "includeRetweets": False,
+        }
+        posts = await self.run_actor(self.settings.apify_twitter_actor, run_input, x_converter(clean_handle))
+        if not posts:
+            raise classify_error(Exception(f"No posts found for @{clean_handle}"))
+        return posts
+
+    async def fetch_linkedin_posts(self, profile_url: str, limit: int = 10) -> List[Post]:
+        """
+        Fetch LinkedIn posts with the LinkedIn posts actor.
+
+        Args:
+            profile_url: LinkedIn profile URL
+            limit: Maximum number of posts
+
+        Returns:
+            Normalized, themed posts in the order the actor returned them
+        """
+        logger.info("Fetching %s LinkedIn posts for %s", limit, profile_url)
+
+        run_input = {"profileUrl": profile_url, "postsCount": limit}
+        posts = await self.run_actor(self.settings.apify_linkedin_posts_actor, run_input, linkedin_converter(profile_url))
+        if not posts:
+            raise classify_error(Exception(f"No posts found for LinkedIn profile: {profile_url}"))
+        return posts
+
+    async def x_bundle(self, handle: str, limit: int = 20) -> Bundle:
+        """
+        Fetch an X handle's posts into a Bundle.
+
+        Args:
+            handle: X handle, with or without @
+            limit: Maximum number of posts
+
+        Returns:
+            Bundle with the person, posts and fetch metadata
+
+        Raises:
+            SocialFetchError: If the handle is empty or the fetch fails
+        """
+        clean_handle = handle.replace("@", "", 1).strip()
+        if not clean_handle:
+            raise SocialFetchError(ErrorType.INVALID_INPUT, "Handle cannot be empty")
+
+        posts = await self.fetch_x_posts(clean_handle, limit)
+        person = Person(
+            name=f"@{clean_handle}",
+            platform=Platform.X,
+            handle=clean_handle,
+            profile_url=f"https://twitter.com/{clean_handle}",
+            headline_or_bio="",
+        )
+        return Bundle(person=person, posts=posts, meta=self._meta(limit, posts))
+
+    async def linkedin_bundle(self, profile_url: str, limit: int = 10) -> Bundle:
+        """
+        Fetch a LinkedIn profile's posts into a Bundle.
+
+        Args:
+            profile_url: LinkedIn profile URL
+            limit: Maximum number of posts
+
+        Returns:
+            Bundle with the person, posts and fetch metadata
+
+        Raises:
+            SocialFetchError: If the fetch fails
+        """
+        posts = await self.fetch_linkedin_posts(profile_url, limit)
+        match = LINKEDIN_PROFILE_PATTERN.search(profile_url)
+        person = Person(
+            name=match.group(1) if match else "unknown",
+            platform=Platform.LINKEDIN,
+            profile_url=profile_url,
+            headline_or_bio="",
+        )
+        return Bundle(person=person, posts=posts, meta=self._meta(limit, posts))
+
+    async def run_actor(self, actor_id: str, run_input: Dict[str, Any], convert: ItemConverter) -> List[Post]:
+        """
+        Run an actor within the request timeout and convert its dataset items as they stream in.
+        Rate limits, failed runs and API errors are retried with jittered backoff while time remains.
+
+        Args:
+            actor_id: Apify actor ID ("user/actor")
+            run_input: Actor input
+            convert: Turns one raw dataset item into a Post
+
+        Returns:
+            Converted posts
+
+        Raises:
+            SocialFetchError: If the token is missing or every attempt fails
+        """
+        if not self.settings.apify_token:
+            raise SocialFetchError(ErrorType.API_ERROR, "APIFY_TOKEN is required")
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.settings.request_timeout_ms / 1000
+        base_delay = self.settings.apify_retry_base_ms / 1000
+        attempt = 0
+
+        while True:
+            attempt += 1
+            try:
+                slots = self._run_slots.setdefault(actor_id, asyncio.Semaphore(self.settings.apify_max_concurrent_runs))
+                async with slots:
+                    return await self._run_until(actor_id, run_input, convert, deadline)
+            except Exception as error:
+                classified = classify_error(error)
+                delay = random.uniform(0.5, 1.0) * min(base_delay * 2 ** (attempt - 1), base_delay * 8)
+                if (
+                    classified.error_type not in RETRYABLE_ERRORS
+                    or attempt >= self.settings.apify_max_attempts
+                    or loop.time() + delay >= deadline
+                ):
+                    raise classified from error
+                logger.warning("Actor %s attempt %s failed (%s), retrying in %.0fms", actor_id, attempt, error, delay * 1000)
+                await asyncio.sleep(delay)
+
+    async def _run_until(
+        self, actor_id: str, run_input: Dict[str, Any], convert: ItemConverter, deadline: float
+    ) -> List[Post]:
+        """One actor run, aborted if it is still going when the deadline passes"""
+        pending_runs: List[str] = []
+        try:
+            async with asyncio.timeout_at(deadline):
+                return await self._run_once(actor_id, run_input, convert, deadline, pending_runs)
+        except TimeoutError:
+            raise SocialFetchError(
+                ErrorType.DEADLINE_EXCEEDED, f"Request deadline exceeded during actor {actor_id} run"
+            ) from None
+        finally:
+            for run_id in pending_runs:
+                await self._abort_run(run_id)
+
+    async def _run_once(
+        self,
+        actor_id: str,
+        run_input: Dict[str, Any],
+        convert: ItemConverter,
+        deadline: float,
+        pending_runs: List[str],
+    ) -> List[Post]:
+        loop = asyncio.get_running_loop()
+        # Let Apify stop the run itself once the caller's budget is gone
+        timeout_secs = max(1, math.ceil(deadline - loop.time()))
+        response = await self.client.post(
+            f"/acts/{actor_id.replace('/', '~')}/runs", params={"timeout": timeout_secs}, json=run_input
+        )
+        run = self._run_data(response, f"Starting actor {actor_id}")
+        pending_runs.append(run["id"])
+
+        while run.get("status") in ("READY", "RUNNING"):
+            wait_secs = max(1, min(APIFY_MAX_WAIT_S, int(deadline - loop.time())))
+            response = await self.client.get(
+                f"/actor-runs/{run['id']}",
+                params={"waitForFinish": wait_secs},
+                timeout=APIFY_IO_TIMEOUT_S + wait_secs,
+            )
+            run = self._run_data(response, f"Waiting for actor {actor_id}")
+
+        # Finished runs need no abort
+        pending_runs.clear()
+
+        if run.get("status") != "SUCCEEDED":
+            raise Exception(f"Actor run failed with status {run.get('status')}")
+        if not run.get("defaultDatasetId"):
+            raise Exception("No dataset returned from Apify run")
+        return await self._stream_dataset_items(run["defaultDatasetId"], convert)
+
+    async def _stream_dataset_items(self, dataset_id: str, convert: ItemConverter) -> List[Post]:
+        """Download a dataset as JSON lines, converting each item as soon as its line arrives"""
+        converted: List[Post] = []
+        async with self.client.stream(
+            "GET", f"/datasets/{dataset_id}/items", params={"format": "jsonl", "clean": "true"}
+        ) as response:
+            if response.status_code == 429:
+                raise Exception(f"Rate limit hit downloading dataset {dataset_id}")
+            if response.is_error:
+                raise Exception(f"Dataset {dataset_id} download failed with status {response.status_code}")
+            async for line in response.aiter_lines():
+                if line.strip():
+                    converted.append(convert(json.loads(line)))
+        return converted
+
+    async def _abort_run(self, run_id: str) -> None:
+        try:
+            await self.client.post(f"/actor-runs/{run_id}/abort")
+        except httpx.HTTPError as error:
+            logger.warning("Failed to abort run %s: %s", run_id, error)
+
+    @staticmethod
+    def _run_data(response: httpx.Response, operation: str) -> Dict[str, Any]:
+        """The run object from an Apify API response, raising on HTTP errors"""
+        if response.status_code == 429:
+            raise Exception(f"Rate limit hit: {operation}")
+        if response.is_error:
+            try:
+                message = response.json()["error"]["message"]
+            except (ValueError, KeyError, TypeError):
+                message = response.text[:200]
+            raise Exception(f"{operation} failed with status {response.status_code}: {message}")
+        return response.json()["data"]
+
+    @staticmethod
+    def _meta(limit: int, posts: List[Post]) -> Meta:
+        return Meta(source=SOURCE, fetched_at_iso=iso_now(), limit=limit, total_found=len(posts))
+
+
+_engine: Optional[SocialEngine] = None
+
+
+def get_engine() -> SocialEngine:
+    """The process-wide engine, created on first use"""
+    global _engine
+    if _engine is None:
+        _engine = SocialEngine()
+    return _engine
+
+
+async def close_engine() -> None:
+    """Close the process-wide engine's connections (on server shutdown)"""
+    global _engine
+    if _engine is not None:
+        await _engine.aclose()
+        _engine = None
@@ -0,0 +1,109 @@
+"""
+HTTP transport for the social MCP server.
+Streamable HTTP MCP at /mcp, health checks, bearer-token auth (when SERVER_TOKEN is set) and CORS for Le Chat.
+"""
+
+import contextlib
+import hmac
+import logging
+from typing import AsyncIterator, Optional
+
+from fastmcp import FastMCP
+from starlette.applications import Starlette
+from starlette.datastructures import Headers
+from starlette.middleware import Middleware
+from starlette.middleware.cors import CORSMiddleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse
+from starlette.routing import Mount, Route
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from .config import Config, config
+from .engine import close_engine
+from .normalize import iso_now
+
+
+logger = logging.getLogger(__name__)
+
+HEALTH_PATHS = {"/health", "/healthz"}
+
+
+class BearerTokenMiddleware:
+    """Reject requests without `Authorization: Bearer <SERVER_TOKEN>` (health checks and preflights pass)"""
+
+    def __init__(self, app: ASGIApp, token: Optional[str]):
+        self.app = app
+        self.token = token
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.token or scope["path"] in HEALTH_PATHS or scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
+
+        authorization = Headers(scope=scope).get("authorization")
+        if not authorization:
+            message = "Authorization header is required"
+        else:
+            scheme, _, token = authorization.partition(" ")
+            if scheme != "Bearer" or not token:
+                message = "Invalid Authorization header format. Use: Bearer <token>"
+            elif not hmac.compare_digest(token.encode(), self.token.encode()):
+                message = "Invalid bearer token"
+            else:
+                await self.app(scope, receive, send)
+                return
+
+        logger.warning("Rejected %s %s: %s", scope["method"], scope["path"], message)
+        response = JSONResponse({"error": "Unauthorized", "message": message}, status_code=401)
+        await response(scope, receive, send)
+
+
+async def health(request: Request) -> JSONResponse:
+    return JSONResponse({"status": "ok", "timestamp": iso_now()})
+
+
+async def healthz(request: Request) -> PlainTextResponse:
+    return PlainTextResponse("OK")
+
+
+def create_http_app(mcp: FastMCP, settings: Optional[Config] = None) -> Starlette:
+    """
+    Build the ASGI app serving an MCP server over HTTP.
+
+    Args:
+        mcp: Server whose tools are exposed at /mcp
+        settings: Server settings; the environment's by default
+
+    Returns:
+        Starlette app; closing it also closes the shared engine's connections
+    """
+    settings = settings or config
+    mcp_app = mcp.http_app(path="/mcp")
+
+    @contextlib.asynccontextmanager
+    async def lifespan(app: Starlette) -> AsyncIterator[None]:
+        async with mcp_app.lifespan(app):
+            try:
+                yield
+            finally:
+                await close_engine()
+
+    return Starlette(
+        routes=[
+            Route("/health", health),
+            Route("/healthz", healthz),
+            Mount("/", app=mcp_app),
+        ],
+        middleware=[
+            Middleware(
+                CORSMiddleware,
+                allow_origins=settings.allowed_origins,
+                allow_credentials=True,
+                allow_methods=["GET", "POST", "DELETE", "OPTIONS"],
+                allow_headers=["Authorization", "Content-Type", "Accept", "Mcp-Session-Id", "Mcp-Protocol-Version"],
+                expose_headers=["Mcp-Session-Id"],
+            ),
+            Middleware(BearerTokenMiddleware, token=settings.server_token),
+        ],
+        lifespan=lifespan,
+    )
@@ -0,0 +1,298 @@
+"""
+Normalization of raw Apify items into Posts for the social MCP server.
+Follows the TypeScript adapter (src/adapters/apify.ts, src/utils/normalize.ts) field for field,
+including its JavaScript coercions, so both servers produce the same bundles.
+"""
+
+import math
+import re
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from shared.models import Platform, Post
+from shared.theme_inference import ThemeInferenceEngine
+
+
+TRACKING_URL_PATTERNS = [
+    re.compile(r"https?://t\.co/\w+", re.IGNORECASE | re.ASCII),
+    re.compile(r"https?://bit\.ly/\w+", re.IGNORECASE | re.ASCII),
+    re.compile(r"https?://tinyurl\.com/\w+", re.IGNORECASE | re.ASCII),
+]
+
+# JavaScript's \w is ASCII-only; tags and mentions may also use Latin Extended-A letters
+HASHTAG_PATTERN = re.compile(r"#[0-9A-Za-z_\u0100-\u017f]+")
+MENTION_PATTERN = re.compile(r"@[0-9A-Za-z_\u0100-\u017f]+")
+
+# JavaScript whitespace (\s and String.prototype.trim) also covers the byte order mark
+JS_WHITESPACE = r"[\s\ufeff]"
+JS_WHITESPACE_RUN = re.compile(JS_WHITESPACE + "+")
+JS_WHITESPACE_EDGES = re.compile(f"^{JS_WHITESPACE}+|{JS_WHITESPACE}+$")
+
+DATE_ONLY_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+JS_NUMBER_PATTERN = re.compile(r"^[+-]?(Infinity|(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?)$")
+TWITTER_DATE_FORMAT = "%a %b %d %H:%M:%S %z %Y"
+
+
+def js_truthy(value: Any) -> bool:
+    """Truthiness as JavaScript sees it (empty lists and dicts are truthy, NaN is not)"""
+    if isinstance(value, (list, dict)):
+        return True
+    if isinstance(value, float) and math.isnan(value):
+        return False
+    return bool(value)
+
+
+def js_or(*values: Any) -> Any:
+    """Evaluate `a || b || c` with JavaScript truthiness"""
+    for value in values[:-1]:
+        if js_truthy(value):
+            return value
+    return values[-1]
+
+
+def js_string(value: Any) -> str:
+    """String(value) for the scalar types a JSON item can hold"""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    if value is None:
+        return "null"
+    return value if isinstance(value, str) else str(value)
+
+
+def js_number(value: str) -> Optional[float]:
+    """Number(value) for a string, or None where JavaScript gives NaN"""
+    text = JS_WHITESPACE_EDGES.sub("", value)
+    if not text:
+        return 0
+    for prefix, base in (("0x", 16), ("0o", 8), ("0b", 2)):
+        if text[:2].lower() == prefix:
+            try:
+                return int(text[2:], base)
+            except ValueError:
+                return None
+    if not JS_NUMBER_PATTERN.match(text):
+        return None
+    return float(text.replace("Infinity", "inf"))
+
+
+def iso_now() -> str:
+    """Current time in Date.prototype.toISOString form"""
+    return to_iso(datetime.now(timezone.utc))
+
+
+def to_iso(moment: datetime) -> str:
+    """Format a datetime like Date.prototype.toISOString (UTC, millisecond precision)"""
+    utc = moment.astimezone(timezone.utc)
+    return utc.strftime("%Y-%m-%dT%H:%M:%S.") + f"{utc.microsecond // 1000:03d}Z"
+
+
+def parse_date(value: Any) -> Optional[datetime]:
+    """
+    Parse a timestamp the way `new Date(value)` does for the formats actors return.
+
+    Numbers are epoch milliseconds, date-only strings are UTC midnight and ISO date-times
+    without an offset are local time. X's "Wed Oct 10 20:19:24 +0000 2018" and RFC 2822
+    dates are accepted too. Returns None for anything else.
+    """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        try:
+            return datetime.fromtimestamp(value / 1000, timezone.utc)
+        except (OverflowError, OSError, ValueError):
+            return None
+    if not isinstance(value, str):
+        return None
+
+    text = value.strip()
+    if DATE_ONLY_PATTERN.match(text):
+        try:
+            return datetime.fromisoformat(text).replace(tzinfo=timezone.utc)
+        except ValueError:
+            return None
+    try:
+        parsed = datetime.fromisoformat(text)
+        return parsed if parsed.tzinfo else parsed.astimezone()
+    except ValueError:
+        pass
+    for date_format in (TWITTER_DATE_FORMAT, "%a, %d %b %Y %H:%M:%S %z"):
+        try:
+            return datetime.strptime(text, date_format)
+        except ValueError:
+            continue
+    return None
+
+
+def iso_or_now(value: Any) -> str:
+    """`new Date(value).toISOString()`, falling back to now for unparseable input"""
+    parsed = parse_date(value)
+    return to_iso(parsed) if parsed else iso_now()
+
+
+def clean_post_text(text: str) -> str:
+    """Strip tracking URLs and collapse whitespace"""
+    for pattern in TRACKING_URL_PATTERNS:
+        text = pattern.sub("", text)
+    return JS_WHITESPACE_RUN.sub(" ", JS_WHITESPACE_EDGES.sub("", text))
+
+
+def normalize_tags(tags: List[Any], prefix: str) -> List[str]:
+    """Drop empty entries, strip the first prefix character, lowercase and de-duplicate"""
+    normalized: List[str] = []
+    for tag in tags:
+        if not isinstance(tag, str) or not tag:
+            continue
+        cleaned = tag.replace(prefix, "", 1).lower()
+        if cleaned not in normalized:
+            normalized.append(cleaned)
+    return normalized
+
+
+def normalize_engagement(engagement: Dict[str, Any]) -> Dict[str, int]:
+    """
+    Keep non-negative numeric counts, and numeric strings as numbers.
+
+    Counts that are not whole numbers are dropped, since the shared model holds ints.
+    """
+    normalized: Dict[str, int] = {}
+    for key, value in engagement.items():
+        if isinstance(value, bool):
+            continue
+        if isinstance(value, (int, float)):
+            number: Optional[float] = value if value >= 0 else None
+        elif isinstance(value, str):
+            number = js_number(value)
+        else:
+            number = None
+        if number is not None and math.isfinite(number) and float(number).is_integer():
+            normalized[key] = int(number)
+    return normalized
+
+
+def extract_tags(text: str, pattern: "re.Pattern[str]", prefix: str) -> List[str]:
+    """Pull #hashtags or @mentions out of post text (without the prefix)"""
+    return [match.replace(prefix, "", 1) for match in pattern.findall(text)]
+
+
+def entity_field(entity: Any, key: str) -> Any:
+    """Field of a tweet entity, or None when the entity is not an object"""
+    return entity.get(key) if isinstance(entity, dict) else None
+
+
+def normalize_x_post(item: Dict[str, Any], handle: str) -> Post:
+    """
+    Convert an X/Twitter scraper item into a Post.
+
+    Args:
+        item: Raw dataset item from the tweet scraper
+        handle: Handle the posts were fetched for (without @)
+
+    Returns:
+        Post with raw fields mapped; run finish_post before serving it
+    """
+    post_id = js_string(js_or(item.get("id"), ""))
+    url = js_or(item.get("url"), f"https://twitter.com/{handle}/status/{post_id}")
+    text = js_or(item.get("text"), "")
+    created_at = js_or(item.get("createdAt"), "")
+    if js_truthy(created_at):
+        created_at = iso_or_now(created_at)
+
+    entities = js_or(item.get("entities"), {})
+    hashtags = [js_or(entity_field(tag, "text"), "") for tag in entities.get("hashtags") or []]
+    mentions = [js_or(entity_field(mention, "screen_name"), "") for mention in entities.get("user_mentions") or []]
+
+    engagement = {
+        "likes": js_or(item.get("likeCount"), 0),
+        "retweets": js_or(item.get("retweetCount"), 0),
+        "replies": js_or(item.get("replyCount"), 0),
+        "quotes": js_or(item.get("quoteCount"), 0),
+    }
+
+    return Post.model_construct(
+        platform=Platform.X,
+        post_id=post_id,
+        url=url,
+        created_at_iso=created_at,
+        text=text,
+        hashtags=hashtags,
+        mentions=mentions,
+        engagement=engagement,
+        inferred_themes=[],
+    )
+
+
+def normalize_linkedin_post(item: Dict[str, Any], profile_url: str) -> Post:
+    """
+    Convert a LinkedIn posts scraper item into a Post.
+
+    Args:
+        item: Raw dataset item from the LinkedIn actor
+        profile_url: Profile the posts were fetched for
+
+    Returns:
+        Post with raw fields mapped; run finish_post before serving it
+    """
+    post_id = js_string(js_or(item.get("id"), item.get("urn"), ""))
+    url = js_or(item.get("url"), item.get("permalink"), "")
+    text = js_or(item.get("text"), item.get("commentary"), "")
+    created_at = js_or(item.get("createdAt"), item.get("publishedAt"), "")
+    if js_truthy(created_at):
+        created_at = iso_or_now(created_at)
+
+    reactions = item.get("reactions")
+    engagement = {
+        "likes": js_or(item.get("likeCount"), reactions.get("total") if isinstance(reactions, dict) else None, 0),
+        "comments": js_or(item.get("commentCount"), 0),
+        "shares": js_or(item.get("shareCount"), item.get("reposts"), 0),
+    }
+
+    return Post.model_construct(
+        platform=Platform.LINKEDIN,
+        post_id=post_id,
+        url=url,
+        created_at_iso=created_at,
+        text=text,
+        hashtags=extract_tags(text, HASHTAG_PATTERN, "#"),
+        mentions=extract_tags(text, MENTION_PATTERN, "@"),
+        engagement=engagement,
+        inferred_themes=[],
+    )
+
+
+def finish_post(post: Post) -> Post:
+    """
+    Finish a post the way tools serve it: cleaned text, normalized fields, themes inferred.
+
+    Args:
+        post: Post from normalize_x_post or normalize_linkedin_post
+
+    Returns:
+        Validated Post ready for a bundle
+    """
+    finished = Post(
+        platform=post.platform,
+        post_id=post.post_id,
+        url=post.url,
+        created_at_iso=iso_or_now(post.created_at_iso),
+        text=clean_post_text(post.text),
+        hashtags=normalize_tags(post.hashtags, "#"),
+        mentions=normalize_tags(post.mentions, "@"),
+        engagement=normalize_engagement(post.engagement),
+    )
+    finished.inferred_themes = ThemeInferenceEngine.infer_themes(finished)
+    return finished
+
+
+ItemConverter = Callable[[Dict[str, Any]], Post]
+
+
+def x_converter(handle: str) -> ItemConverter:
+    """Item converter for X posts fetched for `handle`"""
+    return lambda item: finish_post(normalize_x_post(item, handle))
+
+
+def linkedin_converter(profile_url: str) -> ItemConverter:
+    """Item converter for LinkedIn posts fetched for `profile_url`"""
+    return lambda item: finish_post(normalize_linkedin_post(item, profile_url))
@@ -0,0 +1,41 @@
+"""
+Serialization of bundles and errors into the JSON the tools return.
+Matches the TypeScript tools: absent optional fields are omitted and output is indented by two spaces.
+"""
+
+import json
+from typing import Any, Dict
+
+from shared.models import Bundle
+
+from .normalize import iso_now
+
+
+def bundle_to_dict(bundle: Bundle) -> Dict[str, Any]:
+    """
+    Plain JSON form of a bundle.
+
+    Args:
+        bundle: Bundle to convert
+
+    Returns:
+        Dict with None-valued fields (e.g. a LinkedIn person's handle) left out
+    """
+    return bundle.model_dump(mode="json", exclude_none=True)
+
+
+def bundle_to_json(bundle: Bundle, compact: bool = False, **extra: Any) -> str:
+    """Bundle as the JSON text a tool call returns, with any extra top-level fields"""
+    body = {**bundle_to_dict(bundle), **extra}
+    if compact:
+        return json.dumps(body, ensure_ascii=False, separators=(",", ":"))
+    return json.dumps(body, ensure_ascii=False, indent=2)
+
+
+def error_to_json(error_type: str, message: str, **extra: Any) -> str:
+    """Error response in the tools' shape: error type, message, timestamp and any extra fields"""
+    return json.dumps(
+        {"error": error_type, "message": message, "timestamp": iso_now(), **extra},
+        ensure_ascii=False,
+        indent=2,
+    )
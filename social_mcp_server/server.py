@@ -0,0 +1,30 @@
+"""
+Social MCP server for ColdOpen Coach.
+Combined X/Twitter and LinkedIn tools over one shared fetch engine.
+"""
+
+from fastmcp import FastMCP
+
+from .config import config
+from .http_server import create_http_app
+from .tools.linkedin_tools import register_linkedin_tools
+from .tools.x_tools import register_x_tools
+
+
+def create_mcp_server() -> FastMCP:
+    """
+    Create an MCP server with every social tool registered.
+
+    Returns:
+        FastMCP server exposing get_x_posts and get_linkedin_posts
+    """
+    mcp = FastMCP(config.server_name)
+    register_x_tools(mcp)
+    register_linkedin_tools(mcp)
+    return mcp
+
+
+mcp = create_mcp_server()
+
+# ASGI app for HTTP deployments (uvicorn, Lambda adapters)
+app = create_http_app(mcp)
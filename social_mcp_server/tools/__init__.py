@@ -0,0 +1,8 @@
+"""
+MCP tool registrations for the social MCP server.
+"""
+
+from .linkedin_tools import register_linkedin_tools
+from .x_tools import register_x_tools
+
+__all__ = ["register_linkedin_tools", "register_x_tools"]
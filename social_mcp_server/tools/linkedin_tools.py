@@ -0,0 +1,59 @@
+"""
+LinkedIn tools for the social MCP server.
+"""
+
+import logging
+from typing import Annotated
+
+from fastmcp import FastMCP
+from pydantic import Field
+
+from ..engine import ErrorType, classify_error, get_engine
+from ..serialize import bundle_to_json, error_to_json
+
+
+logger = logging.getLogger(__name__)
+
+LINKEDIN_COMPLIANCE_WARNING = (
+    "LinkedIn scraping may violate ToS. Ensure you have explicit consent "
+    "and provide your own authentication cookies if required."
+)
+
+
+def register_linkedin_tools(mcp: FastMCP) -> None:
+    """
+    Register the LinkedIn tools on a server.
+
+    Args:
+        mcp: FastMCP server to add get_linkedin_posts to
+    """
+
+    @mcp.tool
+    async def get_linkedin_posts(
+        profile_url: Annotated[str, Field(description="LinkedIn profile URL")],
+        limit: Annotated[int, Field(description="Maximum number of posts to fetch", ge=1, le=50)] = 10,
+    ) -> str:
+        """Fetch recent posts from LinkedIn using Apify scraper. Returns a JSON bundle of person, posts and meta."""
+        logger.warning(LINKEDIN_COMPLIANCE_WARNING)
+        try:
+            bundle = await get_engine().linkedin_bundle(profile_url, limit)
+        except Exception as error:
+            logger.error("Error in get_linkedin_posts: %s", error)
+            classified = classify_error(error)
+            message = str(classified)
+            lowered = message.lower()
+
+            error_type = ErrorType.API_ERROR.value
+            if "cookie" in lowered or "authentication" in lowered:
+                error_type = "COOKIE_EXPIRED"
+                message = "LinkedIn authentication failed. Please provide valid li_at cookie."
+            elif classified.error_type in (ErrorType.PRIVATE_PROFILE, ErrorType.NOT_FOUND):
+                error_type = classified.error_type.value
+
+            remediation = (
+                "Set LINKEDIN_COOKIE environment variable with valid li_at cookie"
+                if error_type == "COOKIE_EXPIRED"
+                else "Check profile URL and try again"
+            )
+            return error_to_json(error_type, message, remediation=remediation)
+        return bundle_to_json(bundle, warnings=[LINKEDIN_COMPLIANCE_WARNING])
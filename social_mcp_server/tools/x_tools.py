@@ -0,0 +1,38 @@
+"""
+X/Twitter tools for the social MCP server.
+"""
+
+import logging
+from typing import Annotated
+
+from fastmcp import FastMCP
+from pydantic import Field
+
+from ..engine import classify_error, get_engine
+from ..serialize import bundle_to_json, error_to_json
+
+
+logger = logging.getLogger(__name__)
+
+
+def register_x_tools(mcp: FastMCP) -> None:
+    """
+    Register the X/Twitter tools on a server.
+
+    Args:
+        mcp: FastMCP server to add get_x_posts to
+    """
+
+    @mcp.tool
+    async def get_x_posts(
+        handle: Annotated[str, Field(description="Twitter handle (without @)")],
+        limit: Annotated[int, Field(description="Maximum number of posts to fetch", ge=1, le=100)] = 20,
+    ) -> str:
+        """Fetch recent posts from X/Twitter using Apify scraper. Returns a JSON bundle of person, posts and meta."""
+        try:
+            bundle = await get_engine().x_bundle(handle, limit)
+        except Exception as error:
+            logger.error("Error in get_x_posts: %s", error)
+            classified = classify_error(error)
+            return error_to_json(classified.error_type.value, str(classified))
+        return bundle_to_json(bundle)
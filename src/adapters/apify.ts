@@ -2,13 +2,134 @@
  * Apify client adapter for Node.js
  */
 
-import { ApifyClient } from 'apify-client';
+import { ActorStartOptions, ApifyClient, WebhookUpdateData } from 'apify-client';
+import { createInterface } from 'readline';
+import { Readable } from 'stream';
+import { ReadableStream } from 'stream/web';
 import pino from 'pino';
 import { appConfig } from '../config.js';
 import { Post, Platform, ErrorType } from '../models/index.js';
+import { Deadline, retryWithBackoff, sleep } from '../utils/deadline.js';
+import { AdaptiveLimiter, CircuitBreaker, CircuitState, Lane, LaneSnapshot } from '../utils/circuit-breaker.js';
+import { NormalizationUtils } from '../utils/normalize.js';
+import { ThemeInferenceEngine } from '../utils/theme-inference.js';
+import { waitForRunFinished } from './run-events.js';
+import { getTrafficRecorder, redact } from '../capture/index.js';
 
 const logger = pino({ name: 'apify-adapter' });
 
+// Errors worth another attempt; everything else fails immediately
+const RETRYABLE_ERRORS = new Set<string>([
+  ErrorType.RATE_LIMITED,
+  ErrorType.APIFY_RUN_ERROR,
+  ErrorType.API_ERROR
+]);
+
+// Errors that mean the actor (or Apify) is unhealthy: they trip the breaker and shrink concurrency
+const TRIPPING_ERRORS = new Set<string>([
+  ErrorType.RATE_LIMITED,
+  ErrorType.APIFY_RUN_ERROR
+]);
+
+export interface FetchOptions {
+  deadline?: Deadline;
+  // Skip cached bundles and fetch fresh data (the result is still cached)
+  refresh?: boolean;
+  // Background work (prefetch, batches) queues behind interactive calls; default interactive
+  lane?: Lane;
+  // Scrape a small first page and expand only when its themes are unclear (default PROGRESSIVE_FETCH)
+  progressive?: boolean;
+}
+
+let sharedClient: ApifyClient | undefined;
+
+/**
+ * One client for every adapter instance, so all tools share its keep-alive connection pool
+ */
+function getApifyClient(token: string): ApifyClient {
+  sharedClient ??= new ApifyClient({ token, ...(appConfig.apifyBaseUrl ? { baseUrl: appConfig.apifyBaseUrl } : {}) });
+  return sharedClient;
+}
+
+interface ActorGuard {
+  breaker: CircuitBreaker;
+  limiter: AdaptiveLimiter;
+}
+
+export interface ActorHealth {
+  state: CircuitState;
+  retry_after_ms: number;
+  limit: number;
+  in_flight: number;
+  queued: number;
+  latency_ms?: number;
+  lanes: Record<Lane, LaneSnapshot>;
+}
+
+// One breaker and concurrency limit per actor, shared by every adapter instance
+const actorGuards = new Map<string, ActorGuard>();
+
+function actorGuard(actorId: string): ActorGuard {
+  let guard = actorGuards.get(actorId);
+  if (!guard) {
+    guard = {
+      breaker: new CircuitBreaker(`Actor ${actorId}`, {
+        failureThreshold: appConfig.apifyBreakerThreshold,
+        cooldownMs: appConfig.apifyBreakerCooldownMs
+      }),
+      limiter: new AdaptiveLimiter({
+        initialLimit: Math.min(4, appConfig.apifyMaxConcurrentRuns),
+        minLimit: 1,
+        maxLimit: appConfig.apifyMaxConcurrentRuns,
+        latencyTolerance: 2,
+        backgroundMinShare: appConfig.apifyBackgroundMinShare
+      })
+    };
+    actorGuards.set(actorId, guard);
+  }
+  return guard;
+}
+
+/**
+ * Breaker state and concurrency limit of every actor used so far
+ */
+export function actorHealth(): Record<string, ActorHealth> {
+  return Object.fromEntries(Array.from(actorGuards, ([actorId, { breaker, limiter }]) => [actorId, {
+    state: breaker.getState(),
+    retry_after_ms: breaker.retryAfterMs(),
+    ...limiter.snapshot()
+  }]));
+}
+
+// Converts one raw dataset item as it is streamed in
+type ItemConverter<T> = (item: Record<string, unknown>) => T;
+
+interface HedgedAttempt<T> {
+  runId?: string;
+  cancelled?: boolean;
+  result: Promise<T[]>;
+}
+
+/**
+ * Ad-hoc webhook asking Apify to call us back when a run ends (in any final state)
+ */
+function runFinishedWebhook(): WebhookUpdateData {
+  return {
+    eventTypes: ['ACTOR.RUN.SUCCEEDED', 'ACTOR.RUN.FAILED', 'ACTOR.RUN.TIMED_OUT', 'ACTOR.RUN.ABORTED'],
+    requestUrl: `${(appConfig.apifyWebhookUrl ?? '').replace(/\/+$/, '')}/webhooks/apify`,
+    headersTemplate: JSON.stringify({ 'X-Apify-Webhook-Secret': appConfig.apifyWebhookSecret })
+  };
+}
+
+/**
+ * Finish a post the way tools serve it: normalized text and fields, themes inferred
+ */
+function finishPost(post: Post): Post {
+  const normalized = NormalizationUtils.normalizePost(post);
+  normalized.inferred_themes = ThemeInferenceEngine.inferThemes(normalized);
+  return normalized;
+}
+
 export class ApifyAdapter {
   private client: ApifyClient;
 
@@ -16,13 +137,13 @@ export class ApifyAdapter {
     if (!appConfig.apifyToken) {
       throw new Error("APIFY_TOKEN is required");
     }
-    this.client = new ApifyClient({ token: appConfig.apifyToken });
+    this.client = getApifyClient(appConfig.apifyToken);
   }
 
   /**
    * Fetch X/Twitter posts using Apify Tweet Scraper
    */
-  async fetchXPosts(handle: string, limit: number = 20): Promise<Post[]> {
+  async fetchXPosts(handle: string, limit: number = 20, options: FetchOptions = {}): Promise<Post[]> {
     const cleanHandle = handle.replace('@', '');
 
     try {
@@ -35,21 +156,18 @@ export class ApifyAdapter {
         includeRetweets: false
       };
 
-      const run = await this.client.actor(appConfig.apifyTwitterActor).call(input);
-
-      if (!run.defaultDatasetId) {
-        throw new Error("No dataset returned from Apify run");
-      }
-
-      const dataset = this.client.dataset(run.defaultDatasetId);
-      const { items } = await dataset.listItems();
+      const posts = await this.runActor(
+        appConfig.apifyTwitterActor,
+        input,
+        options.deadline ?? Deadline.none(),
+        options.lane ?? 'interactive',
+        item => finishPost(this.normalizeXPost(item, cleanHandle))
+      );
 
-      if (!items || items.length === 0) {
+      if (posts.length === 0) {
         throw new Error(`No posts found for @${cleanHandle}`);
       }
 
-      const posts = items.map(item => this.normalizeXPost(item as any, cleanHandle));
-
       logger.info(`Successfully fetched ${posts.length} X posts for @${cleanHandle}`);
       return posts;
 
@@ -62,7 +180,7 @@ export class ApifyAdapter {
   /**
    * Fetch LinkedIn posts using Apify LinkedIn actor
    */
-  async fetchLinkedInPosts(profileUrl: string, limit: number = 10): Promise<Post[]> {
+  async fetchLinkedInPosts(profileUrl: string, limit: number = 10, options: FetchOptions = {}): Promise<Post[]> {
     try {
       logger.info(`Fetching ${limit} LinkedIn posts for ${profileUrl}`);
 
@@ -71,21 +189,18 @@ export class ApifyAdapter {
         postsCount: limit
       };
 
-      const run = await this.client.actor(appConfig.apifyLinkedInPostsActor).call(input);
+      const posts = await this.runActor(
+        appConfig.apifyLinkedInPostsActor,
+        input,
+        options.deadline ?? Deadline.none(),
+        options.lane ?? 'interactive',
+        item => finishPost(this.normalizeLinkedInPost(item, profileUrl))
+      );
 
-      if (!run.defaultDatasetId) {
-        throw new Error("No dataset returned from Apify run");
-      }
-
-      const dataset = this.client.dataset(run.defaultDatasetId);
-      const { items } = await dataset.listItems();
-
-      if (!items || items.length === 0) {
+      if (posts.length === 0) {
         throw new Error(`No posts found for LinkedIn profile: ${profileUrl}`);
       }
 
-      const posts = items.map(item => this.normalizeLinkedInPost(item as any, profileUrl));
-
       logger.info(`Successfully fetched ${posts.length} LinkedIn posts`);
       return posts;
 
@@ -95,6 +210,259 @@ export class ApifyAdapter {
     }
   }
 
+  /**
+   * Run an actor within the deadline and return its dataset items, each converted as it streams in.
+   * Failed attempts are retried with jittered backoff while time remains.
+   */
+  private async runActor<T>(
+    actorId: string,
+    input: Record<string, unknown>,
+    deadline: Deadline,
+    lane: Lane,
+    convert: ItemConverter<T>
+  ): Promise<T[]> {
+    return retryWithBackoff(() => this.runActorGuarded(actorId, input, deadline, lane, convert), {
+      deadline,
+      maxAttempts: appConfig.apifyMaxAttempts,
+      baseDelayMs: appConfig.apifyRetryBaseMs,
+      maxDelayMs: appConfig.apifyRetryBaseMs * 8,
+      minAttemptMs: appConfig.apifyMinRunMs,
+      isRetryable: error => RETRYABLE_ERRORS.has(this.classifyError(error).name),
+      onRetry: (error, attempt, delayMs) => {
+        logger.warn(`Actor ${actorId} attempt ${attempt} failed (${error.message}), retrying in ${delayMs}ms`);
+      }
+    });
+  }
+
+  /**
+   * Run through the actor's circuit breaker and adaptive concurrency limit (in the caller's lane).
+   * Fails fast with CIRCUIT_OPEN while the actor is known to be failing.
+   */
+  private async runActorGuarded<T>(
+    actorId: string,
+    input: Record<string, unknown>,
+    deadline: Deadline,
+    lane: Lane,
+    convert: ItemConverter<T>
+  ): Promise<T[]> {
+    const { breaker, limiter } = actorGuard(actorId);
+    breaker.enter();
+
+    let release: () => void;
+    try {
+      release = await limiter.acquire(deadline, lane);
+    } catch (error) {
+      breaker.recordNeutral();
+      throw error;
+    }
+
+    const startedAt = Date.now();
+    try {
+      const items = await this.runActorHedged(actorId, input, deadline, lane === 'interactive' ? limiter : undefined, convert);
+      breaker.recordSuccess();
+      limiter.record(Date.now() - startedAt, false);
+      return items;
+    } catch (error) {
+      if (TRIPPING_ERRORS.has(this.classifyError(error as Error).name)) {
+        breaker.recordFailure();
+        limiter.record(Date.now() - startedAt, true);
+        if (breaker.getState() === 'open') {
+          logger.warn(`Circuit for actor ${actorId} is open for ${appConfig.apifyBreakerCooldownMs}ms`);
+        }
+      } else {
+        breaker.recordNeutral();
+      }
+      throw error;
+    } finally {
+      release();
+    }
+  }
+
+  /**
+   * Start one run and, if it is still going after the hedge delay, a duplicate.
+   * The first run to succeed wins and the other is aborted.
+   * A hedge is only started when the actor's concurrency limit has room for it;
+   * background runs (no limiter passed) are never hedged, since their tail latency matters little.
+   */
+  private async runActorHedged<T>(
+    actorId: string,
+    input: Record<string, unknown>,
+    deadline: Deadline,
+    limiter: AdaptiveLimiter | undefined,
+    convert: ItemConverter<T>
+  ): Promise<T[]> {
+    deadline.throwIfExpired(`actor ${actorId} start`);
+
+    const attempts: HedgedAttempt<T>[] = [this.startAttempt(actorId, input, deadline, convert)];
+    const primary = attempts[0] as HedgedAttempt<T>;
+    const hedgeAfterMs = appConfig.apifyHedgeAfterMs;
+    let releaseHedge: (() => void) | undefined;
+
+    if (hedgeAfterMs > 0 && limiter) {
+      // The hedge wait gets its own signal so its timer and listener go as soon as the primary settles
+      const hedgeWait = new AbortController();
+      const cancelHedgeWait = (): void => hedgeWait.abort();
+      deadline.signal.addEventListener('abort', cancelHedgeWait, { once: true });
+      if (deadline.signal.aborted) {
+        hedgeWait.abort();
+      }
+
+      const hedgeTimer = sleep(hedgeAfterMs, hedgeWait.signal).then(() => 'hedge' as const);
+      const first = await Promise.race([primary.result.then(() => 'done' as const, () => 'done' as const), hedgeTimer]);
+      deadline.signal.removeEventListener('abort', cancelHedgeWait);
+      hedgeWait.abort();
+
+      if (first === 'hedge' && deadline.remainingMs() >= appConfig.apifyMinRunMs) {
+        releaseHedge = limiter.tryAcquire();
+        if (releaseHedge) {
+          logger.info(`Actor ${actorId} still running after ${hedgeAfterMs}ms, starting hedged run`);
+          attempts.push(this.startAttempt(actorId, input, deadline, convert));
+        } else {
+          logger.info(`Actor ${actorId} still running after ${hedgeAfterMs}ms, at its concurrency limit so not hedging`);
+        }
+      }
+    }
+
+    try {
+      return await Promise.any(attempts.map(attempt => attempt.result));
+    } catch (error) {
+      const errors = error instanceof AggregateError ? error.errors : [error];
+      throw errors[0] instanceof Error ? errors[0] : new Error(String(errors[0]));
+    } finally {
+      // Abort whichever runs are still going; their results are no longer needed
+      for (const attempt of attempts) {
+        attempt.cancelled = true;
+        attempt.result.catch(() => undefined);
+        if (attempt.runId) {
+          this.abortRun(attempt.runId);
+        }
+      }
+      releaseHedge?.();
+    }
+  }
+
+  /**
+   * Start a single actor run and wait for its dataset within the deadline
+   */
+  private startAttempt<T>(
+    actorId: string,
+    input: Record<string, unknown>,
+    deadline: Deadline,
+    convert: ItemConverter<T>
+  ): HedgedAttempt<T> {
+    const attempt: HedgedAttempt<T> = { result: Promise.resolve([]) };
+    const recorder = getTrafficRecorder();
+    const startedAt = Date.now();
+
+    attempt.result = (async () => {
+      // Let Apify stop the run itself once the caller's budget is gone
+      const timeoutSecs = Number.isFinite(deadline.remainingMs())
+        ? Math.max(1, Math.ceil(deadline.remainingMs() / 1000))
+        : undefined;
+
+      const startOptions: ActorStartOptions = {
+        ...(timeoutSecs ? { timeout: timeoutSecs } : {}),
+        ...(appConfig.apifyWebhookUrl ? { webhooks: [runFinishedWebhook()] } : {})
+      };
+      const started = await this.client.actor(actorId).start(input, startOptions);
+      attempt.runId = started.id;
+
+      if (attempt.cancelled) {
+        this.abortRun(started.id);
+        throw new Error(`Hedged run ${started.id} no longer needed`);
+      }
+
+      let run = started;
+      while (run.status === 'READY' || run.status === 'RUNNING') {
+        deadline.throwIfExpired(`actor ${actorId} run`);
+        if (appConfig.apifyWebhookUrl) {
+          // Park until the run's webhook arrives (or it is time to poll) instead of holding a long-poll open
+          await waitForRunFinished(started.id, Math.min(appConfig.apifyWebhookPollMs, deadline.remainingMs()), deadline.signal);
+          run = (await this.client.run(started.id).get()) ?? run;
+        } else {
+          const waitSecs = Math.max(1, Math.min(60, Math.floor(deadline.remainingMs() / 1000)));
+          run = await this.client.run(started.id).waitForFinish({ waitSecs });
+        }
+      }
+
+      // Finished runs need no abort
+      attempt.runId = undefined;
+
+      if (run.status !== 'SUCCEEDED') {
+        throw new Error(`Actor run failed with status ${run.status}`);
+      }
+
+      if (!run.defaultDatasetId) {
+        throw new Error("No dataset returned from Apify run");
+      }
+
+      deadline.throwIfExpired(`actor ${actorId} dataset download`);
+      if (!recorder) {
+        return this.streamDatasetItems(run.defaultDatasetId, convert, deadline);
+      }
+
+      // Capturing keeps the (redacted) raw items for the replay stand-in
+      const rawItems: unknown[] = [];
+      const results = await this.streamDatasetItems(run.defaultDatasetId, item => {
+        rawItems.push(redact(item));
+        return convert(item);
+      }, deadline);
+      recorder.record({
+        type: 'apify_run',
+        at_ms: startedAt,
+        actor_id: actorId,
+        input: redact(input),
+        run_ms: Date.now() - startedAt,
+        items: rawItems
+      });
+      return results;
+    })();
+
+    return attempt;
+  }
+
+  /**
+   * Download a dataset as JSON lines, converting each item as soon as its line arrives,
+   * so raw items are dropped one by one instead of being held as a whole list
+   */
+  private async streamDatasetItems<T>(datasetId: string, convert: ItemConverter<T>, deadline: Deadline): Promise<T[]> {
+    const converted: T[] = [];
+
+    try {
+      const response = await fetch(`${this.client.baseUrl}/datasets/${datasetId}/items?format=jsonl&clean=true`, {
+        headers: { Authorization: `Bearer ${appConfig.apifyToken}` },
+        signal: deadline.signal
+      });
+      if (response.status === 429) {
+        throw new Error(`Rate limit hit downloading dataset ${datasetId}`);
+      }
+      if (!response.ok || !response.body) {
+        throw new Error(`Dataset ${datasetId} download failed with status ${response.status}`);
+      }
+
+      const lines = createInterface({ input: Readable.fromWeb(response.body as ReadableStream<Uint8Array>), crlfDelay: Infinity });
+      for await (const line of lines) {
+        if (line.trim()) {
+          converted.push(convert(JSON.parse(line)));
+        }
+      }
+    } catch (error) {
+      // An aborted download means the deadline passed (or the caller went away)
+      if (deadline.isExpired()) {
+        throw Deadline.exceededError(`dataset ${datasetId} download`);
+      }
+      throw error;
+    }
+
+    return converted;
+  }
+
+  private abortRun(runId: string): void {
+    this.client.run(runId).abort().catch(error => {
+      logger.warn(`Failed to abort run ${runId}:`, error);
+    });
+  }
+
   /**
    * Convert Apify X/Twitter response to normalized Post
    */
@@ -212,6 +580,11 @@ export class ApifyAdapter {
    * Classify and wrap errors with appropriate error types
    */
   private classifyError(error: Error): Error {
+    // Already classified (e.g. rethrown after a retry)
+    if ((Object.values(ErrorType) as string[]).includes(error.name)) {
+      return error;
+    }
+
     const message = error.message.toLowerCase();
     let errorType: ErrorType;
 
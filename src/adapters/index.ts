@@ -1 +1,2 @@
-export * from './apify.js';
\ No newline at end of file
+export * from './apify.js';
+export * from './run-events.js';
\ No newline at end of file
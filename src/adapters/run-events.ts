@@ -0,0 +1,103 @@
+/**
+ * "Run finished" notifications from Apify webhooks
+ *
+ * A pending scrape parks on a promise here instead of holding a long-poll open to Apify.
+ * The webhook only wakes the waiter; the adapter then reads the run itself, so a
+ * notification never has to be trusted for the run's status or dataset.
+ */
+
+import pino from 'pino';
+
+const logger = pino({ name: 'run-events' });
+
+// Webhooks can beat the waiter when a run finishes before start() returns
+const EARLY_FINISH_TTL_MS = 5 * 60 * 1000;
+
+export type RunWakeReason = 'finished' | 'timeout' | 'aborted';
+
+const waiters = new Map<string, Set<() => void>>();
+const earlyFinishes = new Map<string, number>();
+
+let relay: ((runId: string) => void) | undefined;
+
+/**
+ * Wait until the run's webhook arrives, timeoutMs passes (time to poll instead) or the signal aborts
+ */
+export function waitForRunFinished(runId: string, timeoutMs: number, signal?: AbortSignal): Promise<RunWakeReason> {
+  if (earlyFinishes.delete(runId)) {
+    return Promise.resolve('finished');
+  }
+  if (signal?.aborted) {
+    return Promise.resolve('aborted');
+  }
+
+  return new Promise(resolve => {
+    const finish = (reason: RunWakeReason): void => {
+      clearTimeout(timer);
+      signal?.removeEventListener('abort', onAbort);
+      const runWaiters = waiters.get(runId);
+      runWaiters?.delete(onFinished);
+      if (runWaiters?.size === 0) {
+        waiters.delete(runId);
+      }
+      resolve(reason);
+    };
+    const onFinished = (): void => finish('finished');
+    const onAbort = (): void => finish('aborted');
+    const timer = setTimeout(() => finish('timeout'), timeoutMs);
+
+    signal?.addEventListener('abort', onAbort, { once: true });
+    const runWaiters = waiters.get(runId) ?? new Set();
+    runWaiters.add(onFinished);
+    waiters.set(runId, runWaiters);
+  });
+}
+
+/**
+ * Announce a finished run (from a webhook) locally and to the relay, if any
+ */
+export function publishRunFinished(runId: string): void {
+  deliverRunFinished(runId);
+  try {
+    relay?.(runId);
+  } catch (error) {
+    logger.warn(`Run relay failed for ${runId}:`, error);
+  }
+}
+
+/**
+ * Wake local waiters for a run; returns whether any were waiting.
+ * Unclaimed notices are kept briefly in case the waiter has not registered yet.
+ */
+export function deliverRunFinished(runId: string): boolean {
+  const runWaiters = waiters.get(runId);
+  if (!runWaiters || runWaiters.size === 0) {
+    const now = Date.now();
+    for (const [pendingRunId, receivedAt] of earlyFinishes) {
+      if (now - receivedAt > EARLY_FINISH_TTL_MS) {
+        earlyFinishes.delete(pendingRunId);
+      }
+    }
+    earlyFinishes.set(runId, now);
+    return false;
+  }
+
+  for (const wake of Array.from(runWaiters)) {
+    wake();
+  }
+  return true;
+}
+
+/**
+ * Forward finished-run notices elsewhere, e.g. to the sibling worker that started the run
+ */
+export function setRunFinishedRelay(listener: ((runId: string) => void) | undefined): void {
+  relay = listener;
+}
+
+/**
+ * Number of runs currently parked waiting for a webhook
+ */
+export function pendingRunCount(): number {
+  return waiters.size;
+}
@@ -0,0 +1,2 @@
+export * from './recorder.js';
+export * from './upstream-stub.js';
\ No newline at end of file
@@ -0,0 +1,126 @@
+/**
+ * Optional capture of live traffic for capacity planning (enabled by CAPTURE_PATH)
+ *
+ * Appends JSON lines: one per tool call (arrival time, arguments, duration) and one per
+ * Apify run (actor, input, run time, raw dataset items). Sensitive fields are redacted
+ * before anything is written. The replay and upstream-stub commands read these files.
+ */
+
+import { createWriteStream, promises as fs, WriteStream } from 'fs';
+import pino from 'pino';
+import { appConfig } from '../config.js';
+
+const logger = pino({ name: 'traffic-capture' });
+
+export const CAPTURE_VERSION = 1;
+
+// Keys whose values never leave the process
+const SENSITIVE_KEY = /token|secret|password|cookie|authorization|api[-_]?key|li_at|session|email|phone/i;
+const REDACTED = '[REDACTED]';
+
+export interface SessionRecord {
+  type: 'session';
+  version: number;
+  started_at_iso: string;
+  worker?: string;
+}
+
+export interface ToolCallRecord {
+  type: 'tool_call';
+  // Arrival time (epoch ms); replays keep the gaps between arrivals
+  at_ms: number;
+  name: string;
+  arguments: unknown;
+  duration_ms: number;
+  ok: boolean;
+}
+
+export interface ApifyRunRecord {
+  type: 'apify_run';
+  at_ms: number;
+  actor_id: string;
+  input: unknown;
+  run_ms: number;
+  items: unknown[];
+}
+
+export type CaptureRecord = SessionRecord | ToolCallRecord | ApifyRunRecord;
+
+/**
+ * Deep copy of a value with sensitive keys replaced
+ */
+export function redact(value: unknown): unknown {
+  if (Array.isArray(value)) {
+    return value.map(redact);
+  }
+  if (typeof value === 'object' && value !== null) {
+    return Object.fromEntries(Object.entries(value).map(([key, inner]) => [key, SENSITIVE_KEY.test(key) ? REDACTED : redact(inner)]));
+  }
+  return value;
+}
+
+export class TrafficRecorder {
+  private stream: WriteStream;
+
+  constructor(readonly filePath: string) {
+    this.stream = createWriteStream(filePath, { flags: 'a' });
+    this.stream.on('error', error => logger.warn(`Traffic capture to ${filePath} failed:`, error));
+    this.record({
+      type: 'session',
+      version: CAPTURE_VERSION,
+      started_at_iso: new Date().toISOString(),
+      ...(process.env.WORKER_INDEX ? { worker: process.env.WORKER_INDEX } : {})
+    });
+  }
+
+  record(record: CaptureRecord): void {
+    this.stream.write(`${JSON.stringify(record)}\n`);
+  }
+
+  close(): Promise<void> {
+    return new Promise(resolve => this.stream.end(resolve));
+  }
+}
+
+let recorder: TrafficRecorder | null | undefined;
+
+/**
+ * The process-wide recorder, or undefined when CAPTURE_PATH is unset.
+ * Cluster workers each write their own file (<path>.<worker>) so lines never interleave.
+ */
+export function getTrafficRecorder(): TrafficRecorder | undefined {
+  if (recorder === undefined) {
+    const workerIndex = process.env.WORKER_INDEX;
+    recorder = appConfig.capturePath
+      ? new TrafficRecorder(workerIndex ? `${appConfig.capturePath}.${workerIndex}` : appConfig.capturePath)
+      : null;
+    if (recorder) {
+      logger.info(`Capturing traffic to ${recorder.filePath}`);
+    }
+  }
+  return recorder ?? undefined;
+}
+
+/**
+ * Read capture files, merged in arrival order (session lines are dropped)
+ */
+export async function readCaptures(filePaths: string[]): Promise<Array<ToolCallRecord | ApifyRunRecord>> {
+  const records: Array<ToolCallRecord | ApifyRunRecord> = [];
+  for (const filePath of filePaths) {
+    const lines = (await fs.readFile(filePath, 'utf8')).split('\n');
+    lines.forEach((line, index) => {
+      if (!line.trim()) {
+        return;
+      }
+      try {
+        const record = JSON.parse(line) as CaptureRecord;
+        if (record.type === 'tool_call' || record.type === 'apify_run') {
+          records.push(record);
+        }
+      } catch {
+        logger.warn(`Skipping unreadable line ${index + 1} of ${filePath}`);
+      }
+    });
+  }
+  return records.sort((a, b) => a.at_ms - b.at_ms);
+}
@@ -0,0 +1,177 @@
+/**
+ * Local stand-in for the Apify API, serving captured runs
+ *
+ * Implements the calls the adapter makes (start run, get/wait run, abort, dataset items)
+ * and answers each run with the dataset captured for the same actor and input, after the
+ * captured run time divided by the replay speed. Point the server at it with APIFY_BASE_URL.
+ */
+
+import express from 'express';
+import { Server } from 'http';
+import pino from 'pino';
+import { ApifyRunRecord } from './recorder.js';
+
+const logger = pino({ name: 'upstream-stub' });
+
+// Finished runs (and their datasets) are forgotten after this long
+const RUN_RETENTION_MS = 10 * 60 * 1000;
+
+export interface UpstreamStubOptions {
+  port: number;
+  speed: number;
+}
+
+interface StubRun {
+  id: string;
+  actId: string;
+  status: 'RUNNING' | 'SUCCEEDED' | 'ABORTED';
+  defaultDatasetId: string;
+  startedAt: string;
+  finishedAt?: string;
+  items: unknown[];
+  finished: Promise<void>;
+}
+
+/**
+ * Input serialized with sorted keys, so captured and replayed inputs compare equal
+ */
+function stableKey(actorId: string, input: unknown): string {
+  const sortKeys = (value: unknown): unknown => {
+    if (Array.isArray(value)) {
+      return value.map(sortKeys);
+    }
+    if (typeof value === 'object' && value !== null) {
+      return Object.fromEntries(Object.keys(value).sort().map(key => [key, sortKeys((value as Record<string, unknown>)[key])]));
+    }
+    return value;
+  };
+  return `${actorId}\u0000${JSON.stringify(sortKeys(input))}`;
+}
+
+function runView(run: StubRun): Omit<StubRun, 'items' | 'finished'> {
+  const { items: _items, finished: _finished, ...view } = run;
+  return view;
+}
+
+/**
+ * Tell the server about a finished run through the webhooks it registered (webhook mode)
+ */
+function fireWebhooks(encoded: unknown, run: StubRun): void {
+  if (typeof encoded !== 'string') {
+    return;
+  }
+  const webhooks = JSON.parse(Buffer.from(encoded, 'base64').toString('utf8')) as Array<{ requestUrl: string; headersTemplate?: string }>;
+  for (const webhook of webhooks) {
+    fetch(webhook.requestUrl, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json', ...(webhook.headersTemplate ? JSON.parse(webhook.headersTemplate) : {}) },
+      body: JSON.stringify({
+        eventType: `ACTOR.RUN.${run.status}`,
+        eventData: { actorId: run.actId, actorRunId: run.id },
+        resource: runView(run)
+      })
+    }).catch(error => logger.warn(`Webhook to ${webhook.requestUrl} failed:`, error));
+  }
+}
+
+export function startUpstreamStub(captured: ApifyRunRecord[], options: UpstreamStubOptions): Promise<Server> {
+  // Captured runs per actor+input (and per actor, for inputs never seen), replayed round-robin
+  const byInput = new Map<string, ApifyRunRecord[]>();
+  const byActor = new Map<string, ApifyRunRecord[]>();
+  for (const record of captured) {
+    const inputKey = stableKey(record.actor_id, record.input);
+    byInput.set(inputKey, [...(byInput.get(inputKey) ?? []), record]);
+    byActor.set(record.actor_id, [...(byActor.get(record.actor_id) ?? []), record]);
+  }
+  const served = new Map<string, number>();
+  const pick = (pool: ApifyRunRecord[] | undefined, key: string): ApifyRunRecord | undefined => {
+    if (!pool || pool.length === 0) {
+      return undefined;
+    }
+    const count = served.get(key) ?? 0;
+    served.set(key, count + 1);
+    return pool[count % pool.length];
+  };
+
+  const runs = new Map<string, StubRun>();
+  let nextRun = 1;
+
+  const app = express();
+  app.use(express.json({ limit: '5mb' }));
+
+  app.post('/v2/acts/:actorId/runs', (req, res) => {
+    const actorId = String(req.params.actorId).replace('~', '/');
+    const record = pick(byInput.get(stableKey(actorId, req.body)), stableKey(actorId, req.body))
+      ?? pick(byActor.get(actorId), actorId);
+    if (!record) {
+      logger.warn(`No captured run for actor ${actorId}; answering with an empty dataset`);
+    }
+
+    const id = `stub-run-${nextRun++}`;
+    let finish: () => void = () => undefined;
+    const run: StubRun = {
+      id,
+      actId: actorId,
+      status: 'RUNNING',
+      defaultDatasetId: `stub-dataset-${id}`,
+      startedAt: new Date().toISOString(),
+      items: record?.items ?? [],
+      finished: new Promise(resolve => {
+        finish = resolve;
+      })
+    };
+    runs.set(id, run);
+
+    setTimeout(() => {
+      if (run.status === 'RUNNING') {
+        run.status = 'SUCCEEDED';
+        run.finishedAt = new Date().toISOString();
+        fireWebhooks(req.query.webhooks, run);
+      }
+      finish();
+      setTimeout(() => runs.delete(id), RUN_RETENTION_MS).unref();
+    }, (record?.run_ms ?? 0) / options.speed);
+
+    res.status(201).json({ data: runView(run) });
+  });
+
+  app.get('/v2/actor-runs/:runId', async (req, res) => {
+    const run = runs.get(req.params.runId);
+    if (!run) {
+      res.status(404).json({ error: { type: 'record-not-found', message: 'Run not found' } });
+      return;
+    }
+
+    const waitSecs = Number(req.query.waitForFinish ?? 0);
+    if (run.status === 'RUNNING' && waitSecs > 0) {
+      await Promise.race([run.finished, new Promise(resolve => setTimeout(resolve, waitSecs * 1000))]);
+    }
+    res.json({ data: runView(run) });
+  });
+
+  app.post('/v2/actor-runs/:runId/abort', (req, res) => {
+    const run = runs.get(req.params.runId);
+    if (run && run.status === 'RUNNING') {
+      run.status = 'ABORTED';
+      run.finishedAt = new Date().toISOString();
+    }
+    res.json({ data: run ? runView(run) : {} });
+  });
+
+  app.get('/v2/datasets/:datasetId/items', (req, res) => {
+    const run = runs.get(String(req.params.datasetId).replace(/^stub-dataset-/, ''));
+    const items = run?.items ?? [];
+    if (req.query.format === 'jsonl') {
+      res.type('application/jsonl').send(items.map(item => JSON.stringify(item)).join('\n'));
+      return;
+    }
+    res.json(items);
+  });
+
+  return new Promise(resolve => {
+    const server = app.listen(options.port, () => {
+      logger.info(`Apify stand-in listening on port ${options.port} with ${captured.length} captured runs at ${options.speed}x`);
+      resolve(server);
+    });
+  });
+}
@@ -0,0 +1,45 @@
+/**
+ * Export cached bundles into an offline event pack
+ *
+ * Usage: node dist/cli/export-pack.js event.pack
+ *
+ * Reads every entry from the disk bundle cache (typically warmed with the
+ * prefetch command) and writes them into one pack file for EVENT_PACK_PATH.
+ */
+
+import pino from 'pino';
+import { appConfig } from '../config.js';
+import { EventPackEntry, getBundleCache, writeEventPack } from '../storage/index.js';
+
+const logger = pino({ name: 'export-pack' });
+
+async function main(): Promise<void> {
+  const outputPath = process.argv[2];
+  if (!outputPath) {
+    throw new Error('Usage: export-pack <output.pack>');
+  }
+
+  if (appConfig.storageBackend !== 'disk') {
+    throw new Error('STORAGE_BACKEND=disk is required to export the warmed bundles');
+  }
+
+  const cache = getBundleCache();
+  const entries: EventPackEntry[] = [];
+
+  for (const key of await cache.keys()) {
+    const cached = await cache.get(key);
+    if (cached) {
+      entries.push({ keys: [key], bundle: cached.bundle });
+    }
+  }
+
+  await writeEventPack(outputPath, entries);
+
+  const postCount = entries.reduce((total, entry) => total + entry.bundle.posts.length, 0);
+  logger.info(`Wrote ${entries.length} bundles (${postCount} posts) to ${outputPath}`);
+}
+
+main().catch(error => {
+  logger.error('Export failed:', error);
+  process.exit(1);
+});
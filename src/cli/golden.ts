@@ -0,0 +1,174 @@
+/**
+ * Golden bundles and timings for the TS pipeline, from captured Apify runs
+ *
+ * Usage: node dist/cli/golden.js <capture.jsonl...> [--out golden/bundles.json] [--rounds 0]
+ *                                [--concurrency 1] [--base-url http://127.0.0.1:9900]
+ *
+ * Every captured run becomes a case (X handle or LinkedIn profile plus limit). Each case is
+ * fetched through the same tools the server uses, against the upstream stand-in, and the
+ * resulting bundles (or error types) are written to --out; test_golden_parity.py checks the
+ * Python pipeline against them. With --rounds, the cases are also fetched that many times
+ * and the latencies reported, matching benchmark_pipeline.py for the Python side.
+ */
+
+import { promises as fs } from 'fs';
+import { Server } from 'http';
+import { AddressInfo } from 'net';
+import pino from 'pino';
+import { appConfig } from '../config.js';
+import { ApifyRunRecord, readCaptures, startUpstreamStub } from '../capture/index.js';
+import { Bundle, Platform } from '../models/index.js';
+import { LinkedInTools, XTools } from '../tools/index.js';
+import { mapWithConcurrency } from '../utils/index.js';
+
+const logger = pino({ name: 'golden' });
+
+const GOLDEN_VERSION = 1;
+
+interface GoldenCase {
+  platform: Platform;
+  // X handle or LinkedIn profile URL
+  target: string;
+  limit: number;
+}
+
+interface GoldenResult extends GoldenCase {
+  bundle?: Bundle;
+  // Error type when the fetch fails (e.g. for an empty dataset)
+  error?: string;
+}
+
+interface GoldenOptions {
+  capturePaths: string[];
+  out?: string | undefined;
+  rounds: number;
+  concurrency: number;
+  baseUrl?: string | undefined;
+}
+
+function parseArgs(argv: string[]): GoldenOptions {
+  const capturePaths: string[] = [];
+  const flags = new Map<string, string>();
+
+  for (let i = 0; i < argv.length; i++) {
+    const arg = argv[i] as string;
+    if (arg.startsWith('--')) {
+      flags.set(arg.slice(2), argv[++i] ?? '');
+    } else {
+      capturePaths.push(arg);
+    }
+  }
+
+  const rounds = parseInt(flags.get('rounds') || '0', 10);
+  const concurrency = parseInt(flags.get('concurrency') || '1', 10);
+  if (capturePaths.length === 0 || !(rounds >= 0) || !(concurrency >= 1) || (!flags.get('out') && rounds === 0)) {
+    throw new Error('Usage: golden <capture.jsonl...> [--out golden/bundles.json] [--rounds 0] [--concurrency 1] [--base-url URL]');
+  }
+
+  return { capturePaths, out: flags.get('out'), rounds, concurrency, baseUrl: flags.get('base-url') };
+}
+
+/**
+ * The tool call a captured actor run answers, if it came from one of the post actors
+ */
+function caseForRun(run: ApifyRunRecord): GoldenCase | undefined {
+  const input = (run.input ?? {}) as Record<string, unknown>;
+  if (run.actor_id === appConfig.apifyTwitterActor && Array.isArray(input.handles)) {
+    return { platform: Platform.X, target: String(input.handles[0]), limit: Number(input.tweetsPerQuery) };
+  }
+  if (run.actor_id === appConfig.apifyLinkedInPostsActor && typeof input.profileUrl === 'string') {
+    return { platform: Platform.LINKEDIN, target: input.profileUrl, limit: Number(input.postsCount) };
+  }
+  return undefined;
+}
+
+function percentile(sorted: number[], p: number): number {
+  if (sorted.length === 0) {
+    return 0;
+  }
+  return sorted[Math.min(sorted.length - 1, Math.ceil((p / 100) * sorted.length) - 1)] as number;
+}
+
+async function main(): Promise<void> {
+  const options = parseArgs(process.argv.slice(2));
+  const runs = (await readCaptures(options.capturePaths))
+    .filter((record): record is ApifyRunRecord => record.type === 'apify_run');
+  const cases = runs
+    .map(caseForRun)
+    .filter((goldenCase): goldenCase is GoldenCase => goldenCase !== undefined);
+  if (cases.length === 0) {
+    throw new Error(`No X or LinkedIn runs in ${options.capturePaths.join(', ')}`);
+  }
+
+  // Answer every run from the captures, instantly, unless an existing stand-in is given
+  let stub: Server | undefined;
+  if (!options.baseUrl) {
+    stub = await startUpstreamStub(runs, { port: 0, speed: Number.POSITIVE_INFINITY });
+  }
+  appConfig.apifyBaseUrl = options.baseUrl ?? `http://127.0.0.1:${(stub?.address() as AddressInfo).port}`;
+  appConfig.apifyToken ??= 'golden';
+  appConfig.storageBackend = 'memory';
+
+  const xTools = new XTools();
+  const linkedInTools = new LinkedInTools();
+  const fetchBundle = (goldenCase: GoldenCase): Promise<Bundle> => goldenCase.platform === Platform.X
+    ? xTools.fetchBundle(goldenCase.target, goldenCase.limit, { refresh: true, progressive: false })
+    : linkedInTools.fetchBundle(goldenCase.target, goldenCase.limit, { refresh: true, progressive: false });
+
+  if (options.out) {
+    const results: GoldenResult[] = [];
+    for (const goldenCase of cases) {
+      try {
+        results.push({ ...goldenCase, bundle: await fetchBundle(goldenCase) });
+      } catch (error) {
+        results.push({ ...goldenCase, error: error instanceof Error ? error.name : 'UNKNOWN_ERROR' });
+      }
+    }
+    await fs.writeFile(options.out, `${JSON.stringify({ version: GOLDEN_VERSION, cases: results }, null, 2)}\n`);
+    logger.info(`Wrote ${results.length} golden cases to ${options.out}`);
+  }
+
+  if (options.rounds > 0) {
+    const calls = Array.from({ length: options.rounds }, () => cases).flat();
+    const latencies: number[] = [];
+    let errors = 0;
+
+    const startedAt = performance.now();
+    await mapWithConcurrency(calls, options.concurrency, async goldenCase => {
+      const sentAt = performance.now();
+      try {
+        // Serialized as the tools return it, so both pipelines pay for the JSON
+        JSON.stringify(await fetchBundle(goldenCase), null, 2);
+      } catch (error) {
+        errors++;
+      } finally {
+        latencies.push(performance.now() - sentAt);
+      }
+    });
+    const wallMs = performance.now() - startedAt;
+
+    latencies.sort((a, b) => a - b);
+    const round = (value: number): number => Math.round(value * 10) / 10;
+    console.log(JSON.stringify({
+      pipeline: 'ts',
+      calls: calls.length,
+      errors,
+      concurrency: options.concurrency,
+      wall_ms: Math.round(wallMs),
+      latency_ms: {
+        p50: round(percentile(latencies, 50)),
+        p95: round(percentile(latencies, 95)),
+        p99: round(percentile(latencies, 99)),
+        max: round(latencies[latencies.length - 1] ?? 0)
+      }
+    }, null, 2));
+  }
+
+  stub?.close();
+  process.exit(0);
+}
+
+main().catch(error => {
+  logger.error('Golden run failed:', error);
+  process.exit(1);
+});
@@ -0,0 +1,249 @@
+/**
+ * Attendee-list prefetch warmer
+ *
+ * Reads a CSV of X handles and LinkedIn URLs and warms the bundle cache for
+ * everyone on it, so lookups during the event are served from cache.
+ *
+ * Usage: node dist/cli/prefetch.js attendees.csv [--concurrency 4] [--progress file] [--timeout-ms 120000] [--refresh]
+ */
+
+import { promises as fs, appendFileSync } from 'fs';
+import pino from 'pino';
+import { appConfig, validateConfig } from '../config.js';
+import { Platform } from '../models/index.js';
+import { FetchOptions } from '../adapters/index.js';
+import { XTools, LinkedInTools } from '../tools/index.js';
+import { bundleCacheKey, getBundleCache, isFresh } from '../storage/index.js';
+import { Deadline, mapWithConcurrency } from '../utils/index.js';
+
+const logger = pino({ name: 'prefetch' });
+
+interface PrefetchOptions {
+  csvPath: string;
+  progressPath: string;
+  concurrency: number;
+  timeoutMs: number;
+  refresh: boolean;
+}
+
+interface PrefetchJob {
+  key: string;
+  platform: Platform;
+  identifier: string;
+}
+
+interface ProgressRecord {
+  key: string;
+  status: 'ok' | 'error';
+  at: string;
+  posts?: number;
+  error?: string;
+}
+
+const X_COLUMNS = ['x_handle', 'handle', 'twitter', 'x'];
+const LINKEDIN_COLUMNS = ['linkedin_url', 'linkedin', 'profile_url'];
+
+function parseArgs(argv: string[]): PrefetchOptions {
+  const positional: string[] = [];
+  const flags = new Map<string, string>();
+  let refresh = false;
+
+  for (let i = 0; i < argv.length; i++) {
+    const arg = argv[i] as string;
+    if (arg === '--refresh') {
+      refresh = true;
+    } else if (arg.startsWith('--')) {
+      flags.set(arg.slice(2), argv[++i] ?? '');
+    } else {
+      positional.push(arg);
+    }
+  }
+
+  const csvPath = positional[0];
+  const concurrency = parseInt(flags.get('concurrency') || '4', 10);
+  const timeoutMs = parseInt(flags.get('timeout-ms') || '120000', 10);
+  if (!csvPath || !(concurrency >= 1) || !(timeoutMs >= 1)) {
+    throw new Error('Usage: prefetch <attendees.csv> [--concurrency 4] [--progress file] [--timeout-ms 120000] [--refresh]');
+  }
+
+  return {
+    csvPath,
+    progressPath: flags.get('progress') || `${csvPath}.progress.jsonl`,
+    concurrency,
+    timeoutMs,
+    refresh
+  };
+}
+
+/**
+ * Split one CSV line, honouring double-quoted fields
+ */
+function parseCsvLine(line: string): string[] {
+  const fields: string[] = [];
+  let current = '';
+  let quoted = false;
+
+  for (let i = 0; i < line.length; i++) {
+    const char = line[i];
+    if (quoted) {
+      if (char === '"' && line[i + 1] === '"') {
+        current += '"';
+        i++;
+      } else if (char === '"') {
+        quoted = false;
+      } else {
+        current += char;
+      }
+    } else if (char === '"') {
+      quoted = true;
+    } else if (char === ',') {
+      fields.push(current.trim());
+      current = '';
+    } else {
+      current += char;
+    }
+  }
+
+  fields.push(current.trim());
+  return fields;
+}
+
+/**
+ * Turn CSV rows into per-platform jobs. With a header row the X and LinkedIn
+ * columns are found by name; without one, column 1 is the X handle and column 2 the LinkedIn URL.
+ */
+function parseAttendees(content: string): PrefetchJob[] {
+  const rows = content.split(/\r?\n/).filter(line => line.trim()).map(parseCsvLine);
+  const header = (rows[0] ?? []).map(cell => cell.toLowerCase());
+
+  let xColumn = header.findIndex(cell => X_COLUMNS.includes(cell));
+  let linkedinColumn = header.findIndex(cell => LINKEDIN_COLUMNS.includes(cell));
+  const hasHeader = xColumn >= 0 || linkedinColumn >= 0;
+
+  if (!hasHeader) {
+    xColumn = 0;
+    linkedinColumn = 1;
+  }
+
+  const jobs = new Map<string, PrefetchJob>();
+  for (const row of hasHeader ? rows.slice(1) : rows) {
+    const handle = xColumn >= 0 ? row[xColumn]?.replace('@', '').trim() : undefined;
+    const linkedinUrl = linkedinColumn >= 0 ? row[linkedinColumn]?.trim() : undefined;
+
+    if (handle) {
+      const key = bundleCacheKey(Platform.X, handle);
+      jobs.set(key, { key, platform: Platform.X, identifier: handle });
+    }
+    if (linkedinUrl && /linkedin\.com\//i.test(linkedinUrl)) {
+      const key = bundleCacheKey(Platform.LINKEDIN, linkedinUrl);
+      jobs.set(key, { key, platform: Platform.LINKEDIN, identifier: linkedinUrl });
+    }
+  }
+
+  return Array.from(jobs.values());
+}
+
+/**
+ * Keys warmed by a previous run of the same progress file within CACHE_TTL_HOURS;
+ * older ones have expired from the cache and are fetched again
+ */
+async function loadCompletedKeys(progressPath: string, now: number = Date.now()): Promise<Set<string>> {
+  const completed = new Set<string>();
+  const ttlMs = appConfig.cacheTtlHours * 60 * 60 * 1000;
+
+  try {
+    const content = await fs.readFile(progressPath, 'utf8');
+    for (const line of content.split('\n')) {
+      if (!line.trim()) {
+        continue;
+      }
+      try {
+        const record = JSON.parse(line) as ProgressRecord;
+        if (record.status === 'ok' && now - Date.parse(record.at) < ttlMs) {
+          completed.add(record.key);
+        }
+      } catch {
+        // Ignore a torn last line from an interrupted run
+      }
+    }
+  } catch (error) {
+    if ((error as NodeJS.ErrnoException).code !== 'ENOENT') {
+      throw error;
+    }
+  }
+
+  return completed;
+}
+
+async function main(): Promise<void> {
+  validateConfig();
+  const options = parseArgs(process.argv.slice(2));
+
+  if (appConfig.storageBackend !== 'disk') {
+    throw new Error('STORAGE_BACKEND=disk is required so the server can read the warmed bundles');
+  }
+
+  const jobs = parseAttendees(await fs.readFile(options.csvPath, 'utf8'));
+  const completed = options.refresh ? new Set<string>() : await loadCompletedKeys(options.progressPath);
+  const cache = getBundleCache();
+
+  const pending: PrefetchJob[] = [];
+  for (const job of jobs) {
+    if (completed.has(job.key)) {
+      continue;
+    }
+    const cached = options.refresh ? undefined : await cache.get(job.key);
+    // An event pack copy does not count: the pack is only the offline fallback
+    if (cached && !cached.offline && isFresh(cached)) {
+      continue;
+    }
+    pending.push(job);
+  }
+
+  logger.info(`${jobs.length} profiles in ${options.csvPath}, ${jobs.length - pending.length} already warm, ${pending.length} to fetch`);
+
+  const xTools = new XTools();
+  const linkedinTools = new LinkedInTools();
+  let done = 0;
+  let failed = 0;
+
+  await mapWithConcurrency(
+    pending,
+    options.concurrency,
+    async job => {
+      const deadline = Deadline.fromBudget(options.timeoutMs);
+      try {
+        // Warming is background work: live tool calls on a shared server go first
+        const fetchOptions: FetchOptions = { deadline, refresh: true, lane: 'background' };
+        return job.platform === Platform.X
+          ? await xTools.fetchBundle(job.identifier, appConfig.defaultPostLimitX, fetchOptions)
+          : await linkedinTools.fetchBundle(job.identifier, appConfig.defaultPostLimitLinkedIn, fetchOptions);
+      } finally {
+        deadline.dispose();
+      }
+    },
+    (result, job) => {
+      const record: ProgressRecord = result.status === 'fulfilled'
+        ? { key: job.key, status: 'ok', at: new Date().toISOString(), posts: result.value.posts.length }
+        : { key: job.key, status: 'error', at: new Date().toISOString(), error: String(result.reason?.message ?? result.reason) };
+
+      done++;
+      if (record.status === 'error') {
+        failed++;
+        logger.warn(`[${done}/${pending.length}] ${job.key} failed: ${record.error}`);
+      } else {
+        logger.info(`[${done}/${pending.length}] ${job.key} warmed (${record.posts} posts)`);
+      }
+
+      // Appended synchronously so an interrupted run can resume from here
+      appendFileSync(options.progressPath, `${JSON.stringify(record)}\n`);
+    }
+  );
+
+  logger.info(`Prefetch finished: ${done - failed} warmed, ${failed} failed`);
+}
+
+main().catch(error => {
+  logger.error('Prefetch failed:', error);
+  process.exit(1);
+});
@@ -0,0 +1,126 @@
+/**
+ * Replay captured tool calls against a running server
+ *
+ * Usage: node dist/cli/replay.js <capture.jsonl...> [--target http://127.0.0.1:8000] [--speed 1]
+ *
+ * Sends every captured tool call to POST /mcp/tools/call, keeping the gaps between
+ * arrivals (divided by --speed), and reports latency percentiles and peak concurrency.
+ * Pair it with the upstream-stub command so Apify is answered from the same capture.
+ */
+
+import pino from 'pino';
+import { appConfig } from '../config.js';
+import { readCaptures, ToolCallRecord } from '../capture/index.js';
+
+const logger = pino({ name: 'replay' });
+
+interface ReplayOptions {
+  capturePaths: string[];
+  target: string;
+  speed: number;
+}
+
+interface ReplayResult {
+  latencyMs: number;
+  ok: boolean;
+}
+
+function parseArgs(argv: string[]): ReplayOptions {
+  const capturePaths: string[] = [];
+  const flags = new Map<string, string>();
+
+  for (let i = 0; i < argv.length; i++) {
+    const arg = argv[i] as string;
+    if (arg.startsWith('--')) {
+      flags.set(arg.slice(2), argv[++i] ?? '');
+    } else {
+      capturePaths.push(arg);
+    }
+  }
+
+  const speed = parseFloat(flags.get('speed') || '1');
+  if (capturePaths.length === 0 || !(speed > 0)) {
+    throw new Error('Usage: replay <capture.jsonl...> [--target http://127.0.0.1:8000] [--speed 1]');
+  }
+
+  return {
+    capturePaths,
+    target: (flags.get('target') || `http://127.0.0.1:${appConfig.port}`).replace(/\/+$/, ''),
+    speed
+  };
+}
+
+function percentile(sorted: number[], p: number): number {
+  if (sorted.length === 0) {
+    return 0;
+  }
+  return sorted[Math.min(sorted.length - 1, Math.ceil((p / 100) * sorted.length) - 1)] as number;
+}
+
+async function main(): Promise<void> {
+  const options = parseArgs(process.argv.slice(2));
+  const calls = (await readCaptures(options.capturePaths))
+    .filter((record): record is ToolCallRecord => record.type === 'tool_call');
+  const first = calls[0];
+  if (!first) {
+    throw new Error(`No tool calls in ${options.capturePaths.join(', ')}`);
+  }
+
+  const span = (calls[calls.length - 1] as ToolCallRecord).at_ms - first.at_ms;
+  logger.info(`Replaying ${calls.length} tool calls spanning ${span}ms at ${options.speed}x against ${options.target}`);
+
+  const headers: Record<string, string> = { 'Content-Type': 'application/json' };
+  if (appConfig.serverToken) {
+    headers.Authorization = `Bearer ${appConfig.serverToken}`;
+  }
+
+  let inFlight = 0;
+  let peakInFlight = 0;
+  const send = async (call: ToolCallRecord): Promise<ReplayResult> => {
+    inFlight++;
+    peakInFlight = Math.max(peakInFlight, inFlight);
+    const sentAt = performance.now();
+    try {
+      const response = await fetch(`${options.target}/mcp/tools/call`, {
+        method: 'POST',
+        headers,
+        body: JSON.stringify({ name: call.name, arguments: call.arguments })
+      });
+      const body = await response.json() as { isError?: boolean };
+      return { latencyMs: performance.now() - sentAt, ok: response.ok && !body.isError };
+    } catch (error) {
+      logger.warn(`Replayed ${call.name} failed:`, error);
+      return { latencyMs: performance.now() - sentAt, ok: false };
+    } finally {
+      inFlight--;
+    }
+  };
+
+  const startedAt = performance.now();
+  const results = await Promise.all(calls.map(call => new Promise<ReplayResult>(resolve => {
+    setTimeout(() => resolve(send(call)), (call.at_ms - first.at_ms) / options.speed);
+  })));
+  const wallMs = performance.now() - startedAt;
+
+  const latencies = results.map(result => result.latencyMs).sort((a, b) => a - b);
+  const round = (value: number): number => Math.round(value * 10) / 10;
+  const report = {
+    calls: results.length,
+    errors: results.filter(result => !result.ok).length,
+    speed: options.speed,
+    wall_ms: Math.round(wallMs),
+    peak_in_flight: peakInFlight,
+    latency_ms: {
+      p50: round(percentile(latencies, 50)),
+      p95: round(percentile(latencies, 95)),
+      p99: round(percentile(latencies, 99)),
+      max: round(latencies[latencies.length - 1] ?? 0)
+    }
+  };
+  console.log(JSON.stringify(report, null, 2));
+}
+
+main().catch(error => {
+  logger.error('Replay failed:', error);
+  process.exit(1);
+});
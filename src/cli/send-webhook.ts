@@ -0,0 +1,48 @@
+/**
+ * Send a fake Apify run webhook to a running server
+ *
+ * Usage: node dist/cli/send-webhook.js <run-id> [event-type] [server-url]
+ *
+ * Posts the same payload shape Apify's default webhook template sends, with the
+ * APIFY_WEBHOOK_SECRET header, so webhook mode can be exercised without Apify.
+ */
+
+import pino from 'pino';
+import { appConfig } from '../config.js';
+
+const logger = pino({ name: 'send-webhook' });
+
+async function main(): Promise<void> {
+  const [runId, eventType = 'ACTOR.RUN.SUCCEEDED', serverUrl = `http://127.0.0.1:${appConfig.port}`] = process.argv.slice(2);
+  if (!runId) {
+    throw new Error('Usage: send-webhook <run-id> [event-type] [server-url]');
+  }
+
+  const status = eventType.replace('ACTOR.RUN.', '');
+  const payload = {
+    userId: 'fake-user',
+    createdAt: new Date().toISOString(),
+    eventType,
+    eventData: { actorId: 'fake-actor', actorRunId: runId },
+    resource: { id: runId, status, finishedAt: new Date().toISOString() }
+  };
+
+  const response = await fetch(`${serverUrl.replace(/\/+$/, '')}/webhooks/apify`, {
+    method: 'POST',
+    headers: {
+      'Content-Type': 'application/json',
+      'X-Apify-Webhook-Secret': appConfig.apifyWebhookSecret ?? ''
+    },
+    body: JSON.stringify(payload)
+  });
+
+  logger.info(`Webhook for run ${runId} (${eventType}) answered ${response.status}: ${await response.text()}`);
+  if (!response.ok) {
+    process.exit(1);
+  }
+}
+
+main().catch(error => {
+  logger.error('Sending webhook failed:', error);
+  process.exit(1);
+});
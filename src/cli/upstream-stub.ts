@@ -0,0 +1,42 @@
+/**
+ * Serve captured Apify runs from a local stand-in for the Apify API
+ *
+ * Usage: node dist/cli/upstream-stub.js <capture.jsonl...> [--port 9900] [--speed 1]
+ *
+ * Start the server with APIFY_BASE_URL=http://127.0.0.1:<port> so every actor run is
+ * answered with the dataset captured for the same input, --speed times faster than live.
+ */
+
+import pino from 'pino';
+import { ApifyRunRecord, readCaptures, startUpstreamStub } from '../capture/index.js';
+
+const logger = pino({ name: 'upstream-stub' });
+
+async function main(): Promise<void> {
+  const capturePaths: string[] = [];
+  const flags = new Map<string, string>();
+  const argv = process.argv.slice(2);
+  for (let i = 0; i < argv.length; i++) {
+    const arg = argv[i] as string;
+    if (arg.startsWith('--')) {
+      flags.set(arg.slice(2), argv[++i] ?? '');
+    } else {
+      capturePaths.push(arg);
+    }
+  }
+
+  const port = parseInt(flags.get('port') || '9900', 10);
+  const speed = parseFloat(flags.get('speed') || '1');
+  if (capturePaths.length === 0 || !(speed > 0)) {
+    throw new Error('Usage: upstream-stub <capture.jsonl...> [--port 9900] [--speed 1]');
+  }
+
+  const runs = (await readCaptures(capturePaths))
+    .filter((record): record is ApifyRunRecord => record.type === 'apify_run');
+  await startUpstreamStub(runs, { port, speed });
+}
+
+main().catch(error => {
+  logger.error('Upstream stub failed:', error);
+  process.exit(1);
+});
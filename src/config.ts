@@ -2,6 +2,7 @@
  * Configuration management for Social Snapshot Hub
  */
 
+import os from 'os';
 import { config } from 'dotenv';
 
 // Load environment variables
@@ -12,6 +13,33 @@ export interface Config {
   apifyToken: string | undefined;
   apifyTwitterActor: string;
   apifyLinkedInPostsActor: string;
+  // Alternative Apify API base URL, e.g. a local stand-in for replays
+  apifyBaseUrl?: string | undefined;
+
+  // Deadlines and retries
+  requestTimeoutMs: number;
+  // Whole-batch cap for batch_openers calls and streams (each person still uses the upstream retries below)
+  batchTimeoutMs: number;
+  apifyHedgeAfterMs: number;
+  apifyMaxAttempts: number;
+  apifyRetryBaseMs: number;
+  apifyMinRunMs: number;
+
+  // Per-actor circuit breaker and adaptive concurrency
+  apifyBreakerThreshold: number;
+  apifyBreakerCooldownMs: number;
+  apifyMaxConcurrentRuns: number;
+  // Share of each actor's concurrency kept for background work (prefetch, batches)
+  apifyBackgroundMinShare: number;
+
+  // Webhook-driven run completion (polling when unset)
+  apifyWebhookUrl?: string | undefined;
+  apifyWebhookSecret?: string | undefined;
+  apifyWebhookPollMs: number;
+
+  // Progressive fetching: scrape a small first page, expand only when themes are unclear
+  progressiveFetch: boolean;
+  progressiveFirstPage: number;
 
   // Server configuration
   serverName: string;
@@ -19,6 +47,7 @@ export interface Config {
   port: number;
   serverToken: string | undefined;
   allowedOrigins: string[];
+  httpWorkers: number;
 
   // Default limits
   defaultFreshnessDays: number;
@@ -32,17 +61,58 @@ export interface Config {
   s3Bucket?: string | undefined;
   s3Region?: string | undefined;
   s3Prefix?: string | undefined;
+  eventPackPath?: string | undefined;
+  archivePath?: string | undefined;
+  archiveReadOnly: boolean;
+  // Directory for context documents, shared by cluster workers (memory only when unset)
+  resourcePath?: string | undefined;
+
+  // On-demand profiling
+  profileSampleRate: number;
+  profileOnHeader: boolean;
+  profileKeep: number;
+
+  // Traffic capture for replays
+  capturePath?: string | undefined;
 }
 
 function parseAllowedOrigins(origins: string): string[] {
   return origins.split(',').map(origin => origin.trim());
 }
 
+function parseWorkerCount(workers: string): number {
+  return workers === 'auto' ? os.cpus().length : parseInt(workers, 10);
+}
+
 export const appConfig: Config = {
   // Apify configuration
   apifyToken: process.env.APIFY_TOKEN,
   apifyTwitterActor: process.env.APIFY_TWITTER_ACTOR || "apidojo/tweet-scraper",
   apifyLinkedInPostsActor: process.env.APIFY_LINKEDIN_POSTS_ACTOR || "your_linkedin_posts_actor",
+  apifyBaseUrl: process.env.APIFY_BASE_URL,
+
+  // Deadlines and retries
+  requestTimeoutMs: parseInt(process.env.REQUEST_TIMEOUT_MS || "25000", 10),
+  batchTimeoutMs: parseInt(process.env.BATCH_TIMEOUT_MS || "300000", 10),
+  apifyHedgeAfterMs: parseInt(process.env.APIFY_HEDGE_AFTER_MS || "12000", 10),
+  apifyMaxAttempts: parseInt(process.env.APIFY_MAX_ATTEMPTS || "3", 10),
+  apifyRetryBaseMs: parseInt(process.env.APIFY_RETRY_BASE_MS || "500", 10),
+  apifyMinRunMs: parseInt(process.env.APIFY_MIN_RUN_MS || "3000", 10),
+
+  // Per-actor circuit breaker and adaptive concurrency
+  apifyBreakerThreshold: parseInt(process.env.APIFY_BREAKER_THRESHOLD || "3", 10),
+  apifyBreakerCooldownMs: parseInt(process.env.APIFY_BREAKER_COOLDOWN_MS || "30000", 10),
+  apifyMaxConcurrentRuns: parseInt(process.env.APIFY_MAX_CONCURRENT_RUNS || "8", 10),
+  apifyBackgroundMinShare: parseFloat(process.env.APIFY_BACKGROUND_MIN_SHARE || "0.25"),
+
+  // Webhook-driven run completion (polling when unset)
+  apifyWebhookUrl: process.env.APIFY_WEBHOOK_URL,
+  apifyWebhookSecret: process.env.APIFY_WEBHOOK_SECRET,
+  apifyWebhookPollMs: parseInt(process.env.APIFY_WEBHOOK_POLL_MS || "30000", 10),
+
+  // Progressive fetching: scrape a small first page, expand only when themes are unclear
+  progressiveFetch: process.env.PROGRESSIVE_FETCH === "true",
+  progressiveFirstPage: parseInt(process.env.PROGRESSIVE_FIRST_PAGE || "5", 10),
 
   // Server configuration
   serverName: process.env.SERVER_NAME || "Social Snapshot Hub",
@@ -50,6 +120,7 @@ export const appConfig: Config = {
   port: parseInt(process.env.PORT || "8080", 10),
   serverToken: process.env.SERVER_TOKEN,
   allowedOrigins: parseAllowedOrigins(process.env.ALLOWED_ORIGINS || "https://chat.mistral.ai"),
+  httpWorkers: parseWorkerCount(process.env.HTTP_WORKERS || "1"),
 
   // Default limits
   defaultFreshnessDays: parseInt(process.env.DEFAULT_FRESHNESS_DAYS || "30", 10),
@@ -62,7 +133,19 @@ export const appConfig: Config = {
   diskPath: process.env.DISK_PATH,
   s3Bucket: process.env.S3_BUCKET,
   s3Region: process.env.S3_REGION,
-  s3Prefix: process.env.S3_PREFIX
+  s3Prefix: process.env.S3_PREFIX,
+  eventPackPath: process.env.EVENT_PACK_PATH,
+  archivePath: process.env.ARCHIVE_PATH,
+  archiveReadOnly: process.env.ARCHIVE_READ_ONLY === 'true',
+  resourcePath: process.env.RESOURCE_PATH,
+
+  // On-demand profiling
+  profileSampleRate: parseFloat(process.env.PROFILE_SAMPLE_RATE || "0"),
+  profileOnHeader: process.env.PROFILE_ON_HEADER === 'true',
+  profileKeep: parseInt(process.env.PROFILE_KEEP || "10", 10),
+
+  // Traffic capture for replays
+  capturePath: process.env.CAPTURE_PATH
 };
 
 export function validateConfig(): void {
@@ -74,6 +157,38 @@ export function validateConfig(): void {
     throw new Error("PORT must be between 1 and 65535");
   }
 
+  if (!(appConfig.httpWorkers >= 1)) {
+    throw new Error("HTTP_WORKERS must be a positive number or 'auto'");
+  }
+
+  if (appConfig.requestTimeoutMs <= 0) {
+    throw new Error("REQUEST_TIMEOUT_MS must be a positive number of milliseconds");
+  }
+
+  if (!(appConfig.progressiveFirstPage >= 1)) {
+    throw new Error("PROGRESSIVE_FIRST_PAGE must be at least 1");
+  }
+
+  if (!(appConfig.batchTimeoutMs > 0)) {
+    throw new Error("BATCH_TIMEOUT_MS must be a positive number of milliseconds");
+  }
+
+  if (!(appConfig.apifyBreakerThreshold >= 1) || !(appConfig.apifyMaxConcurrentRuns >= 1)) {
+    throw new Error("APIFY_BREAKER_THRESHOLD and APIFY_MAX_CONCURRENT_RUNS must be at least 1");
+  }
+
+  if (!(appConfig.apifyBackgroundMinShare >= 0 && appConfig.apifyBackgroundMinShare < 1)) {
+    throw new Error("APIFY_BACKGROUND_MIN_SHARE must be at least 0 and below 1");
+  }
+
+  if (appConfig.apifyWebhookUrl && !appConfig.apifyWebhookSecret) {
+    throw new Error("APIFY_WEBHOOK_SECRET is required when APIFY_WEBHOOK_URL is set");
+  }
+
+  if (!(appConfig.profileSampleRate >= 0 && appConfig.profileSampleRate <= 1)) {
+    throw new Error("PROFILE_SAMPLE_RATE must be between 0 and 1");
+  }
+
   if (appConfig.storageBackend === 's3' && (!appConfig.s3Bucket || !appConfig.s3Region)) {
     throw new Error("S3_BUCKET and S3_REGION are required when STORAGE_BACKEND=s3");
   }
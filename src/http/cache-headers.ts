@@ -0,0 +1,58 @@
+/**
+ * Cache-Control and ETag headers for read-only GET endpoints, so a CDN or reverse
+ * proxy can answer repeats (and revalidate in the background) without invoking the server
+ */
+
+import { Request, Response } from 'express';
+import { appConfig } from '../config.js';
+import { sendJsonBytes } from './compression.js';
+import { etagFor, etagMatches } from './precomputed.js';
+
+export interface CachePolicy {
+  // How long browsers and proxies may reuse the response without asking
+  maxAgeSeconds: number;
+  // How long shared caches (CDN edge) may reuse it; defaults to maxAgeSeconds
+  sharedMaxAgeSeconds?: number;
+  // How long a cache may keep serving it after that while it revalidates in the background
+  staleWhileRevalidateSeconds?: number;
+  // The body at this URL never changes
+  immutable?: boolean;
+}
+
+export const NO_STORE = 'no-store';
+
+/**
+ * Cache-Control value for a policy. With SERVER_TOKEN set, responses are marked
+ * private so shared caches never hand one client's data to another.
+ */
+export function cacheControl(policy: CachePolicy): string {
+  const directives = [appConfig.serverToken ? 'private' : 'public', `max-age=${Math.max(0, Math.floor(policy.maxAgeSeconds))}`];
+  if (!appConfig.serverToken) {
+    directives.push(`s-maxage=${Math.max(0, Math.floor(policy.sharedMaxAgeSeconds ?? policy.maxAgeSeconds))}`);
+  }
+  if (policy.staleWhileRevalidateSeconds) {
+    directives.push(`stale-while-revalidate=${Math.floor(policy.staleWhileRevalidateSeconds)}`);
+  }
+  if (policy.immutable) {
+    directives.push('immutable');
+  }
+  return directives.join(', ');
+}
+
+/**
+ * Send a JSON body with an ETag and Cache-Control; a matching If-None-Match gets an empty 304
+ */
+export function sendCacheableJson(req: Request, res: Response, body: unknown, policy: CachePolicy): void {
+  const payload = Buffer.from(JSON.stringify(body));
+  const etag = etagFor(payload);
+
+  res.vary('Accept-Encoding');
+  res.setHeader('ETag', etag);
+  res.setHeader('Cache-Control', cacheControl(policy));
+
+  if (etagMatches(req.headers['if-none-match'], etag)) {
+    res.status(304).end();
+    return;
+  }
+  sendJsonBytes(req, res, payload);
+}
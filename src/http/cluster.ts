@@ -0,0 +1,158 @@
+/**
+ * Pre-fork multi-worker mode for the HTTP server
+ *
+ * The primary validates configuration once, then forks HTTP_WORKERS workers that
+ * share the listening port. Workers share bundles (and the themes inferred on them)
+ * through the disk bundle cache and context documents through RESOURCE_PATH; the
+ * primary only relays small "bundle published" notices so each worker's in-memory
+ * search index and post archive see every fetch, "resource stored" notices so every
+ * worker lists every document, and "run finished" notices so an Apify webhook reaches
+ * whichever worker started the run.
+ */
+
+import cluster, { Worker } from 'cluster';
+import pino from 'pino';
+import { appConfig } from '../config.js';
+import { deliverBundle, getBundleCache, getResourceStore, setBundleRelay, setResourceRelay } from '../storage/index.js';
+import { deliverRunFinished, setRunFinishedRelay } from '../adapters/index.js';
+
+const logger = pino({ name: 'cluster' });
+
+const RESTART_DELAY_MS = 1000;
+// A worker that dies sooner than this after starting is restarted more slowly
+const CRASH_LOOP_WINDOW_MS = 10000;
+
+interface BundlePublishedMessage {
+  type: 'bundle-published';
+  key: string;
+  fetched_at_iso: string;
+}
+
+interface RunFinishedMessage {
+  type: 'run-finished';
+  runId: string;
+}
+
+interface ResourceStoredMessage {
+  type: 'resource-stored';
+  uri: string;
+}
+
+function isBundlePublished(message: unknown): message is BundlePublishedMessage {
+  return typeof message === 'object' && message !== null && (message as { type?: unknown }).type === 'bundle-published';
+}
+
+function isRunFinished(message: unknown): message is RunFinishedMessage {
+  return typeof message === 'object' && message !== null && (message as { type?: unknown }).type === 'run-finished';
+}
+
+function isResourceStored(message: unknown): message is ResourceStoredMessage {
+  return typeof message === 'object' && message !== null && (message as { type?: unknown }).type === 'resource-stored';
+}
+
+/**
+ * Fork the workers and keep them running; call only in the primary process
+ */
+export function runPrimary(workerCount: number): void {
+  const workers = new Map<number, Worker>();
+
+  // In-process caches would be per worker, so clustered workers always share the disk cache
+  const sharedEnv: Record<string, string> = {};
+  if (appConfig.storageBackend !== 'disk') {
+    logger.warn(`STORAGE_BACKEND=${appConfig.storageBackend} is per-process; workers will share a disk cache instead`);
+    sharedEnv.STORAGE_BACKEND = 'disk';
+  }
+  // Context documents too: a follow-up call (suggest_openers, resources/read) may land on any worker
+  if (!appConfig.resourcePath) {
+    sharedEnv.RESOURCE_PATH = '.cache/resources';
+  }
+
+  const fork = (index: number): void => {
+    const worker = cluster.fork({
+      ...sharedEnv,
+      WORKER_INDEX: String(index),
+      // One archive writer per directory; the others load it and follow via relayed bundles
+      ARCHIVE_READ_ONLY: index === 0 ? 'false' : 'true'
+    });
+    const startedAt = Date.now();
+    workers.set(index, worker);
+
+    worker.on('message', (message: unknown) => {
+      if (!isBundlePublished(message) && !isRunFinished(message) && !isResourceStored(message)) {
+        return;
+      }
+      for (const sibling of workers.values()) {
+        if (sibling !== worker && sibling.isConnected()) {
+          sibling.send(message);
+        }
+      }
+    });
+
+    worker.on('exit', (code, signal) => {
+      workers.delete(index);
+      const delay = Date.now() - startedAt < CRASH_LOOP_WINDOW_MS ? RESTART_DELAY_MS * 5 : RESTART_DELAY_MS;
+      logger.warn(`Worker ${index} (pid ${worker.process.pid}) exited with ${signal || code}, restarting in ${delay}ms`);
+      setTimeout(() => fork(index), delay);
+    });
+  };
+
+  for (let index = 0; index < workerCount; index++) {
+    fork(index);
+  }
+  logger.info(`Primary ${process.pid} started ${workerCount} HTTP workers`);
+}
+
+/**
+ * Wire this worker into the cluster: announce bundles it publishes and pick up
+ * bundles its siblings published from the shared cache
+ */
+export function joinCluster(): void {
+  const cache = getBundleCache();
+  // Latest fetched_at per key this worker has announced or received, so cache hits are not re-broadcast
+  const seen = new Map<string, string>();
+
+  setBundleRelay((key, bundle) => {
+    if (seen.get(key) === bundle.meta.fetched_at_iso) {
+      return;
+    }
+    seen.set(key, bundle.meta.fetched_at_iso);
+    const message: BundlePublishedMessage = { type: 'bundle-published', key, fetched_at_iso: bundle.meta.fetched_at_iso };
+    process.send?.(message);
+  });
+
+  setRunFinishedRelay(runId => {
+    const message: RunFinishedMessage = { type: 'run-finished', runId };
+    process.send?.(message);
+  });
+
+  setResourceRelay(uri => {
+    const message: ResourceStoredMessage = { type: 'resource-stored', uri };
+    process.send?.(message);
+  });
+
+  process.on('message', (message: unknown) => {
+    if (isRunFinished(message)) {
+      deliverRunFinished(message.runId);
+      return;
+    }
+    if (isResourceStored(message)) {
+      getResourceStore().deliver(message.uri)
+        .catch(error => logger.warn(`Failed to load relayed resource ${message.uri}:`, error));
+      return;
+    }
+    if (!isBundlePublished(message) || seen.get(message.key) === message.fetched_at_iso) {
+      return;
+    }
+    seen.set(message.key, message.fetched_at_iso);
+
+    cache.get(message.key)
+      .then(entry => {
+        if (entry && entry.bundle.meta.fetched_at_iso === message.fetched_at_iso) {
+          deliverBundle(message.key, entry.bundle);
+        }
+      })
+      .catch(error => logger.warn(`Failed to load relayed bundle ${message.key}:`, error));
+  });
+
+  logger.info(`Worker ${process.env.WORKER_INDEX ?? cluster.worker?.id} (pid ${process.pid}) joined the cluster`);
+}
@@ -0,0 +1,7 @@
+export * from './compression.js';
+export * from './precomputed.js';
+export * from './cluster.js';
+export * from './profiling.js';
+export * from './webhooks.js';
+export * from './sse.js';
+export * from './cache-headers.js';
\ No newline at end of file
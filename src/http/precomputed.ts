@@ -0,0 +1,79 @@
+/**
+ * JSON responses serialized (and compressed) once, served as raw bytes with an ETag
+ */
+
+import { Request, Response } from 'express';
+import { createHash } from 'crypto';
+import zlib from 'zlib';
+import { negotiateEncoding } from './compression.js';
+
+/**
+ * Strong ETag for a serialized body
+ */
+export function etagFor(body: Buffer): string {
+  return `"${createHash('sha256').update(body).digest('base64url').slice(0, 27)}"`;
+}
+
+export interface PrecomputedJson {
+  etag: string;
+  identity: Buffer;
+  br: Buffer;
+  gzip: Buffer;
+}
+
+/**
+ * Serialize a response body once; compression runs at full strength since it is paid only here
+ */
+export function precomputeJson(body: unknown): PrecomputedJson {
+  const identity = Buffer.from(JSON.stringify(body));
+  return {
+    etag: etagFor(identity),
+    identity,
+    br: zlib.brotliCompressSync(identity, {
+      params: {
+        [zlib.constants.BROTLI_PARAM_QUALITY]: zlib.constants.BROTLI_MAX_QUALITY,
+        [zlib.constants.BROTLI_PARAM_MODE]: zlib.constants.BROTLI_MODE_TEXT
+      }
+    }),
+    gzip: zlib.gzipSync(identity, { level: zlib.constants.Z_BEST_COMPRESSION })
+  };
+}
+
+/**
+ * Whether an If-None-Match header names this ETag (or is "*")
+ */
+export function etagMatches(header: string | undefined, etag: string): boolean {
+  if (!header) {
+    return false;
+  }
+  return header.split(',').some(candidate => {
+    const tag = candidate.trim();
+    return tag === '*' || tag === etag || tag === `W/${etag}`;
+  });
+}
+
+/**
+ * Send precomputed bytes in the best encoding the client accepts.
+ * GET/HEAD requests whose If-None-Match names the ETag get an empty 304.
+ */
+export function sendPrecomputed(req: Request, res: Response, payload: PrecomputedJson, cacheControl?: string): void {
+  res.vary('Accept-Encoding');
+  res.setHeader('ETag', payload.etag);
+  if (cacheControl) {
+    res.setHeader('Cache-Control', cacheControl);
+  }
+
+  if ((req.method === 'GET' || req.method === 'HEAD') && etagMatches(req.headers['if-none-match'], payload.etag)) {
+    res.status(304).end();
+    return;
+  }
+
+  const encoding = negotiateEncoding(req.headers['accept-encoding']);
+  const body = encoding ? payload[encoding] : payload.identity;
+  res.setHeader('Content-Type', 'application/json; charset=utf-8');
+  res.setHeader('Content-Length', body.length);
+  if (encoding) {
+    res.setHeader('Content-Encoding', encoding);
+  }
+  res.end(req.method === 'HEAD' ? undefined : body);
+}
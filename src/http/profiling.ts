@@ -0,0 +1,222 @@
+/**
+ * Opt-in per-request CPU and allocation profiling
+ *
+ * A sampled request (PROFILE_SAMPLE_RATE) or one sent with `X-Profile: 1` (when
+ * PROFILE_ON_HEADER=true) runs under the V8 CPU profiler and the sampling heap
+ * profiler. The slowest and the most allocating profiles are kept in memory and served
+ * from /debug/profiles. With profiling off none of this is installed.
+ */
+
+import { Request, Response, NextFunction, Router } from 'express';
+import { HeapProfiler, Profiler, Session } from 'inspector';
+import pino from 'pino';
+import { appConfig } from '../config.js';
+import { bearerTokenAuth } from '../auth/index.js';
+
+const logger = pino({ name: 'profiling' });
+
+// Average bytes between heap samples (V8's default)
+const HEAP_SAMPLING_INTERVAL = 32768;
+
+export type ProfileTrigger = 'header' | 'sample';
+
+export interface ProfileSummary {
+  id: string;
+  method: string;
+  path: string;
+  tool?: string;
+  trigger: ProfileTrigger;
+  status: number;
+  started_at_iso: string;
+  duration_ms: number;
+  // Sampled allocations made while the request ran, including objects already collected
+  allocated_bytes: number;
+  heap_delta_bytes: number;
+}
+
+interface CapturedProfile {
+  summary: ProfileSummary;
+  cpu: Profiler.Profile;
+  heap: HeapProfiler.SamplingHeapProfile;
+}
+
+/**
+ * The `keep` slowest and `keep` most allocating profiles seen so far
+ */
+export class ProfileStore {
+  private profiles = new Map<string, CapturedProfile>();
+  private slowest: ProfileSummary[] = [];
+  private heaviest: ProfileSummary[] = [];
+
+  constructor(private readonly keep: number) {}
+
+  add(profile: CapturedProfile): void {
+    const { summary } = profile;
+    this.slowest = [...this.slowest, summary].sort((a, b) => b.duration_ms - a.duration_ms).slice(0, this.keep);
+    this.heaviest = [...this.heaviest, summary].sort((a, b) => b.allocated_bytes - a.allocated_bytes).slice(0, this.keep);
+
+    this.profiles.set(summary.id, profile);
+    const kept = new Set([...this.slowest, ...this.heaviest].map(entry => entry.id));
+    for (const id of this.profiles.keys()) {
+      if (!kept.has(id)) {
+        this.profiles.delete(id);
+      }
+    }
+  }
+
+  list(): { slowest: ProfileSummary[]; heaviest: ProfileSummary[] } {
+    return { slowest: this.slowest, heaviest: this.heaviest };
+  }
+
+  get(id: string): CapturedProfile | undefined {
+    return this.profiles.get(id);
+  }
+}
+
+let session: Session | undefined;
+// The inspector profiles the whole process, so only one request is profiled at a time
+let busy = false;
+let nextId = 1;
+let store: ProfileStore | undefined;
+
+/**
+ * Whether profiling is configured (and can be served, which needs SERVER_TOKEN)
+ */
+export function profilingEnabled(): boolean {
+  if (appConfig.profileSampleRate <= 0 && !appConfig.profileOnHeader) {
+    return false;
+  }
+  if (!appConfig.serverToken) {
+    logger.warn('Profiling is configured but SERVER_TOKEN is not set; not enabling the unauthenticated debug endpoint');
+    return false;
+  }
+  return true;
+}
+
+function profileTrigger(req: Request): ProfileTrigger | undefined {
+  if (appConfig.profileOnHeader && req.header('x-profile') === '1') {
+    return 'header';
+  }
+  if (appConfig.profileSampleRate > 0 && Math.random() < appConfig.profileSampleRate) {
+    return 'sample';
+  }
+  return undefined;
+}
+
+/**
+ * Send an inspector command on the profiling session (inspector/promises needs Node 19+)
+ */
+function post<T = void>(method: string, params?: object): Promise<T> {
+  return new Promise((resolve, reject) => {
+    (session as Session).post(method, params, (error, result) => (error ? reject(error) : resolve(result as T)));
+  });
+}
+
+async function startProfilers(): Promise<void> {
+  if (!session) {
+    session = new Session();
+    session.connect();
+    await post('Profiler.enable');
+    await post('HeapProfiler.enable');
+  }
+
+  // Keep collected objects in the samples so short-lived garbage shows up as allocation
+  const sampling: HeapProfiler.StartSamplingParameterType & Record<string, unknown> = {
+    samplingInterval: HEAP_SAMPLING_INTERVAL,
+    includeObjectsCollectedByMajorGC: true,
+    includeObjectsCollectedByMinorGC: true
+  };
+  await post('HeapProfiler.startSampling', sampling);
+  await post('Profiler.start');
+}
+
+function sampledBytes(node: HeapProfiler.SamplingHeapProfileNode): number {
+  return node.children.reduce((total, child) => total + sampledBytes(child), node.selfSize);
+}
+
+/**
+ * Middleware that profiles sampled or header-flagged requests until their response closes
+ */
+export function profileRequests(req: Request, res: Response, next: NextFunction): void {
+  const trigger = profileTrigger(req);
+  if (!trigger || busy) {
+    return next();
+  }
+
+  busy = true;
+  const tool = typeof req.body?.name === 'string' ? req.body.name : undefined;
+
+  let startedAt = Date.now();
+  let started = process.hrtime.bigint();
+  let heapBefore = process.memoryUsage().heapUsed;
+
+  const starting = startProfilers();
+  res.once('close', () => {
+    starting
+      .then(() => Promise.all([
+        post<Profiler.StopReturnType>('Profiler.stop'),
+        post<HeapProfiler.StopSamplingReturnType>('HeapProfiler.stopSampling')
+      ]))
+      .then(([{ profile: cpu }, { profile: heap }]) => {
+        const summary: ProfileSummary = {
+          id: `${startedAt.toString(36)}-${nextId++}`,
+          method: req.method,
+          path: req.originalUrl,
+          ...(tool ? { tool } : {}),
+          trigger,
+          status: res.statusCode,
+          started_at_iso: new Date(startedAt).toISOString(),
+          duration_ms: Number(process.hrtime.bigint() - started) / 1e6,
+          allocated_bytes: sampledBytes(heap.head),
+          heap_delta_bytes: process.memoryUsage().heapUsed - heapBefore
+        };
+        getProfileStore().add({ summary, cpu, heap });
+        logger.info(`Profiled ${summary.method} ${summary.path} (${summary.id}): ${Math.round(summary.duration_ms)}ms, ${summary.allocated_bytes} bytes allocated`);
+      })
+      .catch(error => logger.warn('Request profiling failed:', error))
+      .finally(() => {
+        busy = false;
+      });
+  });
+
+  // Run the handler once the profilers are on (or unprofiled if they failed to start)
+  starting.then(() => {
+    startedAt = Date.now();
+    started = process.hrtime.bigint();
+    heapBefore = process.memoryUsage().heapUsed;
+    next();
+  }, () => next());
+}
+
+export function getProfileStore(): ProfileStore {
+  store ??= new ProfileStore(appConfig.profileKeep);
+  return store;
+}
+
+/**
+ * Authenticated routes listing kept profiles and serving them as
+ * .cpuprofile / .heapprofile files (open them in Chrome DevTools)
+ */
+export function profilingRouter(): Router {
+  const router = Router();
+  router.use(bearerTokenAuth);
+
+  router.get('/profiles', (req, res) => {
+    res.json(getProfileStore().list());
+  });
+
+  router.get('/profiles/:id/:kind', (req, res) => {
+    const profile = getProfileStore().get(req.params.id ?? '');
+    const kind = req.params.kind;
+    if (!profile || (kind !== 'cpu' && kind !== 'heap')) {
+      res.status(404).json({ error: 'NOT_FOUND', message: 'No such profile (it may have been evicted)' });
+      return;
+    }
+
+    const extension = kind === 'cpu' ? 'cpuprofile' : 'heapprofile';
+    res.setHeader('Content-Disposition', `attachment; filename="${profile.summary.id}.${extension}"`);
+    res.json(kind === 'cpu' ? profile.cpu : profile.heap);
+  });
+
+  return router;
+}
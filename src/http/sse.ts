@@ -0,0 +1,44 @@
+/**
+ * Server-Sent Events responses for results that arrive one at a time
+ */
+
+import { Response } from 'express';
+
+// Comment lines keep idle proxies from closing a stream between slow results
+const SSE_HEARTBEAT_MS = 15000;
+
+export interface EventStream {
+  send(event: string, data: unknown): void;
+  close(): void;
+}
+
+/**
+ * Switch a response to text/event-stream and flush the headers right away
+ */
+export function openEventStream(res: Response): EventStream {
+  res.status(200);
+  res.setHeader('Content-Type', 'text/event-stream; charset=utf-8');
+  res.setHeader('Cache-Control', 'no-cache, no-transform');
+  res.setHeader('Connection', 'keep-alive');
+  // Stop nginx-style proxies from buffering the stream
+  res.setHeader('X-Accel-Buffering', 'no');
+  res.flushHeaders();
+
+  const heartbeat = setInterval(() => res.write(': keep-alive\n\n'), SSE_HEARTBEAT_MS);
+  heartbeat.unref();
+  res.on('close', () => clearInterval(heartbeat));
+
+  return {
+    send(event: string, data: unknown): void {
+      if (!res.writableEnded) {
+        res.write(`event: ${event}\ndata: ${JSON.stringify(data)}\n\n`);
+      }
+    },
+    close(): void {
+      clearInterval(heartbeat);
+      if (!res.writableEnded) {
+        res.end();
+      }
+    }
+  };
+}
@@ -0,0 +1,41 @@
+/**
+ * Callback route for Apify run webhooks (enabled by APIFY_WEBHOOK_URL)
+ */
+
+import { Request, Response } from 'express';
+import { timingSafeEqual } from 'crypto';
+import pino from 'pino';
+import { appConfig } from '../config.js';
+import { publishRunFinished } from '../adapters/index.js';
+
+const logger = pino({ name: 'webhooks' });
+
+export const APIFY_WEBHOOK_PATH = '/webhooks/apify';
+
+function secretMatches(received: string | undefined): boolean {
+  const expected = Buffer.from(appConfig.apifyWebhookSecret ?? '');
+  const actual = Buffer.from(received ?? '');
+  return expected.length > 0 && actual.length === expected.length && timingSafeEqual(actual, expected);
+}
+
+/**
+ * Wake the scrape waiting on the run named in an Apify webhook payload
+ * (default payload: eventData.actorRunId, with the run itself under resource)
+ */
+export function apifyWebhookHandler(req: Request, res: Response): void {
+  if (!secretMatches(req.header('x-apify-webhook-secret'))) {
+    logger.warn('Rejected Apify webhook with a missing or wrong secret');
+    res.status(401).json({ error: 'Unauthorized', message: 'Invalid webhook secret' });
+    return;
+  }
+
+  const runId = req.body?.eventData?.actorRunId ?? req.body?.resource?.id;
+  if (typeof runId !== 'string' || !runId) {
+    res.status(400).json({ error: 'INVALID_INPUT', message: 'Webhook payload has no actor run id' });
+    return;
+  }
+
+  logger.info(`Apify webhook ${req.body?.eventType ?? 'event'} for run ${runId}`);
+  publishRunFinished(runId);
+  res.status(202).json({ received: true });
+}
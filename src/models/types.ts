@@ -55,19 +55,104 @@ export const PostSchema = z.object({
   inferred_themes: z.array(z.string()).default([]).describe("Detected themes")
 });
 
+// Post fields a client can project responses down to
+export type PostField = keyof Post;
+
+export const PostFieldSchema = z.enum([
+  "platform", "post_id", "url", "created_at_iso", "text", "hashtags", "mentions", "engagement", "inferred_themes"
+]);
+
+// Per-platform fetch status (used by merged cross-platform bundles)
+export interface PlatformStatus {
+  status: 'ok' | 'error' | 'skipped';
+  total_found: number;
+  error?: string;
+}
+
+export const PlatformStatusSchema = z.object({
+  status: z.enum(['ok', 'error', 'skipped']).describe("Outcome of the platform fetch"),
+  total_found: z.number().default(0).describe("Posts returned by this platform"),
+  error: z.string().optional().describe("Error message when the fetch failed")
+});
+
+// What a response budget (max_chars / max_tokens) trimmed from a bundle
+export interface CompactionReport {
+  budget_chars: number;
+  output_chars: number;
+  posts_in: number;
+  posts_kept: number;
+  posts_dropped: number;
+  texts_truncated: number;
+}
+
+export const CompactionReportSchema = z.object({
+  budget_chars: z.number().describe("Character budget applied"),
+  output_chars: z.number().describe("Size of the compacted response"),
+  posts_in: z.number().describe("Posts before compaction"),
+  posts_kept: z.number().describe("Posts that fit the budget"),
+  posts_dropped: z.number().describe("Lowest-ranked posts left out"),
+  texts_truncated: z.number().describe("Kept posts whose text was shortened")
+});
+
+// What a delta response (sent with a previous cursor) left out
+export interface DeltaReport {
+  since_iso: string;
+  changed_posts: number;
+  unchanged_posts: number;
+  reset?: boolean;
+}
+
+export const DeltaReportSchema = z.object({
+  since_iso: z.string().describe("When the client's cursor was issued"),
+  changed_posts: z.number().describe("New or changed posts included"),
+  unchanged_posts: z.number().describe("Posts the client already has, left out"),
+  reset: z.boolean().optional().describe("Cursor belonged to another person; full bundle returned")
+});
+
+// How a progressive fetch ended (small first page, expanded only when its themes were unclear)
+export interface ProgressiveReport {
+  requested_limit: number;
+  first_page: number;
+  expanded: boolean;
+  theme_coverage: number;
+  top_theme_share: number;
+  stable: boolean;
+}
+
+export const ProgressiveReportSchema = z.object({
+  requested_limit: z.number().describe("Limit the caller asked for"),
+  first_page: z.number().describe("Posts scraped in the first, small page"),
+  expanded: z.boolean().describe("Whether a second scrape fetched the full limit"),
+  theme_coverage: z.number().describe("Share of first-page posts with at least one theme"),
+  top_theme_share: z.number().describe("Share of first-page posts carrying the most common theme"),
+  stable: z.boolean().describe("Most common theme leads in both halves of the first page")
+});
+
 // Meta model
 export interface Meta {
   source: string;
   fetched_at_iso: string;
   limit: number;
   total_found: number;
+  platform_status?: Partial<Record<Platform, PlatformStatus>>;
+  compaction?: CompactionReport;
+  cursor?: string;
+  delta?: DeltaReport;
+  stale?: boolean;
+  progressive?: ProgressiveReport;
 }
 
 export const MetaSchema = z.object({
   source: z.string().describe("MCP server name that fetched data"),
   fetched_at_iso: z.string().describe("ISO 8601 fetch timestamp"),
   limit: z.number().describe("Requested post limit"),
-  total_found: z.number().default(0).describe("Total posts found")
+  total_found: z.number().default(0).describe("Total posts found"),
+  platform_status: z.record(PlatformSchema, PlatformStatusSchema).optional().describe("Per-platform fetch status"),
+  compaction: CompactionReportSchema.optional().describe("What a response budget trimmed"),
+  cursor: z.string().optional().describe("Opaque cursor; send it back to get only new or changed posts"),
+  delta: DeltaReportSchema.optional().describe("What a cursor-based response left out"),
+  stale: z.boolean().optional().describe("Served from an expired cache entry because the scraper is unavailable"),
+  progressive: ProgressiveReportSchema.optional().describe("How a progressive fetch ended")
 });
 
 // Bundle model
@@ -117,13 +202,57 @@ export enum ErrorType {
   COOKIE_EXPIRED = "COOKIE_EXPIRED",
   APIFY_RUN_ERROR = "APIFY_RUN_ERROR",
   APOLLO_AUTH_ERROR = "APOLLO_AUTH_ERROR",
-  INSUFFICIENT_DATA = "INSUFFICIENT_DATA"
+  INSUFFICIENT_DATA = "INSUFFICIENT_DATA",
+  DEADLINE_EXCEEDED = "DEADLINE_EXCEEDED",
+  CIRCUIT_OPEN = "CIRCUIT_OPEN"
 }
 
 // Input schemas for MCP tools
+export const ResponseBudgetSchema = z.object({
+  max_chars: z.number().min(200).optional().describe("Maximum response size in characters"),
+  max_tokens: z.number().min(50).optional().describe("Maximum response size in tokens (approximate)")
+});
+
+export const ResponseFormatSchema = z.object({
+  fields: z.array(PostFieldSchema).min(1).optional().describe("Only return these post fields"),
+  compact: z.boolean().default(false).describe("Serialize without indentation"),
+  cursor: z.string().optional().describe("meta.cursor from a previous call; only new or changed posts are returned")
+});
+
+export const ProgressiveFetchSchema = z.object({
+  progressive: z.boolean().optional().describe("Scrape a small first page and fetch the full limit only if its themes are unclear")
+});
+
 export const GetPostsInputSchema = z.object({
   handle: z.string().describe("Username/handle (without @)"),
   limit: z.number().min(1).max(100).default(20).describe("Number of posts to fetch")
+}).merge(ResponseBudgetSchema).merge(ResponseFormatSchema).merge(ProgressiveFetchSchema);
+
+export const GetPersonPostsInputSchema = z.object({
+  x_handle: z.string().optional().describe("X/Twitter handle (without @)"),
+  linkedin_url: z.string().url().optional().describe("LinkedIn profile URL"),
+  x_limit: z.number().min(1).max(100).default(20).describe("Number of X posts to fetch"),
+  linkedin_limit: z.number().min(1).max(50).default(10).describe("Number of LinkedIn posts to fetch")
+}).merge(ResponseBudgetSchema).merge(ResponseFormatSchema).refine(input => Boolean(input.x_handle?.replace('@', '').trim() || input.linkedin_url), {
+  message: "INVALID_INPUT: Provide x_handle, linkedin_url or both"
+});
+
+export const SearchTopicsInputSchema = z.object({
+  query: z.string().min(1).describe("Topic to search for, e.g. 'fundraising'"),
+  k: z.number().min(1).max(50).default(10).describe("Number of people to return"),
+  posts_per_person: z.number().min(1).max(20).default(5).describe("Matching post IDs returned per person")
+});
+
+export const FilterPostsInputSchema = z.object({
+  since_days: z.number().min(0).optional().describe("Only posts from the last N days"),
+  platform: PlatformSchema.optional().describe("Only posts from this platform"),
+  min_likes: z.number().min(0).optional().describe("Minimum like count"),
+  min_reposts: z.number().min(0).optional().describe("Minimum retweets/shares"),
+  min_replies: z.number().min(0).optional().describe("Minimum replies/comments"),
+  themes: z.array(z.string()).optional().describe("Posts must carry all of these inferred themes"),
+  person_keys: z.array(z.string()).optional().describe("Restrict to these people, e.g. 'x:jack'"),
+  text: z.string().optional().describe("Case-insensitive text the post must contain"),
+  limit: z.number().min(1).max(200).default(50).describe("Maximum posts to return, newest first")
 });
 
 export const FetchContextsInputSchema = z.object({
@@ -143,6 +272,12 @@ export const SuggestOpenersInputSchema = z.object({
   tone_options: z.array(z.string()).default(["casual", "professional", "playful"])
 });
 
+export const BatchOpenersInputSchema = z.object({
+  people: z.array(FetchContextsInputSchema).min(1).max(200).describe("Attendees to prepare openers for"),
+  tone_options: z.array(z.string()).default(["casual", "professional", "playful"]),
+  concurrency: z.number().int().min(1).max(8).default(4).describe("People processed at the same time")
+});
+
 // Response types
 export interface FetchContextsResponse {
   linkedin_context: string;
@@ -161,4 +296,20 @@ export interface OpenerSuggestion {
 export interface SuggestOpenersResponse {
   openers: OpenerSuggestion[];
   warnings: string[];
+}
+
+export interface PersonOpenersResult {
+  // Position in the request's people array (results arrive in completion order)
+  index: number;
+  first_name: string;
+  last_name: string;
+  contexts?: FetchContextsResponse;
+  openers?: OpenerSuggestion[];
+  error?: { type: string; message: string };
+}
+
+export interface BatchOpenersResponse {
+  results: PersonOpenersResult[];
+  succeeded: number;
+  failed: number;
 }
\ No newline at end of file
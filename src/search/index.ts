@@ -0,0 +1 @@
+export * from './post-index.js';
\ No newline at end of file
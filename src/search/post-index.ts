@@ -0,0 +1,302 @@
+/**
+ * BM25 inverted index over fetched posts, for "who here talks about X" queries
+ */
+
+import pino from 'pino';
+import { Bundle, Person } from '../models/index.js';
+import { BundleCache, onBundle } from '../storage/index.js';
+
+const logger = pino({ name: 'post-index' });
+
+// BM25 parameters
+const K1 = 1.2;
+const B = 0.75;
+
+// Inferred themes and hashtags count as this many occurrences of their term
+const THEME_WEIGHT = 3;
+const HASHTAG_WEIGHT = 2;
+
+const STOPWORDS = new Set([
+  'a', 'an', 'and', 'are', 'as', 'at', 'be', 'but', 'by', 'for', 'from', 'has', 'have', 'he', 'her', 'his',
+  'i', 'if', 'in', 'is', 'it', 'its', 'me', 'my', 'of', 'on', 'or', 'our', 'she', 'so', 'that', 'the',
+  'their', 'them', 'they', 'this', 'to', 'us', 'was', 'we', 'were', 'what', 'who', 'will', 'with', 'you', 'your',
+  'about', 'talks', 'posts', 'here', 'event'
+]);
+
+export interface TopicMatch {
+  person_key: string;
+  person: Person;
+  score: number;
+  matching_post_ids: string[];
+}
+
+export interface TopicSearchResult {
+  query: string;
+  terms: string[];
+  results: TopicMatch[];
+  indexed_people: number;
+  indexed_posts: number;
+}
+
+interface Postings {
+  docs: number[];
+  tfs: number[];
+  // Live documents containing the term (postings keep removed docs until compaction)
+  df: number;
+}
+
+interface IndexedPerson {
+  key: string;
+  person: Person;
+  fetchedAt: string;
+  docs: number[];
+}
+
+/**
+ * Lowercased word tokens without stopwords; theme names like ai_agents stay whole
+ */
+export function tokenize(text: string): string[] {
+  return (text.toLowerCase().match(/[\p{L}\p{N}_]+/gu) || [])
+    .filter(token => token.length > 1 && !STOPWORDS.has(token));
+}
+
+export class PostSearchIndex {
+  private postings = new Map<string, Postings>();
+  private people = new Map<string, IndexedPerson>();
+
+  // Per-document columns, indexed by doc id
+  private docPerson: string[] = [];
+  private docPostId: string[] = [];
+  private docLength: number[] = [];
+  private docTerms: string[][] = [];
+  private docAlive: boolean[] = [];
+
+  private liveDocs = 0;
+  private liveLength = 0;
+  private deadDocs = 0;
+
+  /**
+   * Index (or re-index) one person's bundle, replacing their previous posts
+   */
+  addBundle(personKey: string, bundle: Bundle): void {
+    const existing = this.people.get(personKey);
+    if (existing && existing.fetchedAt === bundle.meta.fetched_at_iso) {
+      return;
+    }
+
+    if (existing) {
+      this.removeDocs(existing.docs);
+    }
+
+    const docs: number[] = [];
+    for (const post of bundle.posts) {
+      const termFrequencies = new Map<string, number>();
+      const addTerms = (tokens: string[], weight: number): void => {
+        for (const token of tokens) {
+          termFrequencies.set(token, (termFrequencies.get(token) || 0) + weight);
+        }
+      };
+
+      addTerms(tokenize(post.text), 1);
+      addTerms(post.hashtags.flatMap(tokenize), HASHTAG_WEIGHT);
+      addTerms(post.inferred_themes.flatMap(theme => [theme, ...tokenize(theme.replace(/_/g, ' '))]), THEME_WEIGHT);
+
+      const docId = this.docPerson.length;
+      let length = 0;
+      for (const [term, tf] of termFrequencies) {
+        let postings = this.postings.get(term);
+        if (!postings) {
+          postings = { docs: [], tfs: [], df: 0 };
+          this.postings.set(term, postings);
+        }
+        postings.docs.push(docId);
+        postings.tfs.push(tf);
+        postings.df++;
+        length += tf;
+      }
+
+      this.docPerson.push(personKey);
+      this.docPostId.push(post.post_id);
+      this.docLength.push(length);
+      this.docTerms.push(Array.from(termFrequencies.keys()));
+      this.docAlive.push(true);
+      this.liveDocs++;
+      this.liveLength += length;
+      docs.push(docId);
+    }
+
+    this.people.set(personKey, {
+      key: personKey,
+      person: bundle.person,
+      fetchedAt: bundle.meta.fetched_at_iso,
+      docs
+    });
+
+    if (this.deadDocs > this.liveDocs) {
+      this.compact();
+    }
+  }
+
+  /**
+   * Rank people by the BM25 scores of their matching posts
+   */
+  search(query: string, k: number = 10, postsPerPerson: number = 5): TopicSearchResult {
+    const terms = Array.from(new Set(tokenize(query)));
+    const docScores = new Map<number, number>();
+
+    if (this.liveDocs > 0) {
+      const avgLength = this.liveLength / this.liveDocs;
+
+      for (const term of terms) {
+        const postings = this.postings.get(term);
+        if (!postings || postings.df === 0) {
+          continue;
+        }
+
+        const idf = Math.log(1 + (this.liveDocs - postings.df + 0.5) / (postings.df + 0.5));
+        for (let i = 0; i < postings.docs.length; i++) {
+          const docId = postings.docs[i] as number;
+          if (!this.docAlive[docId]) {
+            continue;
+          }
+          const tf = postings.tfs[i] as number;
+          const norm = K1 * (1 - B + B * (this.docLength[docId] as number) / avgLength);
+          docScores.set(docId, (docScores.get(docId) || 0) + idf * (tf * (K1 + 1)) / (tf + norm));
+        }
+      }
+    }
+
+    // Aggregate post scores per person
+    const byPerson = new Map<string, { score: number; posts: Array<{ postId: string; score: number }> }>();
+    for (const [docId, score] of docScores) {
+      const personKey = this.docPerson[docId] as string;
+      let entry = byPerson.get(personKey);
+      if (!entry) {
+        entry = { score: 0, posts: [] };
+        byPerson.set(personKey, entry);
+      }
+      entry.score += score;
+      entry.posts.push({ postId: this.docPostId[docId] as string, score });
+    }
+
+    const results: TopicMatch[] = Array.from(byPerson.entries())
+      .sort(([, a], [, b]) => b.score - a.score)
+      .slice(0, k)
+      .map(([personKey, entry]) => ({
+        person_key: personKey,
+        person: (this.people.get(personKey) as IndexedPerson).person,
+        score: Math.round(entry.score * 1000) / 1000,
+        matching_post_ids: entry.posts
+          .sort((a, b) => b.score - a.score)
+          .slice(0, postsPerPerson)
+          .map(post => post.postId)
+      }));
+
+    return {
+      query,
+      terms,
+      results,
+      indexed_people: this.people.size,
+      indexed_posts: this.liveDocs
+    };
+  }
+
+  /**
+   * Index everything already in the cache (e.g. warmed by the prefetch command)
+   */
+  async seedFrom(cache: BundleCache): Promise<void> {
+    const started = Date.now();
+    for (const key of await cache.keys()) {
+      if (this.people.has(key)) {
+        continue;
+      }
+      const cached = await cache.get(key);
+      if (cached) {
+        this.addBundle(key, cached.bundle);
+      }
+    }
+    logger.info(`Indexed ${this.liveDocs} posts from ${this.people.size} people in ${Date.now() - started}ms`);
+  }
+
+  private removeDocs(docIds: number[]): void {
+    for (const docId of docIds) {
+      if (!this.docAlive[docId]) {
+        continue;
+      }
+      this.docAlive[docId] = false;
+      this.liveDocs--;
+      this.liveLength -= this.docLength[docId] as number;
+      this.deadDocs++;
+
+      for (const term of this.docTerms[docId] ?? []) {
+        const postings = this.postings.get(term);
+        if (postings) {
+          postings.df--;
+        }
+      }
+    }
+  }
+
+  /**
+   * Drop removed documents from the postings and renumber live ones
+   */
+  private compact(): void {
+    const remap = new Int32Array(this.docPerson.length).fill(-1);
+    const docPerson: string[] = [];
+    const docPostId: string[] = [];
+    const docLength: number[] = [];
+    const docTerms: string[][] = [];
+
+    for (let docId = 0; docId < this.docPerson.length; docId++) {
+      if (this.docAlive[docId]) {
+        remap[docId] = docPerson.length;
+        docPerson.push(this.docPerson[docId] as string);
+        docPostId.push(this.docPostId[docId] as string);
+        docLength.push(this.docLength[docId] as number);
+        docTerms.push(this.docTerms[docId] ?? []);
+      }
+    }
+
+    for (const [term, postings] of this.postings) {
+      const docs: number[] = [];
+      const tfs: number[] = [];
+      for (let i = 0; i < postings.docs.length; i++) {
+        const mapped = remap[postings.docs[i] as number] as number;
+        if (mapped >= 0) {
+          docs.push(mapped);
+          tfs.push(postings.tfs[i] as number);
+        }
+      }
+      if (docs.length === 0) {
+        this.postings.delete(term);
+      } else {
+        this.postings.set(term, { docs, tfs, df: docs.length });
+      }
+    }
+
+    for (const person of this.people.values()) {
+      person.docs = person.docs.map(docId => remap[docId] as number).filter(docId => docId >= 0);
+    }
+
+    this.docPerson = docPerson;
+    this.docPostId = docPostId;
+    this.docLength = docLength;
+    this.docTerms = docTerms;
+    this.docAlive = docPerson.map(() => true);
+    this.deadDocs = 0;
+  }
+}
+
+let sharedIndex: PostSearchIndex | undefined;
+
+/**
+ * Process-wide index, kept current by every bundle the tools publish
+ */
+export function getPostIndex(): PostSearchIndex {
+  if (!sharedIndex) {
+    const index = new PostSearchIndex();
+    onBundle((key, bundle) => index.addBundle(key, bundle));
+    sharedIndex = index;
+  }
+  return sharedIndex;
+}
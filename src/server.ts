@@ -4,20 +4,82 @@
 
 import { Server } from '@modelcontextprotocol/sdk/server/index.js';
 import { StdioServerTransport } from '@modelcontextprotocol/sdk/server/stdio.js';
-import { CallToolRequestSchema, ListToolsRequestSchema } from '@modelcontextprotocol/sdk/types.js';
+import {
+  CallToolRequestSchema,
+  CallToolResult,
+  ListResourcesRequestSchema,
+  ListResourcesResult,
+  ListToolsRequestSchema,
+  ListToolsResult,
+  ReadResourceRequestSchema,
+  ReadResourceResult
+} from '@modelcontextprotocol/sdk/types.js';
+import cluster from 'cluster';
 import express from 'express';
 import cors from 'cors';
 import pino from 'pino';
+import { monitorEventLoopDelay } from 'perf_hooks';
 import { appConfig, validateConfig } from './config.js';
 import { XTools, LinkedInTools, SocialTools } from './tools/index.js';
+import { Deadline } from './utils/index.js';
+import { BatchOpenersInputSchema, PersonOpenersResult, Platform } from './models/index.js';
+import { bundleCacheKey, bundleForLimit, freshForMs, getBundleCache, staleBundle } from './storage/index.js';
+import {
+  APIFY_WEBHOOK_PATH,
+  NO_STORE,
+  apifyWebhookHandler,
+  cacheControl,
+  compressJson,
+  joinCluster,
+  openEventStream,
+  profileRequests,
+  profilingEnabled,
+  precomputeJson,
+  profilingRouter,
+  runPrimary,
+  sendCacheableJson,
+  sendPrecomputed
+} from './http/index.js';
+import { actorHealth, pendingRunCount } from './adapters/index.js';
+import { getTrafficRecorder, redact } from './capture/index.js';
 
 const logger = pino({ name: 'mcp-server' });
 
+// Event-loop delay over the last minute, reported by /health to spot blocking work
+const LOOP_DELAY_WINDOW_MS = 60000;
+
+// Read-only GET caching: tool definitions change only on deploy, and context documents
+// are written once under a fresh UUID, so neither needs revalidating often
+const TOOL_LIST_CACHE = cacheControl({ maxAgeSeconds: 300, staleWhileRevalidateSeconds: 86400 });
+const RESOURCE_MAX_AGE_SECONDS = 86400;
+// Browsers recheck cached bundles often; the CDN keeps them until the bundle expires
+const BUNDLE_MAX_AGE_SECONDS = 60;
+const BUNDLE_STALE_WHILE_REVALIDATE_SECONDS = 3600;
+
+/**
+ * Clamp a client-supplied time budget (ms) to the server's own timeout for the tool:
+ * BATCH_TIMEOUT_MS for batch_openers, REQUEST_TIMEOUT_MS for everything else
+ */
+function resolveBudgetMs(clientBudget: unknown, toolName?: unknown): number {
+  const ceiling = toolName === 'social.batch_openers' ? appConfig.batchTimeoutMs : appConfig.requestTimeoutMs;
+  const budget = typeof clientBudget === 'string' ? Number(clientBudget) : clientBudget;
+  if (typeof budget === 'number' && Number.isFinite(budget) && budget > 0) {
+    return Math.min(budget, ceiling);
+  }
+  return ceiling;
+}
+
+function resourceMimeType(uri: string): string {
+  return uri.endsWith('.md') ? 'text/markdown' : 'text/plain';
+}
+
 class SimpleMCPServer {
   private server: Server;
   private xTools: XTools;
   private linkedinTools: LinkedInTools;
   private socialTools: SocialTools;
+  // Tool definitions never change at runtime, so tools/list is built once
+  private toolList: ListToolsResult;
 
   constructor() {
     this.server = new Server(
@@ -36,95 +98,244 @@ class SimpleMCPServer {
     this.xTools = new XTools();
     this.linkedinTools = new LinkedInTools();
     this.socialTools = new SocialTools();
+    this.toolList = this.buildToolList();
 
     this.setupHandlers();
   }
 
   private setupHandlers(): void {
     // List available tools
-    this.server.setRequestHandler(ListToolsRequestSchema, async () => {
-      return {
-        tools: [
-          this.xTools.getToolDefinition(),
-          this.linkedinTools.getToolDefinition(),
-          this.socialTools.getFetchContextsToolDefinition(),
-          this.socialTools.getSuggestOpenersToolDefinition()
-        ]
-      };
-    });
+    this.server.setRequestHandler(ListToolsRequestSchema, async () => this.listTools());
 
     // Handle tool calls
-    this.server.setRequestHandler(CallToolRequestSchema, async (request) => {
-      const { name, arguments: args } = request.params;
+    this.server.setRequestHandler(CallToolRequestSchema, async (request, extra) => {
+      const { name, arguments: args, _meta } = request.params;
+      const deadline = Deadline.fromBudget(resolveBudgetMs(_meta?.timeout_ms, name), extra.signal);
+
+      // Partial results go out as progress notifications when the client asked for them
+      const progressToken = _meta?.progressToken;
+      let progress = 0;
+      const onProgress = progressToken === undefined ? undefined : (message: string) => {
+        extra.sendNotification({
+          method: 'notifications/progress',
+          params: { progressToken, progress: ++progress, message }
+        }).catch(error => logger.warn('Failed to send progress notification:', error));
+      };
 
       try {
-        switch (name) {
-          case 'get_x_posts':
-            const xResult = await this.xTools.execute(args);
-            return {
-              content: [
-                {
-                  type: 'text',
-                  text: xResult
-                }
-              ]
-            };
-
-          case 'get_linkedin_posts':
-            const linkedinResult = await this.linkedinTools.execute(args);
-            return {
-              content: [
-                {
-                  type: 'text',
-                  text: linkedinResult
-                }
-              ]
-            };
-
-          case 'social.fetch_contexts':
-            const contextsResult = await this.socialTools.executeFetchContexts(args);
-            return {
-              content: [
-                {
-                  type: 'text',
-                  text: contextsResult
-                }
-              ]
-            };
-
-          case 'social.suggest_openers':
-            const openersResult = await this.socialTools.executeSuggestOpeners(args);
-            return {
-              content: [
-                {
-                  type: 'text',
-                  text: openersResult
-                }
-              ]
-            };
-
-          default:
-            throw new Error(`Unknown tool: ${name}`);
-        }
-      } catch (error) {
-        logger.error(`Tool execution failed for ${name}:`, error);
-
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify({
-                error: 'TOOL_EXECUTION_FAILED',
-                message: error instanceof Error ? error.message : 'Unknown error',
-                tool: name,
-                timestamp: new Date().toISOString()
-              }, null, 2)
-            }
-          ],
-          isError: true
-        };
+        return await this.callTool(name, args, deadline, onProgress);
+      } finally {
+        deadline.dispose();
       }
     });
+
+    // Stored context documents, paginated; `prefix` is an optional extension param
+    this.server.setRequestHandler(ListResourcesRequestSchema, async request =>
+      this.listResources(request.params?.prefix, request.params?.cursor)
+    );
+
+    this.server.setRequestHandler(ReadResourceRequestSchema, async request => this.readResource(request.params.uri));
+  }
+
+  /**
+   * Build one page of the resources/list response
+   */
+  listResources(prefix?: unknown, cursor?: unknown): ListResourcesResult {
+    const page = this.socialTools.listResources(
+      typeof prefix === 'string' ? prefix : undefined,
+      typeof cursor === 'string' ? cursor : undefined
+    );
+    return {
+      resources: page.uris.map(uri => ({
+        uri,
+        name: uri.slice(uri.lastIndexOf('/') + 1),
+        mimeType: resourceMimeType(uri)
+      })),
+      ...(page.nextCursor ? { nextCursor: page.nextCursor } : {})
+    };
+  }
+
+  /**
+   * Build the resources/read response for one stored document
+   */
+  async readResource(uri: string): Promise<ReadResourceResult> {
+    const text = await this.socialTools.getResource(uri);
+    if (text === undefined) {
+      throw new Error(`NOT_FOUND: No resource ${uri}`);
+    }
+    return {
+      contents: [{ uri, mimeType: resourceMimeType(uri), text }]
+    };
+  }
+
+  /**
+   * The tools/list response (built once at startup)
+   */
+  listTools(): ListToolsResult {
+    return this.toolList;
+  }
+
+  private buildToolList(): ListToolsResult {
+    return {
+      tools: [
+        this.xTools.getToolDefinition(),
+        this.linkedinTools.getToolDefinition(),
+        this.socialTools.getFetchContextsToolDefinition(),
+        this.socialTools.getSuggestOpenersToolDefinition(),
+        this.socialTools.getBatchOpenersToolDefinition(),
+        this.socialTools.getPersonPostsToolDefinition(),
+        this.socialTools.getSearchTopicsToolDefinition(),
+        this.socialTools.getFilterPostsToolDefinition()
+      ]
+    };
+  }
+
+  /**
+   * Run a tool call, recording it for replays when CAPTURE_PATH is set.
+   * Tools with partial results (batch_openers) report each one through onProgress.
+   */
+  async callTool(name: string, args: unknown, deadline: Deadline, onProgress?: (message: string) => void): Promise<CallToolResult> {
+    const recorder = getTrafficRecorder();
+    if (!recorder) {
+      return this.dispatchTool(name, args, deadline, onProgress);
+    }
+
+    const arrivedAt = Date.now();
+    let ok = false;
+    try {
+      const result = await this.dispatchTool(name, args, deadline, onProgress);
+      ok = !result.isError;
+      return result;
+    } finally {
+      recorder.record({ type: 'tool_call', at_ms: arrivedAt, name, arguments: redact(args), duration_ms: Date.now() - arrivedAt, ok });
+    }
+  }
+
+  /**
+   * Dispatch a tool call; every upstream fetch shares the request deadline
+   */
+  private async dispatchTool(
+    name: string,
+    args: unknown,
+    deadline: Deadline,
+    onProgress?: (message: string) => void
+  ): Promise<CallToolResult> {
+    const options = { deadline };
+
+    try {
+      switch (name) {
+        case 'get_x_posts':
+          const xResult = await this.xTools.execute(args, options);
+          return {
+            content: [
+              {
+                type: 'text',
+                text: xResult
+              }
+            ]
+          };
+
+        case 'get_linkedin_posts':
+          const linkedinResult = await this.linkedinTools.execute(args, options);
+          return {
+            content: [
+              {
+                type: 'text',
+                text: linkedinResult
+              }
+            ]
+          };
+
+        case 'social.fetch_contexts':
+          const contextsResult = await this.socialTools.executeFetchContexts(args, options);
+          return {
+            content: [
+              {
+                type: 'text',
+                text: contextsResult
+              }
+            ]
+          };
+
+        case 'social.suggest_openers':
+          const openersResult = await this.socialTools.executeSuggestOpeners(args);
+          return {
+            content: [
+              {
+                type: 'text',
+                text: openersResult
+              }
+            ]
+          };
+
+        case 'social.batch_openers':
+          const batchResult = await this.socialTools.executeBatchOpeners(args, {
+            ...options,
+            onResult: result => onProgress?.(JSON.stringify(result))
+          });
+          return {
+            content: [
+              {
+                type: 'text',
+                text: batchResult
+              }
+            ]
+          };
+
+        case 'social.get_person_posts':
+          const personPostsResult = await this.socialTools.executeGetPersonPosts(args, options);
+          return {
+            content: [
+              {
+                type: 'text',
+                text: personPostsResult
+              }
+            ]
+          };
+
+        case 'social.search_topics':
+          const searchResult = await this.socialTools.executeSearchTopics(args);
+          return {
+            content: [
+              {
+                type: 'text',
+                text: searchResult
+              }
+            ]
+          };
+
+        case 'social.filter_posts':
+          const filterResult = await this.socialTools.executeFilterPosts(args);
+          return {
+            content: [
+              {
+                type: 'text',
+                text: filterResult
+              }
+            ]
+          };
+
+        default:
+          throw new Error(`Unknown tool: ${name}`);
+      }
+    } catch (error) {
+      logger.error(`Tool execution failed for ${name}:`, error);
+
+      return {
+        content: [
+          {
+            type: 'text',
+            text: JSON.stringify({
+              error: 'TOOL_EXECUTION_FAILED',
+              message: error instanceof Error ? error.message : 'Unknown error',
+              tool: name,
+              timestamp: new Date().toISOString()
+            }, null, 2)
+          }
+        ],
+        isError: true
+      };
+    }
   }
 
   /**
@@ -151,41 +362,123 @@ class SimpleMCPServer {
       credentials: true
     }));
     app.use(express.json({ limit: '1mb' }));
+    app.use(compressJson);
+
+    // Opt-in profiling; nothing is installed unless PROFILE_SAMPLE_RATE or PROFILE_ON_HEADER is set
+    if (profilingEnabled()) {
+      app.use('/mcp', profileRequests);
+      app.use('/debug', profilingRouter());
+      logger.info(`Request profiling on (sample rate ${appConfig.profileSampleRate}, X-Profile header ${appConfig.profileOnHeader ? 'honoured' : 'ignored'})`);
+    }
+
+    const loopDelay = monitorEventLoopDelay({ resolution: 20 });
+    loopDelay.enable();
+    setInterval(() => loopDelay.reset(), LOOP_DELAY_WINDOW_MS).unref();
 
     // Health check endpoints
     app.get('/health', (req, res) => {
-      res.json({ status: 'ok', timestamp: new Date().toISOString() });
+      res.json({
+        status: 'ok',
+        timestamp: new Date().toISOString(),
+        event_loop_delay_ms: {
+          p99: Math.round(loopDelay.percentile(99) / 1e4) / 100,
+          max: Math.round(loopDelay.max / 1e4) / 100
+        },
+        actors: actorHealth(),
+        pending_runs: pendingRunCount()
+      });
     });
 
     app.get('/healthz', (req, res) => {
       res.send('OK');
     });
 
-    // MCP endpoints
-    app.post('/mcp/tools/list', async (req, res) => {
+    // Apify calls back here when a run started with a webhook finishes
+    if (appConfig.apifyWebhookUrl) {
+      app.post(APIFY_WEBHOOK_PATH, apifyWebhookHandler);
+    }
+
+    // MCP endpoints; tools/list is served from bytes serialized and compressed once, with an ETag
+    const toolListBytes = precomputeJson(this.listTools());
+    app.get('/mcp/tools/list', (req, res) => sendPrecomputed(req, res, toolListBytes, TOOL_LIST_CACHE));
+    app.post('/mcp/tools/list', (req, res) => sendPrecomputed(req, res, toolListBytes));
+
+    app.post('/mcp/resources/list', (req, res) => {
       try {
-        const result = await this.server.request(
-          { method: 'tools/list' },
-          ListToolsRequestSchema
-        );
-        res.json(result);
+        res.json(this.listResources(req.body?.prefix, req.body?.cursor));
       } catch (error) {
-        logger.error('Error listing tools:', error);
-        res.status(500).json({ error: 'Internal server error' });
+        res.status(400).json({ error: 'Invalid request', message: error instanceof Error ? error.message : 'Unknown error' });
+      }
+    });
+
+    // Context documents by URI, e.g. GET /mcp/resources/read?uri=resource://contexts/combined/<id>.md
+    app.get('/mcp/resources/read', async (req, res) => {
+      let result: ReadResourceResult;
+      try {
+        result = await this.readResource(String(req.query.uri ?? ''));
+      } catch (error) {
+        res.setHeader('Cache-Control', NO_STORE);
+        res.status(404).json({ error: 'Not found', message: error instanceof Error ? error.message : 'Unknown error' });
+        return;
+      }
+      sendCacheableJson(req, res, result, { maxAgeSeconds: RESOURCE_MAX_AGE_SECONDS, immutable: true });
+    });
+
+    // Cached bundles by person, e.g. GET /mcp/bundles/x?id=jack&limit=10. Read-only: never starts
+    // a scrape. Fresh bundles may be cached until they expire; expired ones come back as stale.
+    app.get('/mcp/bundles/:platform', async (req, res) => {
+      res.setHeader('Cache-Control', NO_STORE);
+      const platform = req.params.platform;
+      const id = typeof req.query.id === 'string' ? req.query.id.trim() : '';
+      const limit = req.query.limit === undefined ? undefined : Number(req.query.limit);
+      if ((platform !== Platform.X && platform !== Platform.LINKEDIN) || !id || (limit !== undefined && !(limit >= 1))) {
+        res.status(400).json({ error: 'INVALID_INPUT', message: 'Use /mcp/bundles/x or /mcp/bundles/linkedin with ?id=<handle or profile URL> and an optional positive limit' });
+        return;
+      }
+
+      try {
+        const entry = await getBundleCache().get(bundleCacheKey(platform, id));
+        const remainingMs = entry ? freshForMs(entry) : 0;
+        const bundle = entry && (remainingMs > 0
+          ? bundleForLimit(entry, limit ?? entry.bundle.meta.limit)
+          : staleBundle(entry, limit ?? entry.bundle.meta.limit));
+        if (!bundle) {
+          res.status(404).json({ error: 'NOT_FOUND', message: `No cached bundle with enough posts for ${platform}:${id}; fetch it with the ${platform === Platform.X ? 'get_x_posts' : 'get_linkedin_posts'} tool` });
+          return;
+        }
+
+        const remainingSeconds = Math.min(remainingMs, 365 * 24 * 60 * 60 * 1000) / 1000;
+        sendCacheableJson(req, res, bundle, remainingMs > 0
+          ? {
+            maxAgeSeconds: Math.min(BUNDLE_MAX_AGE_SECONDS, remainingSeconds),
+            sharedMaxAgeSeconds: remainingSeconds,
+            staleWhileRevalidateSeconds: BUNDLE_STALE_WHILE_REVALIDATE_SECONDS
+          }
+          : { maxAgeSeconds: 0 });
+      } catch (error) {
+        logger.error('Error reading cached bundle:', error);
+        res.status(500).json({ error: 'Bundle lookup failed', message: error instanceof Error ? error.message : 'Unknown error' });
+      }
+    });
+
+    app.post('/mcp/resources/read', async (req, res) => {
+      try {
+        res.json(await this.readResource(String(req.body?.uri ?? '')));
+      } catch (error) {
+        res.status(404).json({ error: 'Not found', message: error instanceof Error ? error.message : 'Unknown error' });
       }
     });
 
     app.post('/mcp/tools/call', async (req, res) => {
+      // Client time budget travels in X-Request-Timeout-Ms; closing the connection cancels
+      const abort = new AbortController();
+      res.on('close', () => abort.abort());
+      const deadline = Deadline.fromBudget(resolveBudgetMs(req.header('x-request-timeout-ms'), req.body?.name), abort.signal);
+
       try {
         const { name, arguments: args } = req.body;
 
-        const result = await this.server.request(
-          {
-            method: 'tools/call',
-            params: { name, arguments: args }
-          },
-          CallToolRequestSchema
-        );
+        const result = await this.callTool(name, args, deadline);
 
         res.json(result);
       } catch (error) {
@@ -194,6 +487,46 @@ class SimpleMCPServer {
           error: 'Tool execution failed',
           message: error instanceof Error ? error.message : 'Unknown error'
         });
+      } finally {
+        deadline.dispose();
+      }
+    });
+
+    // Batch openers as Server-Sent Events: one `person` event per attendee as soon as it
+    // is ready, then `done`. The batch gets BATCH_TIMEOUT_MS; closing the stream cancels it.
+    app.post('/mcp/openers/stream', async (req, res) => {
+      const input = BatchOpenersInputSchema.safeParse(req.body);
+      if (!input.success) {
+        res.status(400).json({ error: 'INVALID_INPUT', message: input.error.message });
+        return;
+      }
+
+      const abort = new AbortController();
+      res.on('close', () => abort.abort());
+      const deadline = Deadline.fromBudget(appConfig.batchTimeoutMs, abort.signal);
+      const stream = openEventStream(res);
+      let succeeded = 0;
+      let failed = 0;
+
+      try {
+        await this.socialTools.executeBatchOpeners(input.data, {
+          deadline,
+          onResult: (result: PersonOpenersResult) => {
+            if (result.error) {
+              failed++;
+            } else {
+              succeeded++;
+            }
+            stream.send('person', result);
+          }
+        });
+        stream.send('done', { succeeded, failed });
+      } catch (error) {
+        logger.error('Error streaming batch openers:', error);
+        stream.send('error', { message: error instanceof Error ? error.message : 'Unknown error' });
+      } finally {
+        deadline.dispose();
+        stream.close();
       }
     });
 
@@ -207,10 +540,18 @@ async function main(): Promise<void> {
     validateConfig();
     logger.info('Configuration validated successfully');
 
-    const mcpServer = new SimpleMCPServer();
-
     // Check if running in HTTP mode (for Vercel) or stdio mode
     if (process.env.NODE_ENV === 'production' || process.argv.includes('--http')) {
+      // With HTTP_WORKERS > 1 the primary only supervises; workers run the server below
+      if (appConfig.httpWorkers > 1 && cluster.isPrimary) {
+        runPrimary(appConfig.httpWorkers);
+        return;
+      }
+      if (cluster.isWorker) {
+        joinCluster();
+      }
+
+      const mcpServer = new SimpleMCPServer();
       const app = mcpServer.createHTTPServer();
       const port = appConfig.port;
 
@@ -221,6 +562,7 @@ async function main(): Promise<void> {
       });
     } else {
       // Default stdio mode for local testing
+      const mcpServer = new SimpleMCPServer();
       await mcpServer.runStdio();
     }
 
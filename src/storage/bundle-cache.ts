@@ -0,0 +1,208 @@
+/**
+ * Bundle cache shared by the tools and the prefetch warmer
+ */
+
+import { promises as fs } from 'fs';
+import path from 'path';
+import pino from 'pino';
+import { appConfig } from '../config.js';
+import { Bundle, Platform } from '../models/index.js';
+import { EventPack } from './event-pack.js';
+
+const logger = pino({ name: 'bundle-cache' });
+
+export interface CachedBundle {
+  key: string;
+  stored_at_iso: string;
+  bundle: Bundle;
+  // Entry from an offline event pack: also served, whatever its age or size, when a fetch fails
+  offline?: boolean;
+}
+
+export interface BundleCache {
+  get(key: string): Promise<CachedBundle | undefined>;
+  set(key: string, bundle: Bundle): Promise<void>;
+  keys(): Promise<string[]>;
+}
+
+/**
+ * Build the cache key for a person on one platform.
+ * LinkedIn URLs are reduced to host + path so http/www/trailing-slash variants share a key.
+ */
+export function bundleCacheKey(platform: Platform, identifier: string): string {
+  if (platform === Platform.X) {
+    return `x:${identifier.replace('@', '').trim().toLowerCase()}`;
+  }
+
+  const normalizedUrl = identifier
+    .trim()
+    .toLowerCase()
+    .replace(/^https?:\/\//, '')
+    .replace(/^www\./, '')
+    .replace(/[?#].*$/, '')
+    .replace(/\/+$/, '');
+  return `linkedin:${normalizedUrl}`;
+}
+
+/**
+ * Whether a cached entry is still within CACHE_TTL_HOURS
+ */
+export function isFresh(entry: CachedBundle, now: number = Date.now()): boolean {
+  return now - Date.parse(entry.stored_at_iso) < appConfig.cacheTtlHours * 60 * 60 * 1000;
+}
+
+/**
+ * Milliseconds until a cached entry expires (0 once expired)
+ */
+export function freshForMs(entry: CachedBundle, now: number = Date.now()): number {
+  return Math.max(0, Date.parse(entry.stored_at_iso) + appConfig.cacheTtlHours * 60 * 60 * 1000 - now);
+}
+
+/**
+ * Return a cached bundle cut down to the requested limit, or undefined if it holds too few
+ */
+export function bundleForLimit(entry: CachedBundle, limit: number): Bundle | undefined {
+  const { bundle } = entry;
+  if (bundle.meta.limit < limit) {
+    return undefined;
+  }
+
+  const posts = bundle.posts.slice(0, limit);
+  return {
+    ...bundle,
+    posts,
+    meta: { ...bundle.meta, limit, total_found: posts.length }
+  };
+}
+
+/**
+ * Serve whatever a cached entry holds, flagged as stale (used while the scraper's circuit
+ * is open, and for offline pack entries whenever a fetch fails)
+ */
+export function staleBundle(entry: CachedBundle, limit: number): Bundle {
+  const posts = entry.bundle.posts.slice(0, limit);
+  return {
+    ...entry.bundle,
+    posts,
+    meta: { ...entry.bundle.meta, limit, total_found: posts.length, stale: true }
+  };
+}
+
+export class MemoryBundleCache implements BundleCache {
+  private entries = new Map<string, CachedBundle>();
+
+  async get(key: string): Promise<CachedBundle | undefined> {
+    return this.entries.get(key);
+  }
+
+  async set(key: string, bundle: Bundle): Promise<void> {
+    this.entries.set(key, { key, stored_at_iso: new Date().toISOString(), bundle });
+  }
+
+  async keys(): Promise<string[]> {
+    return Array.from(this.entries.keys());
+  }
+}
+
+/**
+ * One JSON file per key; writes go through a temp file + rename so
+ * concurrent readers (other processes included) never see partial entries
+ */
+export class DiskBundleCache implements BundleCache {
+  constructor(private readonly directory: string) {}
+
+  async get(key: string): Promise<CachedBundle | undefined> {
+    try {
+      const content = await fs.readFile(this.fileFor(key), 'utf8');
+      return JSON.parse(content) as CachedBundle;
+    } catch (error) {
+      if ((error as NodeJS.ErrnoException).code !== 'ENOENT') {
+        logger.warn(`Ignoring unreadable cache entry for ${key}:`, error);
+      }
+      return undefined;
+    }
+  }
+
+  async set(key: string, bundle: Bundle): Promise<void> {
+    const entry: CachedBundle = { key, stored_at_iso: new Date().toISOString(), bundle };
+    const file = this.fileFor(key);
+    const tmpFile = `${file}.${process.pid}.${Math.random().toString(36).slice(2)}.tmp`;
+
+    await fs.mkdir(this.directory, { recursive: true });
+    await fs.writeFile(tmpFile, JSON.stringify(entry));
+    await fs.rename(tmpFile, file);
+  }
+
+  async keys(): Promise<string[]> {
+    try {
+      const files = await fs.readdir(this.directory);
+      return files
+        .filter(file => file.endsWith('.json'))
+        .map(file => decodeURIComponent(file.slice(0, -'.json'.length)));
+    } catch (error) {
+      if ((error as NodeJS.ErrnoException).code === 'ENOENT') {
+        return [];
+      }
+      throw error;
+    }
+  }
+
+  private fileFor(key: string): string {
+    return path.join(this.directory, `${encodeURIComponent(key)}.json`);
+  }
+}
+
+/**
+ * Backs the inner cache with a read-only event pack. A bundle fetched since the pack was
+ * exported wins; otherwise the pack copy is returned as an ordinary entry (fresh for
+ * CACHE_TTL_HOURS from the export, only for limits it covers) that the tools also fall
+ * back to whenever a fetch fails, so the server keeps answering without network.
+ */
+export class PackedBundleCache implements BundleCache {
+  constructor(private readonly pack: EventPack, private readonly inner: BundleCache) {}
+
+  async get(key: string): Promise<CachedBundle | undefined> {
+    const [bundle, cached] = await Promise.all([this.pack.get(key), this.inner.get(key)]);
+    if (!bundle || (cached && Date.parse(cached.stored_at_iso) >= this.pack.createdAt.getTime())) {
+      return cached;
+    }
+    return { key, stored_at_iso: this.pack.createdAt.toISOString(), bundle, offline: true };
+  }
+
+  async set(key: string, bundle: Bundle): Promise<void> {
+    await this.inner.set(key, bundle);
+  }
+
+  async keys(): Promise<string[]> {
+    const [packKeys, innerKeys] = await Promise.all([this.pack.keys(), this.inner.keys()]);
+    return Array.from(new Set([...packKeys, ...innerKeys]));
+  }
+}
+
+let sharedCache: BundleCache | undefined;
+
+/**
+ * Process-wide cache selected by STORAGE_BACKEND
+ */
+export function getBundleCache(): BundleCache {
+  if (!sharedCache) {
+    switch (appConfig.storageBackend) {
+      case 'disk':
+        sharedCache = new DiskBundleCache(appConfig.diskPath || '.cache/bundles');
+        break;
+      case 's3':
+        logger.warn('STORAGE_BACKEND=s3 is not supported yet, falling back to in-memory cache');
+        sharedCache = new MemoryBundleCache();
+        break;
+      default:
+        sharedCache = new MemoryBundleCache();
+    }
+
+    if (appConfig.eventPackPath) {
+      const pack = EventPack.open(appConfig.eventPackPath);
+      logger.info(`Serving ${pack.recordCount} bundles from event pack ${appConfig.eventPackPath}`);
+      sharedCache = new PackedBundleCache(pack, sharedCache);
+    }
+  }
+  return sharedCache;
+}
@@ -0,0 +1,63 @@
+/**
+ * Notifications for bundles entering the server (fresh fetches and cache hits),
+ * so indexes can stay up to date without the tools knowing about them
+ */
+
+import { EventEmitter } from 'events';
+import pino from 'pino';
+import { Bundle } from '../models/index.js';
+
+const logger = pino({ name: 'bundle-events' });
+
+export type BundleListener = (key: string, bundle: Bundle) => void;
+
+const emitter = new EventEmitter();
+emitter.setMaxListeners(0);
+
+let relay: BundleListener | undefined;
+
+/**
+ * Announce a bundle under its cache key to local listeners and the relay, if any.
+ * Delivery is deferred so indexing never delays the response that fetched the bundle.
+ */
+export function publishBundle(key: string, bundle: Bundle): void {
+  setImmediate(() => {
+    deliverBundle(key, bundle);
+    try {
+      relay?.(key, bundle);
+    } catch (error) {
+      logger.warn(`Bundle relay failed for ${key}:`, error);
+    }
+  });
+}
+
+/**
+ * Hand a bundle to local listeners only (used for bundles relayed in from other processes);
+ * listener failures are logged, never thrown
+ */
+export function deliverBundle(key: string, bundle: Bundle): void {
+  for (const listener of emitter.listeners('bundle') as BundleListener[]) {
+    try {
+      listener(key, bundle);
+    } catch (error) {
+      logger.warn(`Bundle listener failed for ${key}:`, error);
+    }
+  }
+}
+
+/**
+ * Subscribe to published bundles; returns an unsubscribe function
+ */
+export function onBundle(listener: BundleListener): () => void {
+  emitter.on('bundle', listener);
+  return () => {
+    emitter.off('bundle', listener);
+  };
+}
+
+/**
+ * Forward every locally published bundle elsewhere, e.g. to sibling cluster workers
+ */
+export function setBundleRelay(listener: BundleListener | undefined): void {
+  relay = listener;
+}
@@ -0,0 +1,270 @@
+/**
+ * Offline event pack: prefetched bundles in one compact binary file
+ *
+ * Layout (little-endian):
+ *   header   32 bytes  magic "SSPK", version, slot count, record count,
+ *                      slots/keys/records section offsets, created-at (unix seconds)
+ *   slots    20 bytes each, open-addressed hash table keyed by FNV-1a of the key:
+ *                      hash u32, key offset u32, key length u16, pad u16,
+ *                      record offset u32, record length u32
+ *   keys     UTF-8 key bytes
+ *   records  per bundle: u32 person length + person JSON, u32 meta length + meta JSON,
+ *                      u32 post count, u32 post end offsets, then each post's JSON
+ *
+ * Opening reads only the header; a lookup probes one or two slots and reads a
+ * single record with async positioned reads, then decodes that whole bundle.
+ */
+
+import { closeSync, openSync, promises as fs, read, readSync } from 'fs';
+import { promisify } from 'util';
+import { Bundle, Meta, Person, Post } from '../models/index.js';
+
+const MAGIC = 'SSPK';
+const VERSION = 1;
+const HEADER_SIZE = 32;
+const SLOT_SIZE = 20;
+
+const readAsync = promisify(read);
+
+export interface EventPackEntry {
+  keys: string[];
+  bundle: Bundle;
+}
+
+function fnv1a(bytes: Buffer): number {
+  let hash = 0x811c9dc5;
+  for (const byte of bytes) {
+    hash ^= byte;
+    hash = Math.imul(hash, 0x01000193) >>> 0;
+  }
+  return hash;
+}
+
+function encodeRecord(bundle: Bundle): Buffer {
+  const person = Buffer.from(JSON.stringify(bundle.person));
+  const meta = Buffer.from(JSON.stringify(bundle.meta));
+  const posts = bundle.posts.map(post => Buffer.from(JSON.stringify(post)));
+
+  const postTableOffset = 4 + person.length + 4 + meta.length + 4;
+  const postsStart = postTableOffset + posts.length * 4;
+  const record = Buffer.alloc(postsStart + posts.reduce((total, post) => total + post.length, 0));
+
+  let offset = 0;
+  offset = record.writeUInt32LE(person.length, offset);
+  offset += person.copy(record, offset);
+  offset = record.writeUInt32LE(meta.length, offset);
+  offset += meta.copy(record, offset);
+  offset = record.writeUInt32LE(posts.length, offset);
+
+  let postEnd = postsStart;
+  for (const post of posts) {
+    post.copy(record, postEnd);
+    postEnd += post.length;
+    offset = record.writeUInt32LE(postEnd, offset);
+  }
+
+  return record;
+}
+
+/**
+ * Write bundles to a pack file (atomically, via temp file + rename)
+ */
+export async function writeEventPack(filePath: string, entries: EventPackEntry[]): Promise<void> {
+  const keyCount = entries.reduce((total, entry) => total + entry.keys.length, 0);
+  let slotCount = 1;
+  while (slotCount < keyCount * 2) {
+    slotCount <<= 1;
+  }
+
+  const slots = Buffer.alloc(slotCount * SLOT_SIZE);
+  const keyChunks: Buffer[] = [];
+  const recordChunks: Buffer[] = [];
+  let keysLength = 0;
+  let recordsLength = 0;
+
+  for (const entry of entries) {
+    const record = encodeRecord(entry.bundle);
+    const recordOffset = recordsLength;
+    recordChunks.push(record);
+    recordsLength += record.length;
+
+    for (const key of entry.keys) {
+      const keyBytes = Buffer.from(key);
+      const hash = fnv1a(keyBytes);
+
+      let slot = hash & (slotCount - 1);
+      while (slots.readUInt16LE(slot * SLOT_SIZE + 8) !== 0) {
+        slot = (slot + 1) & (slotCount - 1);
+      }
+
+      const base = slot * SLOT_SIZE;
+      slots.writeUInt32LE(hash, base);
+      slots.writeUInt32LE(keysLength, base + 4);
+      slots.writeUInt16LE(keyBytes.length, base + 8);
+      slots.writeUInt32LE(recordOffset, base + 12);
+      slots.writeUInt32LE(record.length, base + 16);
+
+      keyChunks.push(keyBytes);
+      keysLength += keyBytes.length;
+    }
+  }
+
+  const keysOffset = HEADER_SIZE + slots.length;
+  const recordsOffset = keysOffset + keysLength;
+
+  const header = Buffer.alloc(HEADER_SIZE);
+  header.write(MAGIC, 0, 'ascii');
+  header.writeUInt16LE(VERSION, 4);
+  header.writeUInt32LE(slotCount, 8);
+  header.writeUInt32LE(entries.length, 12);
+  header.writeUInt32LE(HEADER_SIZE, 16);
+  header.writeUInt32LE(keysOffset, 20);
+  header.writeUInt32LE(recordsOffset, 24);
+  header.writeUInt32LE(Math.floor(Date.now() / 1000), 28);
+
+  const tmpPath = `${filePath}.${process.pid}.tmp`;
+  await fs.writeFile(tmpPath, Buffer.concat([header, slots, ...keyChunks, ...recordChunks]));
+  await fs.rename(tmpPath, filePath);
+}
+
+export class EventPack {
+  private constructor(
+    private fd: number | undefined,
+    private readonly slotCount: number,
+    readonly recordCount: number,
+    private readonly slotsOffset: number,
+    private readonly keysOffset: number,
+    private readonly recordsOffset: number,
+    readonly createdAt: Date
+  ) {}
+
+  /**
+   * Open a pack; only the fixed-size header is read
+   */
+  static open(filePath: string): EventPack {
+    const fd = openSync(filePath, 'r');
+    const header = Buffer.alloc(HEADER_SIZE);
+
+    if (readSync(fd, header, 0, HEADER_SIZE, 0) !== HEADER_SIZE || header.toString('ascii', 0, 4) !== MAGIC) {
+      closeSync(fd);
+      throw new Error(`${filePath} is not an event pack`);
+    }
+    if (header.readUInt16LE(4) !== VERSION) {
+      closeSync(fd);
+      throw new Error(`${filePath} has unsupported event pack version ${header.readUInt16LE(4)}`);
+    }
+
+    return new EventPack(
+      fd,
+      header.readUInt32LE(8),
+      header.readUInt32LE(12),
+      header.readUInt32LE(16),
+      header.readUInt32LE(20),
+      header.readUInt32LE(24),
+      new Date(header.readUInt32LE(28) * 1000)
+    );
+  }
+
+  /**
+   * Look up a bundle by key
+   */
+  async get(key: string): Promise<Bundle | undefined> {
+    const location = await this.locate(key);
+    if (!location) {
+      return undefined;
+    }
+
+    const record = await this.read(this.recordsOffset + location.offset, location.length);
+
+    let offset = 0;
+    const personLength = record.readUInt32LE(offset);
+    const person = JSON.parse(record.toString('utf8', offset + 4, offset + 4 + personLength)) as Person;
+    offset += 4 + personLength;
+
+    const metaLength = record.readUInt32LE(offset);
+    const meta = JSON.parse(record.toString('utf8', offset + 4, offset + 4 + metaLength)) as Meta;
+    offset += 4 + metaLength;
+
+    const postCount = record.readUInt32LE(offset);
+    const postTable = offset + 4;
+    let postStart = postTable + postCount * 4;
+
+    const posts: Post[] = [];
+    for (let i = 0; i < postCount; i++) {
+      const postEnd = record.readUInt32LE(postTable + i * 4);
+      posts.push(JSON.parse(record.toString('utf8', postStart, postEnd)) as Post);
+      postStart = postEnd;
+    }
+
+    return { person, posts, meta };
+  }
+
+  async has(key: string): Promise<boolean> {
+    return (await this.locate(key)) !== undefined;
+  }
+
+  /**
+   * All keys in the pack (walks the slot table)
+   */
+  async keys(): Promise<string[]> {
+    const slots = await this.read(this.slotsOffset, this.slotCount * SLOT_SIZE);
+    const keysSection = await this.read(this.keysOffset, this.recordsOffset - this.keysOffset);
+    const keys: string[] = [];
+
+    for (let slot = 0; slot < this.slotCount; slot++) {
+      const base = slot * SLOT_SIZE;
+      const keyLength = slots.readUInt16LE(base + 8);
+      if (keyLength > 0) {
+        const keyOffset = slots.readUInt32LE(base + 4);
+        keys.push(keysSection.toString('utf8', keyOffset, keyOffset + keyLength));
+      }
+    }
+
+    return keys;
+  }
+
+  close(): void {
+    if (this.fd !== undefined) {
+      closeSync(this.fd);
+      this.fd = undefined;
+    }
+  }
+
+  private async locate(key: string): Promise<{ offset: number; length: number } | undefined> {
+    const keyBytes = Buffer.from(key);
+    const hash = fnv1a(keyBytes);
+
+    for (let probe = 0, slot = hash & (this.slotCount - 1); probe < this.slotCount; probe++, slot = (slot + 1) & (this.slotCount - 1)) {
+      const slotBuffer = await this.read(this.slotsOffset + slot * SLOT_SIZE, SLOT_SIZE);
+
+      const keyLength = slotBuffer.readUInt16LE(8);
+      if (keyLength === 0) {
+        return undefined;
+      }
+
+      if (slotBuffer.readUInt32LE(0) === hash && keyLength === keyBytes.length) {
+        const candidate = await this.read(this.keysOffset + slotBuffer.readUInt32LE(4), keyLength);
+        if (candidate.equals(keyBytes)) {
+          return {
+            offset: slotBuffer.readUInt32LE(12),
+            length: slotBuffer.readUInt32LE(16)
+          };
+        }
+      }
+    }
+
+    return undefined;
+  }
+
+  private async read(position: number, length: number): Promise<Buffer> {
+    if (this.fd === undefined) {
+      throw new Error('Event pack is closed');
+    }
+    const buffer = Buffer.allocUnsafe(length);
+    const { bytesRead } = await readAsync(this.fd, buffer, 0, length, position);
+    if (bytesRead !== length) {
+      throw new Error('Event pack is truncated');
+    }
+    return buffer;
+  }
+}
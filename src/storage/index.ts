@@ -0,0 +1,5 @@
+export * from './bundle-cache.js';
+export * from './bundle-events.js';
+export * from './event-pack.js';
+export * from './post-archive.js';
+export * from './resource-index.js';
\ No newline at end of file
@@ -0,0 +1,681 @@
+/**
+ * Append-only columnar archive of every post the tools have fetched
+ *
+ * Each field lives in its own typed array, so filters such as "last 30 days,
+ * more than N likes, theme T" are tight scans over one column at a time that
+ * narrow a selection vector of row numbers. Strings (post IDs, URLs, text) are
+ * stored as one UTF-8 blob per column plus a u32 end-offset column.
+ *
+ * On disk (ARCHIVE_PATH) every column is a raw little-endian file that new rows
+ * are appended to; meta.json records the committed row count and is written
+ * last, so a crash mid-flush only leaves ignored bytes past the end. Loading is
+ * one read per column straight into typed-array memory, with no JSON parsing.
+ */
+
+import { promises as fs } from 'fs';
+import path from 'path';
+import pino from 'pino';
+import { appConfig } from '../config.js';
+import { Bundle, Platform } from '../models/index.js';
+import { ThemeInferenceEngine } from '../utils/index.js';
+import { BundleCache } from './bundle-cache.js';
+import { onBundle } from './bundle-events.js';
+
+const logger = pino({ name: 'post-archive' });
+
+const ARCHIVE_VERSION = 1;
+const INITIAL_CAPACITY = 1024;
+const FLUSH_DELAY_MS = 1000;
+// Theme bitmasks are u32
+const MAX_THEMES = 32;
+
+const PLATFORM_CODES: Platform[] = [Platform.X, Platform.LINKEDIN];
+
+type NumericArray = Uint8Array | Int32Array | Uint32Array | Float64Array;
+
+interface NumericArrayConstructor<T extends NumericArray> {
+  new (length: number): T;
+  readonly BYTES_PER_ELEMENT: number;
+}
+
+interface ArchiveMeta {
+  version: number;
+  rows: number;
+  themes: string[];
+  people: string[];
+  blob_lengths: Record<string, number>;
+}
+
+export interface ArchiveFilter {
+  sinceMs?: number | undefined;
+  untilMs?: number | undefined;
+  platform?: Platform | undefined;
+  minLikes?: number | undefined;
+  minReposts?: number | undefined;
+  minReplies?: number | undefined;
+  // Posts must carry every listed theme
+  themes?: string[] | undefined;
+  personKeys?: string[] | undefined;
+  // Case-insensitive substring, checked last since it decodes text
+  text?: string | undefined;
+}
+
+export interface ArchivedPost {
+  person_key: string;
+  platform: Platform;
+  post_id: string;
+  url: string;
+  created_at_iso: string;
+  text: string;
+  engagement: Record<string, number>;
+  inferred_themes: string[];
+}
+
+export interface ArchiveFilterResult {
+  matched: number;
+  scanned: number;
+  posts: ArchivedPost[];
+}
+
+function grow<T extends NumericArray>(array: T, capacity: number): T {
+  const next = new (array.constructor as NumericArrayConstructor<T>)(capacity);
+  next.set(array);
+  return next;
+}
+
+function bytesOf(array: NumericArray, from: number, to: number): Buffer {
+  const size = array.BYTES_PER_ELEMENT;
+  return Buffer.from(array.buffer, array.byteOffset + from * size, (to - from) * size);
+}
+
+/**
+ * Read `rows` elements of a raw column file into a fresh array of `capacity`
+ */
+async function readColumn<T extends NumericArray>(
+  file: string,
+  ctor: NumericArrayConstructor<T>,
+  rows: number,
+  capacity: number
+): Promise<T> {
+  const array = new ctor(capacity);
+  const needed = rows * ctor.BYTES_PER_ELEMENT;
+  if (needed === 0) {
+    return array;
+  }
+
+  const bytes = await fs.readFile(file);
+  if (bytes.length < needed) {
+    throw new Error(`Archive column ${path.basename(file)} is truncated`);
+  }
+  // Byte-level copy: file buffers are not guaranteed to be aligned for wider element types
+  new Uint8Array(array.buffer).set(bytes.subarray(0, needed));
+  return array;
+}
+
+/**
+ * Variable-length UTF-8 strings: one blob plus the end offset of each row
+ */
+class StringColumn {
+  ends: Uint32Array;
+  blob: Buffer;
+  blobLength = 0;
+
+  constructor(capacity: number, blobCapacity: number = capacity * 64) {
+    this.ends = new Uint32Array(capacity);
+    this.blob = Buffer.alloc(blobCapacity);
+  }
+
+  push(row: number, value: string): void {
+    const bytes = Buffer.from(value);
+    if (this.blobLength + bytes.length > this.blob.length) {
+      const next = Buffer.alloc(Math.max(this.blob.length * 2, this.blobLength + bytes.length));
+      this.blob.copy(next, 0, 0, this.blobLength);
+      this.blob = next;
+    }
+    bytes.copy(this.blob, this.blobLength);
+    this.blobLength += bytes.length;
+    this.ends[row] = this.blobLength;
+  }
+
+  get(row: number): string {
+    return this.blob.toString('utf8', this.start(row), this.ends[row] as number);
+  }
+
+  start(row: number): number {
+    return row === 0 ? 0 : this.ends[row - 1] as number;
+  }
+
+  resize(capacity: number): void {
+    this.ends = grow(this.ends, capacity);
+  }
+}
+
+export class PostArchive {
+  private rows = 0;
+  private capacity = INITIAL_CAPACITY;
+
+  // Fixed-width columns, indexed by row
+  private platform = new Uint8Array(this.capacity);
+  private createdAt = new Float64Array(this.capacity);
+  private likes = new Int32Array(this.capacity);
+  private reposts = new Int32Array(this.capacity);
+  private replies = new Int32Array(this.capacity);
+  private quotes = new Int32Array(this.capacity);
+  private themeMask = new Uint32Array(this.capacity);
+  private person = new Uint32Array(this.capacity);
+
+  // Variable-length columns
+  private postId = new StringColumn(this.capacity, this.capacity * 24);
+  private url = new StringColumn(this.capacity);
+  private text = new StringColumn(this.capacity, this.capacity * 280);
+
+  // Dictionaries for the coded columns
+  private themes: string[] = ThemeInferenceEngine.themeNames();
+  private themeBits = new Map(this.themes.map((theme, bit) => [theme, bit]));
+  private people: string[] = [];
+  private personCodes = new Map<string, number>();
+  private rowsByPost = new Map<string, number>();
+
+  // Persistence state
+  private persistedRows = 0;
+  private countersDirty = false;
+  private flushTimer: NodeJS.Timeout | undefined;
+  private flushing: Promise<void> = Promise.resolve();
+
+  // A read-only archive loads from the directory but never writes it (one writer per directory)
+  constructor(private readonly directory?: string, private readonly readOnly: boolean = false) {}
+
+  get size(): number {
+    return this.rows;
+  }
+
+  /**
+   * Append a bundle's posts; posts already archived only get their counters and themes refreshed
+   */
+  addBundle(personKey: string, bundle: Bundle): void {
+    const personCode = this.codeForPerson(personKey);
+
+    for (const post of bundle.posts) {
+      const createdAt = Date.parse(post.created_at_iso);
+      const postKey = `${post.platform}:${post.post_id || post.url}`;
+      const engagement = post.engagement;
+      const reposts = engagement.retweets ?? engagement.shares ?? 0;
+      const replies = engagement.replies ?? engagement.comments ?? 0;
+      const themeMask = this.maskFor(post.inferred_themes);
+
+      const existing = this.rowsByPost.get(postKey);
+      if (existing !== undefined) {
+        this.likes[existing] = engagement.likes ?? 0;
+        this.reposts[existing] = reposts;
+        this.replies[existing] = replies;
+        this.quotes[existing] = engagement.quotes ?? 0;
+        this.themeMask[existing] = themeMask;
+        if (existing < this.persistedRows) {
+          this.countersDirty = true;
+        }
+        continue;
+      }
+
+      if (this.rows === this.capacity) {
+        this.resize(this.capacity * 2);
+      }
+
+      const row = this.rows++;
+      this.platform[row] = Math.max(0, PLATFORM_CODES.indexOf(post.platform));
+      this.createdAt[row] = Number.isNaN(createdAt) ? 0 : createdAt;
+      this.likes[row] = engagement.likes ?? 0;
+      this.reposts[row] = reposts;
+      this.replies[row] = replies;
+      this.quotes[row] = engagement.quotes ?? 0;
+      this.themeMask[row] = themeMask;
+      this.person[row] = personCode;
+      this.postId.push(row, post.post_id);
+      this.url.push(row, post.url);
+      this.text.push(row, post.text);
+      this.rowsByPost.set(postKey, row);
+    }
+
+    this.scheduleFlush();
+  }
+
+  /**
+   * Rows matching every predicate, newest first, materialized up to `limit`
+   */
+  filter(filter: ArchiveFilter, limit: number = 50): ArchiveFilterResult {
+    const selection = new Uint32Array(this.rows);
+    for (let row = 0; row < this.rows; row++) {
+      selection[row] = row;
+    }
+    let count = this.rows;
+
+    // Cheapest, most selective columns first; each pass compacts the selection in place
+    if (filter.sinceMs !== undefined || filter.untilMs !== undefined) {
+      count = narrowRange(selection, count, this.createdAt, filter.sinceMs ?? -Infinity, filter.untilMs ?? Infinity);
+    }
+    if (filter.platform !== undefined) {
+      const code = PLATFORM_CODES.indexOf(filter.platform);
+      count = narrowRange(selection, count, this.platform, code, code);
+    }
+    if (filter.minLikes !== undefined) {
+      count = narrowRange(selection, count, this.likes, filter.minLikes, Infinity);
+    }
+    if (filter.minReposts !== undefined) {
+      count = narrowRange(selection, count, this.reposts, filter.minReposts, Infinity);
+    }
+    if (filter.minReplies !== undefined) {
+      count = narrowRange(selection, count, this.replies, filter.minReplies, Infinity);
+    }
+    if (filter.themes && filter.themes.length > 0) {
+      let required = 0;
+      for (const theme of filter.themes) {
+        const bit = this.themeBits.get(theme);
+        if (bit === undefined) {
+          count = 0;
+          break;
+        }
+        required |= 1 << bit;
+      }
+      count = narrowMask(selection, count, this.themeMask, required >>> 0);
+    }
+    if (filter.personKeys && filter.personKeys.length > 0) {
+      const allowed = new Uint8Array(this.people.length);
+      for (const key of filter.personKeys) {
+        const code = this.personCodes.get(key);
+        if (code !== undefined) {
+          allowed[code] = 1;
+        }
+      }
+      let kept = 0;
+      for (let i = 0; i < count; i++) {
+        const row = selection[i] as number;
+        if (allowed[this.person[row] as number]) {
+          selection[kept++] = row;
+        }
+      }
+      count = kept;
+    }
+    if (filter.text) {
+      const needle = filter.text.toLowerCase();
+      let kept = 0;
+      for (let i = 0; i < count; i++) {
+        const row = selection[i] as number;
+        if (this.text.get(row).toLowerCase().includes(needle)) {
+          selection[kept++] = row;
+        }
+      }
+      count = kept;
+    }
+
+    const rows = Array.from(selection.subarray(0, count))
+      .sort((a, b) => (this.createdAt[b] as number) - (this.createdAt[a] as number))
+      .slice(0, limit);
+
+    return {
+      matched: count,
+      scanned: this.rows,
+      posts: rows.map(row => this.materialize(row))
+    };
+  }
+
+  /**
+   * Archive cached bundles for people not seen yet (e.g. warmed by the prefetch command);
+   * people already in the persisted archive are skipped without parsing their cache entries
+   */
+  async seedFrom(cache: BundleCache): Promise<void> {
+    const before = this.rows;
+    for (const key of await cache.keys()) {
+      if (this.personCodes.has(key)) {
+        continue;
+      }
+      const cached = await cache.get(key);
+      if (cached) {
+        this.addBundle(key, cached.bundle);
+      }
+    }
+    logger.info(`Archive holds ${this.rows} posts (${this.rows - before} seeded from cache)`);
+  }
+
+  /**
+   * Load a previously persisted archive from the configured directory
+   */
+  async load(): Promise<void> {
+    if (!this.directory) {
+      return;
+    }
+
+    let meta: ArchiveMeta;
+    try {
+      meta = JSON.parse(await fs.readFile(this.file('meta.json'), 'utf8')) as ArchiveMeta;
+    } catch (error) {
+      if ((error as NodeJS.ErrnoException).code === 'ENOENT') {
+        return;
+      }
+      throw error;
+    }
+    if (meta.version !== ARCHIVE_VERSION) {
+      throw new Error(`Post archive ${this.directory} has unsupported version ${meta.version}`);
+    }
+
+    const rows = meta.rows;
+    let capacity = INITIAL_CAPACITY;
+    while (capacity <= rows) {
+      capacity *= 2;
+    }
+
+    this.platform = await readColumn(this.file('platform.u8'), Uint8Array, rows, capacity);
+    this.createdAt = await readColumn(this.file('created_at.f64'), Float64Array, rows, capacity);
+    this.likes = await readColumn(this.file('likes.i32'), Int32Array, rows, capacity);
+    this.reposts = await readColumn(this.file('reposts.i32'), Int32Array, rows, capacity);
+    this.replies = await readColumn(this.file('replies.i32'), Int32Array, rows, capacity);
+    this.quotes = await readColumn(this.file('quotes.i32'), Int32Array, rows, capacity);
+    this.themeMask = await readColumn(this.file('themes.u32'), Uint32Array, rows, capacity);
+    this.person = await readColumn(this.file('person.u32'), Uint32Array, rows, capacity);
+    this.postId = await this.readStrings('post_id', rows, capacity);
+    this.url = await this.readStrings('url', rows, capacity);
+    this.text = await this.readStrings('text', rows, capacity);
+
+    this.rows = rows;
+    this.capacity = capacity;
+    this.persistedRows = rows;
+    this.themes = meta.themes;
+    this.themeBits = new Map(this.themes.map((theme, bit) => [theme, bit]));
+    this.people = meta.people;
+    this.personCodes = new Map(this.people.map((key, code) => [key, code]));
+    this.rowsByPost.clear();
+    for (let row = 0; row < rows; row++) {
+      const postKey = `${PLATFORM_CODES[this.platform[row] as number]}:${this.postId.get(row) || this.url.get(row)}`;
+      this.rowsByPost.set(postKey, row);
+    }
+
+    logger.info(`Loaded ${rows} archived posts from ${this.directory}`);
+  }
+
+  /**
+   * Persist rows added since the last flush (serialized with any flush in progress)
+   */
+  flush(): Promise<void> {
+    const run = this.flushing.catch(() => undefined).then(() => this.writeColumns());
+    this.flushing = run;
+    return run;
+  }
+
+  private async writeColumns(): Promise<void> {
+    if (!this.directory || this.readOnly || (this.rows === this.persistedRows && !this.countersDirty)) {
+      return;
+    }
+
+    // Snapshot synchronously: later appends may grow (and replace) the arrays while we await
+    const from = this.persistedRows;
+    const to = this.rows;
+    const rewriteCounters = this.countersDirty;
+    const counterFrom = rewriteCounters ? 0 : from;
+    const copy = (array: NumericArray, start: number): Buffer => Buffer.from(bytesOf(array, start, to));
+    const stringsSnapshot = (column: StringColumn) => ({
+      ends: Buffer.from(bytesOf(column.ends, from, to)),
+      blob: Buffer.from(column.blob.subarray(column.start(from), column.blobLength))
+    });
+
+    const appends: Array<[string, Buffer]> = [
+      ['platform.u8', copy(this.platform, from)],
+      ['created_at.f64', copy(this.createdAt, from)],
+      ['person.u32', copy(this.person, from)]
+    ];
+    const counters: Array<[string, Buffer]> = [
+      ['likes.i32', copy(this.likes, counterFrom)],
+      ['reposts.i32', copy(this.reposts, counterFrom)],
+      ['replies.i32', copy(this.replies, counterFrom)],
+      ['quotes.i32', copy(this.quotes, counterFrom)],
+      ['themes.u32', copy(this.themeMask, counterFrom)]
+    ];
+    const strings = {
+      post_id: stringsSnapshot(this.postId),
+      url: stringsSnapshot(this.url),
+      text: stringsSnapshot(this.text)
+    };
+    const meta: ArchiveMeta = {
+      version: ARCHIVE_VERSION,
+      rows: to,
+      themes: [...this.themes],
+      people: [...this.people],
+      blob_lengths: {
+        post_id: this.postId.blobLength,
+        url: this.url.blobLength,
+        text: this.text.blobLength
+      }
+    };
+    this.persistedRows = to;
+    this.countersDirty = false;
+
+    try {
+      await fs.mkdir(this.directory, { recursive: true });
+      await this.truncateTo(from);
+
+      for (const [name, bytes] of appends) {
+        await fs.appendFile(this.file(name), bytes);
+      }
+      for (const [name, bytes] of counters) {
+        if (rewriteCounters) {
+          await this.replaceFile(name, bytes);
+        } else {
+          await fs.appendFile(this.file(name), bytes);
+        }
+      }
+      for (const [name, snapshot] of Object.entries(strings)) {
+        await fs.appendFile(this.file(`${name}.ends.u32`), snapshot.ends);
+        await fs.appendFile(this.file(`${name}.blob`), snapshot.blob);
+      }
+
+      // Commit point: readers only trust rows counted here
+      await this.replaceFile('meta.json', Buffer.from(JSON.stringify(meta)));
+    } catch (error) {
+      // Retry the same rows next time; truncateTo discards whatever was half-written
+      this.persistedRows = from;
+      this.countersDirty ||= rewriteCounters;
+      throw error;
+    }
+  }
+
+  /**
+   * Drop bytes an interrupted flush left past the committed rows, so appends line up
+   */
+  private async truncateTo(rows: number): Promise<void> {
+    const fixed: Array<[string, number]> = [
+      ['platform.u8', 1], ['created_at.f64', 8], ['person.u32', 4],
+      ['likes.i32', 4], ['reposts.i32', 4], ['replies.i32', 4], ['quotes.i32', 4], ['themes.u32', 4]
+    ];
+    const committedBlobs: Record<string, number> = {
+      post_id: this.postId.start(rows),
+      url: this.url.start(rows),
+      text: this.text.start(rows)
+    };
+
+    const targets: Array<[string, number]> = [
+      ...fixed.map(([name, size]): [string, number] => [name, rows * size]),
+      ...Object.keys(committedBlobs).flatMap((name): Array<[string, number]> => [
+        [`${name}.ends.u32`, rows * 4],
+        [`${name}.blob`, committedBlobs[name] ?? 0]
+      ])
+    ];
+
+    for (const [name, length] of targets) {
+      try {
+        const stat = await fs.stat(this.file(name));
+        if (stat.size > length) {
+          await fs.truncate(this.file(name), length);
+        }
+      } catch (error) {
+        if ((error as NodeJS.ErrnoException).code !== 'ENOENT') {
+          throw error;
+        }
+      }
+    }
+  }
+
+  private async replaceFile(name: string, bytes: Buffer): Promise<void> {
+    const tmpFile = `${this.file(name)}.${process.pid}.tmp`;
+    await fs.writeFile(tmpFile, bytes);
+    await fs.rename(tmpFile, this.file(name));
+  }
+
+  private async readStrings(name: string, rows: number, capacity: number): Promise<StringColumn> {
+    const column = new StringColumn(0, 0);
+    column.ends = await readColumn(this.file(`${name}.ends.u32`), Uint32Array, rows, capacity);
+    const blobLength = rows === 0 ? 0 : column.ends[rows - 1] as number;
+
+    if (blobLength > 0) {
+      const blob = await fs.readFile(this.file(`${name}.blob`));
+      if (blob.length < blobLength) {
+        throw new Error(`Archive column ${name}.blob is truncated`);
+      }
+      column.blob = blob.subarray(0, blobLength);
+    }
+    column.blobLength = blobLength;
+    return column;
+  }
+
+  private scheduleFlush(): void {
+    if (!this.directory || this.readOnly || this.flushTimer) {
+      return;
+    }
+    this.flushTimer = setTimeout(() => {
+      this.flushTimer = undefined;
+      this.flush().catch(error => logger.warn('Failed to persist post archive:', error));
+    }, FLUSH_DELAY_MS);
+    this.flushTimer.unref();
+  }
+
+  private resize(capacity: number): void {
+    this.platform = grow(this.platform, capacity);
+    this.createdAt = grow(this.createdAt, capacity);
+    this.likes = grow(this.likes, capacity);
+    this.reposts = grow(this.reposts, capacity);
+    this.replies = grow(this.replies, capacity);
+    this.quotes = grow(this.quotes, capacity);
+    this.themeMask = grow(this.themeMask, capacity);
+    this.person = grow(this.person, capacity);
+    this.postId.resize(capacity);
+    this.url.resize(capacity);
+    this.text.resize(capacity);
+    this.capacity = capacity;
+  }
+
+  private codeForPerson(personKey: string): number {
+    let code = this.personCodes.get(personKey);
+    if (code === undefined) {
+      code = this.people.length;
+      this.people.push(personKey);
+      this.personCodes.set(personKey, code);
+    }
+    return code;
+  }
+
+  private maskFor(themes: string[]): number {
+    let mask = 0;
+    for (const theme of themes) {
+      let bit = this.themeBits.get(theme);
+      if (bit === undefined) {
+        if (this.themes.length >= MAX_THEMES) {
+          continue;
+        }
+        bit = this.themes.length;
+        this.themes.push(theme);
+        this.themeBits.set(theme, bit);
+      }
+      mask |= 1 << bit;
+    }
+    return mask >>> 0;
+  }
+
+  private materialize(row: number): ArchivedPost {
+    const platform = PLATFORM_CODES[this.platform[row] as number] as Platform;
+    const mask = this.themeMask[row] as number;
+    const engagement: Record<string, number> = platform === Platform.X
+      ? {
+          likes: this.likes[row] as number,
+          retweets: this.reposts[row] as number,
+          replies: this.replies[row] as number,
+          quotes: this.quotes[row] as number
+        }
+      : {
+          likes: this.likes[row] as number,
+          comments: this.replies[row] as number,
+          shares: this.reposts[row] as number
+        };
+
+    return {
+      person_key: this.people[this.person[row] as number] as string,
+      platform,
+      post_id: this.postId.get(row),
+      url: this.url.get(row),
+      created_at_iso: new Date(this.createdAt[row] as number).toISOString(),
+      text: this.text.get(row),
+      engagement,
+      inferred_themes: this.themes.filter((_, bit) => (mask & (1 << bit)) !== 0)
+    };
+  }
+
+  private file(name: string): string {
+    return path.join(this.directory as string, name);
+  }
+}
+
+/**
+ * Keep selected rows whose value lies in [min, max]
+ */
+function narrowRange(selection: Uint32Array, count: number, column: NumericArray, min: number, max: number): number {
+  let kept = 0;
+  for (let i = 0; i < count; i++) {
+    const row = selection[i] as number;
+    const value = column[row] as number;
+    if (value >= min && value <= max) {
+      selection[kept++] = row;
+    }
+  }
+  return kept;
+}
+
+/**
+ * Keep selected rows whose bitmask contains every bit of `required`
+ */
+function narrowMask(selection: Uint32Array, count: number, column: Uint32Array, required: number): number {
+  let kept = 0;
+  for (let i = 0; i < count; i++) {
+    const row = selection[i] as number;
+    if ((((column[row] as number) & required) >>> 0) === required) {
+      selection[kept++] = row;
+    }
+  }
+  return kept;
+}
+
+let sharedArchiveLoaded: Promise<PostArchive> | undefined;
+
+/**
+ * Process-wide archive, fed by every bundle the tools publish and persisted to ARCHIVE_PATH when set
+ */
+export function getPostArchive(): Promise<PostArchive> {
+  if (!sharedArchiveLoaded) {
+    const archive = new PostArchive(appConfig.archivePath, appConfig.archiveReadOnly);
+    // Subscribe before loading so nothing published meanwhile is missed
+    const pending: Array<[string, Bundle]> = [];
+    let loaded = false;
+    onBundle((key, bundle) => {
+      if (loaded) {
+        archive.addBundle(key, bundle);
+      } else {
+        pending.push([key, bundle]);
+      }
+    });
+
+    sharedArchiveLoaded = archive.load()
+      .catch(error => logger.warn(`Starting with an empty post archive: ${error instanceof Error ? error.message : error}`))
+      .then(() => {
+        loaded = true;
+        for (const [key, bundle] of pending.splice(0)) {
+          archive.addBundle(key, bundle);
+        }
+        return archive;
+      });
+  }
+  return sharedArchiveLoaded;
+}
@@ -0,0 +1,243 @@
+/**
+ * Stored MCP resources (generated context documents) with a sorted URI index
+ *
+ * URIs are kept sorted, so listing everything under a prefix is a binary search for
+ * the first match plus a scan of the k results: O(log n + k) per page. Cursors carry
+ * the prefix and the last URI returned, so pages stay stable while documents are added.
+ *
+ * With RESOURCE_PATH set, documents are also written there, one file each, so they
+ * survive restarts and every cluster worker can read what another one stored.
+ */
+
+import { promises as fs } from 'fs';
+import path from 'path';
+import pino from 'pino';
+import { appConfig } from '../config.js';
+
+const logger = pino({ name: 'resource-index' });
+
+export interface ResourcePage {
+  uris: string[];
+  nextCursor?: string;
+}
+
+export const DEFAULT_RESOURCE_PAGE_SIZE = 100;
+
+interface ResourceCursor {
+  prefix: string;
+  after: string;
+}
+
+function encodeResourceCursor(cursor: ResourceCursor): string {
+  return Buffer.from(JSON.stringify([cursor.prefix, cursor.after])).toString('base64url');
+}
+
+function decodeResourceCursor(cursor: string): ResourceCursor {
+  try {
+    const [prefix, after] = JSON.parse(Buffer.from(cursor, 'base64url').toString('utf8'));
+    if (typeof prefix === 'string' && typeof after === 'string') {
+      return { prefix, after };
+    }
+  } catch {
+    // fall through to the error below
+  }
+  throw new Error('INVALID_INPUT: Malformed resource cursor; list again without one to start over');
+}
+
+export class ResourceIndex {
+  private contents = new Map<string, string>();
+  private sortedUris: string[] = [];
+
+  get size(): number {
+    return this.sortedUris.length;
+  }
+
+  get(uri: string): string | undefined {
+    return this.contents.get(uri);
+  }
+
+  set(uri: string, content: string): void {
+    if (!this.contents.has(uri)) {
+      this.sortedUris.splice(this.lowerBound(uri), 0, uri);
+    }
+    this.contents.set(uri, content);
+  }
+
+  /**
+   * One page of URIs starting with `prefix`, in sorted order.
+   * A cursor from a previous page carries its prefix, so it can be passed alone.
+   */
+  list(prefix: string = '', cursor?: string, pageSize: number = DEFAULT_RESOURCE_PAGE_SIZE): ResourcePage {
+    const position = cursor ? decodeResourceCursor(cursor) : undefined;
+    const scope = position?.prefix ?? prefix;
+
+    let index = this.lowerBound(scope);
+    if (position) {
+      index = Math.max(index, this.upperBound(position.after));
+    }
+
+    const uris: string[] = [];
+    while (index < this.sortedUris.length && uris.length < pageSize) {
+      const uri = this.sortedUris[index] as string;
+      if (!uri.startsWith(scope)) {
+        break;
+      }
+      uris.push(uri);
+      index++;
+    }
+
+    const hasMore = index < this.sortedUris.length && (this.sortedUris[index] as string).startsWith(scope);
+    const last = uris[uris.length - 1];
+    return hasMore && last !== undefined
+      ? { uris, nextCursor: encodeResourceCursor({ prefix: scope, after: last }) }
+      : { uris };
+  }
+
+  /**
+   * First index whose URI is >= value
+   */
+  private lowerBound(value: string): number {
+    let low = 0;
+    let high = this.sortedUris.length;
+    while (low < high) {
+      const mid = (low + high) >>> 1;
+      if ((this.sortedUris[mid] as string) < value) {
+        low = mid + 1;
+      } else {
+        high = mid;
+      }
+    }
+    return low;
+  }
+
+  /**
+   * First index whose URI is > value
+   */
+  private upperBound(value: string): number {
+    let low = 0;
+    let high = this.sortedUris.length;
+    while (low < high) {
+      const mid = (low + high) >>> 1;
+      if ((this.sortedUris[mid] as string) <= value) {
+        low = mid + 1;
+      } else {
+        high = mid;
+      }
+    }
+    return low;
+  }
+}
+
+let relay: ((uri: string) => void) | undefined;
+
+/**
+ * Resource index backed by a directory shared between processes (memory only without one).
+ * Reads fall back to the directory, so a document stored by a sibling worker is found even
+ * before that worker's relayed notice arrives.
+ */
+export class ResourceStore {
+  private index = new ResourceIndex();
+
+  constructor(private readonly directory?: string) {}
+
+  get size(): number {
+    return this.index.size;
+  }
+
+  async get(uri: string): Promise<string | undefined> {
+    const local = this.index.get(uri);
+    if (local !== undefined || !this.directory) {
+      return local;
+    }
+    return this.deliver(uri);
+  }
+
+  /**
+   * Store a document (written through to the directory first) and announce it to the relay
+   */
+  async set(uri: string, content: string): Promise<void> {
+    if (this.directory) {
+      const file = this.fileFor(uri);
+      const tmpFile = `${file}.${process.pid}.${Math.random().toString(36).slice(2)}.tmp`;
+      await fs.mkdir(this.directory, { recursive: true });
+      await fs.writeFile(tmpFile, content);
+      await fs.rename(tmpFile, file);
+    }
+    this.index.set(uri, content);
+
+    try {
+      relay?.(uri);
+    } catch (error) {
+      logger.warn(`Resource relay failed for ${uri}:`, error);
+    }
+  }
+
+  list(prefix?: string, cursor?: string, pageSize?: number): ResourcePage {
+    return this.index.list(prefix, cursor, pageSize);
+  }
+
+  /**
+   * Index a document another process stored in the shared directory
+   */
+  async deliver(uri: string): Promise<string | undefined> {
+    if (!this.directory) {
+      return undefined;
+    }
+    try {
+      const content = await fs.readFile(this.fileFor(uri), 'utf8');
+      this.index.set(uri, content);
+      return content;
+    } catch (error) {
+      if ((error as NodeJS.ErrnoException).code !== 'ENOENT') {
+        logger.warn(`Ignoring unreadable resource ${uri}:`, error);
+      }
+      return undefined;
+    }
+  }
+
+  /**
+   * Index every document already in the directory (e.g. after a restart)
+   */
+  async load(): Promise<void> {
+    if (!this.directory) {
+      return;
+    }
+    let files: string[];
+    try {
+      files = await fs.readdir(this.directory);
+    } catch (error) {
+      if ((error as NodeJS.ErrnoException).code === 'ENOENT') {
+        return;
+      }
+      throw error;
+    }
+    await Promise.all(files
+      .filter(file => file.endsWith('.doc'))
+      .map(file => this.deliver(decodeURIComponent(file.slice(0, -'.doc'.length)))));
+    logger.info(`Loaded ${this.index.size} resources from ${this.directory}`);
+  }
+
+  private fileFor(uri: string): string {
+    return path.join(this.directory as string, `${encodeURIComponent(uri)}.doc`);
+  }
+}
+
+/**
+ * Forward every locally stored resource URI elsewhere, e.g. to sibling cluster workers
+ */
+export function setResourceRelay(listener: ((uri: string) => void) | undefined): void {
+  relay = listener;
+}
+
+let sharedStore: ResourceStore | undefined;
+
+/**
+ * Process-wide resource store, shared through RESOURCE_PATH when set
+ */
+export function getResourceStore(): ResourceStore {
+  if (!sharedStore) {
+    sharedStore = new ResourceStore(appConfig.resourcePath);
+    sharedStore.load().catch(error => logger.warn('Failed to load stored resources:', error));
+  }
+  return sharedStore;
+}
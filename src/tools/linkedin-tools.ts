@@ -4,17 +4,37 @@
 
 import { Tool } from '@modelcontextprotocol/sdk/types.js';
 import pino from 'pino';
-import { ApifyAdapter } from '../adapters/index.js';
-import { Bundle, Person, Meta, Platform } from '../models/index.js';
-import { ThemeInferenceEngine, NormalizationUtils } from '../utils/index.js';
+import { ApifyAdapter, FetchOptions } from '../adapters/index.js';
+import {
+  Bundle,
+  Person,
+  Meta,
+  Platform,
+  ErrorType,
+  ProgressiveFetchSchema,
+  ResponseBudgetSchema,
+  ResponseFormatSchema
+} from '../models/index.js';
+import {
+  PROGRESSIVE_FETCH_PROPERTIES,
+  RESPONSE_BUDGET_PROPERTIES,
+  RESPONSE_FORMAT_PROPERTIES,
+  ProgressiveResult,
+  fetchProgressively,
+  formatBundleResponse
+} from '../utils/index.js';
+import { getBundleCache, bundleCacheKey, bundleForLimit, isFresh, publishBundle, staleBundle } from '../storage/index.js';
+import { appConfig } from '../config.js';
 import { z } from 'zod';
 
 const logger = pino({ name: 'linkedin-tools' });
 
+export const LINKEDIN_COMPLIANCE_WARNING = "LinkedIn scraping may violate ToS. Ensure you have explicit consent and provide your own authentication cookies if required.";
+
 const LinkedInInputSchema = z.object({
   profile_url: z.string().url().describe('LinkedIn profile URL'),
   limit: z.number().min(1).max(50).default(10).describe('Number of posts to fetch')
-});
+}).merge(ResponseBudgetSchema).merge(ResponseFormatSchema).merge(ProgressiveFetchSchema);
 
 export class LinkedInTools {
   private apify: ApifyAdapter;
@@ -44,7 +64,10 @@ export class LinkedInTools {
             minimum: 1,
             maximum: 50,
             default: 10
-          }
+          },
+          ...PROGRESSIVE_FETCH_PROPERTIES,
+          ...RESPONSE_BUDGET_PROPERTIES,
+          ...RESPONSE_FORMAT_PROPERTIES
         },
         required: ['profile_url']
       }
@@ -54,70 +77,20 @@ export class LinkedInTools {
   /**
    * Execute the get_linkedin_posts tool
    */
-  async execute(args: unknown): Promise<string> {
+  async execute(args: unknown, options: FetchOptions = {}): Promise<string> {
     try {
       // Validate input
       const input = LinkedInInputSchema.parse(args);
-      const { profile_url, limit = 10 } = input;
-
-      logger.info(`Fetching ${limit} LinkedIn posts for ${profile_url}`);
-
-      // Show compliance warning
-      const warning = "LinkedIn scraping may violate ToS. Ensure you have explicit consent and provide your own authentication cookies if required.";
-      logger.warn(warning);
-
-      // Estimate cost
-      const costEstimate = this.apify.estimateCost(Platform.LINKEDIN, limit);
-      logger.info(`Estimated cost: $${costEstimate.cost} ${costEstimate.currency}`);
-
-      // Fetch posts from Apify
-      const rawPosts = await this.apify.fetchLinkedInPosts(profile_url, limit);
-
-      if (rawPosts.length === 0) {
-        throw new Error('NOT_FOUND: No recent posts found for this LinkedIn profile');
-      }
-
-      // Normalize posts
-      const posts = rawPosts.map(post => NormalizationUtils.normalizePost(post));
-
-      // Apply theme inference
-      ThemeInferenceEngine.inferThemesBulk(posts);
-
-      // Extract name from profile URL
-      const profileMatch = profile_url.match(/linkedin\.com\/in\/([^\/]+)/);
-      const profileHandle = profileMatch ? profileMatch[1] : 'unknown';
+      const { profile_url, limit = 10, progressive } = input;
 
-      // Create person object
-      const person: Person = {
-        name: profileHandle || 'LinkedIn User',
-        platform: Platform.LINKEDIN,
-        profile_url,
-        headline_or_bio: ''
-      };
-
-      // Create metadata
-      const meta: Meta = {
-        source: 'social-snapshot-hub',
-        fetched_at_iso: new Date().toISOString(),
-        limit,
-        total_found: posts.length
-      };
-
-      // Create bundle
-      const bundle: Bundle = {
-        person,
-        posts,
-        meta
-      };
+      const bundle = await this.fetchBundle(profile_url, limit, { ...options, progressive: progressive ?? options.progressive });
 
       const result = {
         ...bundle,
-        warnings: [warning]
+        warnings: [LINKEDIN_COMPLIANCE_WARNING]
       };
 
-      logger.info(`Successfully fetched ${posts.length} LinkedIn posts`);
-
-      return JSON.stringify(result, null, 2);
+      return formatBundleResponse(result, input);
 
     } catch (error) {
       logger.error('Error in get_linkedin_posts:', error);
@@ -129,7 +102,9 @@ export class LinkedInTools {
       if (error instanceof Error) {
         message = error.message;
 
-        if (message.includes('cookie') || message.includes('authentication')) {
+        if (error.name === ErrorType.CIRCUIT_OPEN) {
+          errorType = ErrorType.CIRCUIT_OPEN;
+        } else if (message.includes('cookie') || message.includes('authentication')) {
           errorType = 'COOKIE_EXPIRED';
           message = 'LinkedIn authentication failed. Please provide valid li_at cookie.';
         } else if (message.includes('private') || message.includes('protected')) {
@@ -145,11 +120,103 @@ export class LinkedInTools {
         timestamp: new Date().toISOString(),
         remediation: errorType === 'COOKIE_EXPIRED'
           ? 'Set LINKEDIN_COOKIE environment variable with valid li_at cookie'
-          : 'Check profile URL and try again'
+          : errorType === ErrorType.CIRCUIT_OPEN
+            ? 'The LinkedIn scraper is failing; try again in a minute'
+            : 'Check profile URL and try again'
       }, null, 2);
     }
   }
 
+  /**
+   * Fetch, normalize and theme LinkedIn posts into a Bundle (throws on failure)
+   */
+  async fetchBundle(profileUrl: string, limit: number = 10, options: FetchOptions = {}): Promise<Bundle> {
+    const cache = getBundleCache();
+    const cacheKey = bundleCacheKey(Platform.LINKEDIN, profileUrl);
+
+    const progressive = options.progressive ?? appConfig.progressiveFetch;
+
+    const cached = await cache.get(cacheKey);
+    if (!options.refresh) {
+      // A progressive fetch that stopped at its first page answers later progressive calls too
+      const wanted = progressive && cached?.bundle.meta.progressive ? Math.min(limit, cached.bundle.meta.limit) : limit;
+      const cachedBundle = cached && isFresh(cached) ? bundleForLimit(cached, wanted) : undefined;
+      if (cached && cachedBundle) {
+        logger.info(`Serving cached bundle for ${cacheKey}`);
+        publishBundle(cacheKey, cached.bundle);
+        return cachedBundle;
+      }
+    }
+
+    logger.info(`Fetching ${limit} LinkedIn posts for ${profileUrl}`);
+
+    // Show compliance warning
+    logger.warn(LINKEDIN_COMPLIANCE_WARNING);
+
+    // Estimate cost
+    const costEstimate = this.apify.estimateCost(Platform.LINKEDIN, limit);
+    logger.info(`Estimated cost: $${costEstimate.cost} ${costEstimate.currency}`);
+
+    // Fetch posts from Apify (normalized and themed as the dataset streams in)
+    let fetched: ProgressiveResult;
+    try {
+      fetched = progressive
+        ? await fetchProgressively(limit, appConfig.progressiveFirstPage, pageLimit => this.apify.fetchLinkedInPosts(profileUrl, pageLimit, options))
+        : { posts: await this.apify.fetchLinkedInPosts(profileUrl, limit, options), coveredLimit: limit };
+    } catch (error) {
+      // While the actor's circuit is open an expired cached bundle beats an error, and an event pack copy beats any failed fetch
+      if (cached && error instanceof Error && (cached.offline || error.name === ErrorType.CIRCUIT_OPEN)) {
+        logger.warn(`Serving stale bundle for ${cacheKey}: ${error.message}`);
+        return staleBundle(cached, limit);
+      }
+      throw error;
+    }
+
+    if (fetched.expandError) {
+      logger.warn(`Expanding ${cacheKey} to ${limit} posts failed, keeping the first page: ${fetched.expandError.message}`);
+    }
+    const posts = fetched.posts;
+
+    if (posts.length === 0) {
+      throw new Error('NOT_FOUND: No recent posts found for this LinkedIn profile');
+    }
+
+    // Extract name from profile URL
+    const profileMatch = profileUrl.match(/linkedin\.com\/in\/([^\/]+)/);
+    const profileHandle = profileMatch ? profileMatch[1] : 'unknown';
+
+    // Create person object
+    const person: Person = {
+      name: profileHandle || 'LinkedIn User',
+      platform: Platform.LINKEDIN,
+      profile_url: profileUrl,
+      headline_or_bio: ''
+    };
+
+    // Create metadata
+    const meta: Meta = {
+      source: 'social-snapshot-hub',
+      fetched_at_iso: new Date().toISOString(),
+      limit: fetched.coveredLimit,
+      total_found: posts.length,
+      ...(fetched.report ? { progressive: fetched.report } : {})
+    };
+
+    logger.info(`Successfully fetched ${posts.length} LinkedIn posts`);
+
+    const bundle: Bundle = {
+      person,
+      posts,
+      meta
+    };
+
+    await cache.set(cacheKey, bundle).catch(error => {
+      logger.warn(`Failed to cache bundle for ${cacheKey}:`, error);
+    });
+    publishBundle(cacheKey, bundle);
+    return bundle;
+  }
+
   /**
    * Validate LinkedIn profile URL
    */
@@ -5,30 +5,74 @@
 import { Tool } from '@modelcontextprotocol/sdk/types.js';
 import pino from 'pino';
 import { v4 as uuidv4 } from 'uuid';
+import { z } from 'zod';
 import {
   FetchContextsInputSchema,
   SuggestOpenersInputSchema,
+  BatchOpenersInputSchema,
+  GetPersonPostsInputSchema,
+  SearchTopicsInputSchema,
+  FilterPostsInputSchema,
   FetchContextsResponse,
   SuggestOpenersResponse,
-  CandidateProfile
+  BatchOpenersResponse,
+  PersonOpenersResult,
+  OpenerSuggestion,
+  CandidateProfile,
+  Bundle,
+  Person,
+  Meta,
+  Platform,
+  PlatformStatus
 } from '../models/index.js';
-import { ApifyAdapter } from '../adapters/index.js';
-import { ThemeInferenceEngine } from '../utils/index.js';
+import { ApifyAdapter, FetchOptions } from '../adapters/index.js';
+import {
+  ThemeInferenceEngine,
+  NormalizationUtils,
+  RESPONSE_BUDGET_PROPERTIES,
+  RESPONSE_FORMAT_PROPERTIES,
+  formatBundleResponse,
+  mapWithConcurrency,
+  yieldToEventLoop
+} from '../utils/index.js';
 import { XTools } from './x-tools.js';
-import { LinkedInTools } from './linkedin-tools.js';
+import { LinkedInTools, LINKEDIN_COMPLIANCE_WARNING } from './linkedin-tools.js';
+import { getBundleCache, getPostArchive, getResourceStore, PostArchive, ResourcePage } from '../storage/index.js';
+import { getPostIndex, PostSearchIndex } from '../search/index.js';
 
 const logger = pino({ name: 'social-tools' });
 
+type FetchContextsInput = z.infer<typeof FetchContextsInputSchema>;
+
+interface PersonContexts {
+  response: FetchContextsResponse;
+  linkedinContext: string;
+  apolloContext: string;
+  postsSummary?: string;
+}
+
+export interface BatchOpenersOptions extends FetchOptions {
+  // Called with each person's result as soon as it is ready
+  onResult?: (result: PersonOpenersResult) => void;
+}
+
 export class SocialTools {
   private apify: ApifyAdapter;
   private xTools: XTools;
   private linkedinTools: LinkedInTools;
-  private resourceStorage = new Map<string, string>(); // Simple in-memory storage
+  private resourceStorage = getResourceStore(); // Sorted by URI for prefix listing, shared via RESOURCE_PATH
+  private postIndex: PostSearchIndex;
+  private postIndexSeeded: Promise<void> | undefined;
+  private postArchive: Promise<PostArchive>;
+  private postArchiveSeeded: Promise<PostArchive> | undefined;
 
   constructor() {
     this.apify = new ApifyAdapter();
     this.xTools = new XTools();
     this.linkedinTools = new LinkedInTools();
+    // Subscribe early so every bundle fetched from now on is indexed
+    this.postIndex = getPostIndex();
+    this.postArchive = getPostArchive();
   }
 
   /**
@@ -65,77 +109,10 @@ export class SocialTools {
   /**
    * Execute social.fetch_contexts tool
    */
-  async executeFetchContexts(args: unknown): Promise<string> {
+  async executeFetchContexts(args: unknown, options: FetchOptions = {}): Promise<string> {
     try {
       const input = FetchContextsInputSchema.parse(args);
-      const {
-        first_name,
-        last_name,
-        linkedin_url,
-        organization_name,
-        domain,
-        apollo_limit = 1,
-        include_recent_posts_summary = true
-      } = input;
-
-      logger.info(`Fetching contexts for ${first_name} ${last_name}`);
-
-      const contextId = uuidv4();
-      const warnings: string[] = [];
-
-      // Run in parallel: LinkedIn and Apollo (Apollo is placeholder)
-      const [linkedinContext, apolloContext] = await Promise.allSettled([
-        this.fetchLinkedInContext(linkedin_url, include_recent_posts_summary),
-        this.fetchApolloContext(first_name, last_name, organization_name, domain, apollo_limit)
-      ]);
-
-      // Process LinkedIn context
-      let linkedinContextContent = '';
-      if (linkedinContext.status === 'fulfilled') {
-        linkedinContextContent = linkedinContext.value;
-      } else {
-        warnings.push(`LinkedIn context failed: ${linkedinContext.reason}`);
-        linkedinContextContent = `LinkedIn context unavailable: ${linkedinContext.reason}`;
-      }
-
-      // Process Apollo context (placeholder)
-      let apolloContextContent = '';
-      let apolloCandidates: CandidateProfile[] = [];
-      if (apolloContext.status === 'fulfilled') {
-        const result = apolloContext.value;
-        apolloContextContent = result.context;
-        apolloCandidates = result.candidates;
-      } else {
-        warnings.push(`Apollo context failed: ${apolloContext.reason}`);
-        apolloContextContent = `Apollo integration coming soon. This is a placeholder context for ${first_name} ${last_name}`;
-      }
-
-      // Create combined context
-      const combinedContext = this.createCombinedContext(
-        linkedinContextContent,
-        apolloContextContent,
-        first_name,
-        last_name
-      );
-
-      // Store contexts as resources
-      const linkedinResourceUri = `resource://contexts/linkedin/${contextId}.md`;
-      const apolloResourceUri = `resource://contexts/apollo/${contextId}.md`;
-      const combinedResourceUri = `resource://contexts/combined/${contextId}.md`;
-
-      this.resourceStorage.set(linkedinResourceUri, linkedinContextContent);
-      this.resourceStorage.set(apolloResourceUri, apolloContextContent);
-      this.resourceStorage.set(combinedResourceUri, combinedContext);
-
-      const response: FetchContextsResponse = {
-        linkedin_context: linkedinResourceUri,
-        apollo_context: apolloResourceUri,
-        combined_context: combinedResourceUri,
-        apollo_candidates: apolloCandidates,
-        warnings
-      };
-
-      logger.info(`Successfully created contexts for ${first_name} ${last_name}`);
+      const { response } = await this.buildContexts(input, options);
       return JSON.stringify(response, null, 2);
 
     } catch (error) {
@@ -148,6 +125,85 @@ export class SocialTools {
     }
   }
 
+  /**
+   * Build and store the LinkedIn, Apollo and combined contexts for one person
+   */
+  private async buildContexts(input: FetchContextsInput, options: FetchOptions = {}): Promise<PersonContexts> {
+    const {
+      first_name,
+      last_name,
+      linkedin_url,
+      organization_name,
+      domain,
+      apollo_limit = 1,
+      include_recent_posts_summary = true
+    } = input;
+
+    logger.info(`Fetching contexts for ${first_name} ${last_name}`);
+
+    const contextId = uuidv4();
+    const warnings: string[] = [];
+
+    // Run in parallel: LinkedIn and Apollo (Apollo is placeholder)
+    const [linkedinContext, apolloContext] = await Promise.allSettled([
+      this.fetchLinkedInContext(linkedin_url, include_recent_posts_summary, options),
+      this.fetchApolloContext(first_name, last_name, organization_name, domain, apollo_limit)
+    ]);
+
+    // Process LinkedIn context
+    let linkedinContextContent = '';
+    let postsSummary: string | undefined;
+    if (linkedinContext.status === 'fulfilled') {
+      linkedinContextContent = linkedinContext.value.context;
+      postsSummary = linkedinContext.value.postsSummary;
+    } else {
+      warnings.push(`LinkedIn context failed: ${linkedinContext.reason}`);
+      linkedinContextContent = `LinkedIn context unavailable: ${linkedinContext.reason}`;
+    }
+
+    // Process Apollo context (placeholder)
+    let apolloContextContent = '';
+    let apolloCandidates: CandidateProfile[] = [];
+    if (apolloContext.status === 'fulfilled') {
+      const result = apolloContext.value;
+      apolloContextContent = result.context;
+      apolloCandidates = result.candidates;
+    } else {
+      warnings.push(`Apollo context failed: ${apolloContext.reason}`);
+      apolloContextContent = `Apollo integration coming soon. This is a placeholder context for ${first_name} ${last_name}`;
+    }
+
+    // Create combined context
+    const combinedContext = this.createCombinedContext(
+      linkedinContextContent,
+      apolloContextContent,
+      first_name,
+      last_name
+    );
+
+    // Store contexts as resources
+    const linkedinResourceUri = `resource://contexts/linkedin/${contextId}.md`;
+    const apolloResourceUri = `resource://contexts/apollo/${contextId}.md`;
+    const combinedResourceUri = `resource://contexts/combined/${contextId}.md`;
+
+    await Promise.all([
+      this.resourceStorage.set(linkedinResourceUri, linkedinContextContent),
+      this.resourceStorage.set(apolloResourceUri, apolloContextContent),
+      this.resourceStorage.set(combinedResourceUri, combinedContext)
+    ]);
+
+    const response: FetchContextsResponse = {
+      linkedin_context: linkedinResourceUri,
+      apollo_context: apolloResourceUri,
+      combined_context: combinedResourceUri,
+      apollo_candidates: apolloCandidates,
+      warnings
+    };
+
+    logger.info(`Successfully created contexts for ${first_name} ${last_name}`);
+    return { response, linkedinContext: linkedinContextContent, apolloContext: apolloContextContent, postsSummary };
+  }
+
   /**
    * Define the social.suggest_openers MCP tool
    */
@@ -186,8 +242,10 @@ export class SocialTools {
       } = input;
 
       // Retrieve contexts from storage
-      const linkedinContext = this.resourceStorage.get(linkedin_context_resource) || '';
-      const apolloContext = this.resourceStorage.get(apollo_context_resource) || '';
+      const [linkedinContext = '', apolloContext = ''] = await Promise.all([
+        this.resourceStorage.get(linkedin_context_resource),
+        this.resourceStorage.get(apollo_context_resource)
+      ]);
 
       if (!linkedinContext && !apolloContext) {
         throw new Error('INSUFFICIENT_DATA: No context data available');
@@ -218,16 +276,444 @@ export class SocialTools {
   }
 
   /**
-   * Fetch LinkedIn context with optional posts summary
+   * Define the social.batch_openers MCP tool
+   */
+  getBatchOpenersToolDefinition(): Tool {
+    const person = this.getFetchContextsToolDefinition().inputSchema;
+    return {
+      name: 'social.batch_openers',
+      description: 'Build contexts and openers for a list of people concurrently; each result is streamed as a progress notification as soon as it is ready',
+      inputSchema: {
+        type: 'object',
+        properties: {
+          people: {
+            type: 'array',
+            items: person,
+            minItems: 1,
+            maxItems: 200
+          },
+          tone_options: {
+            type: 'array',
+            items: { type: 'string' },
+            default: ['casual', 'professional', 'playful']
+          },
+          concurrency: {
+            type: 'number',
+            minimum: 1,
+            maximum: 8,
+            default: 4
+          }
+        },
+        required: ['people']
+      }
+    };
+  }
+
+  /**
+   * Execute social.batch_openers: at most `concurrency` people are fetched at once,
+   * and onResult sees each person's result in completion order
+   */
+  async executeBatchOpeners(args: unknown, options: BatchOpenersOptions = {}): Promise<string> {
+    try {
+      const { people, tone_options, concurrency } = BatchOpenersInputSchema.parse(args);
+      const { onResult, ...rest } = options;
+      // A batch is background work: live tool calls get actor slots first
+      const fetchOptions: FetchOptions = { ...rest, lane: rest.lane ?? 'background' };
+
+      logger.info(`Preparing openers for ${people.length} people, ${concurrency} at a time`);
+
+      const results: PersonOpenersResult[] = [];
+      await mapWithConcurrency(
+        people,
+        concurrency,
+        async person => {
+          if (fetchOptions.lane === 'background') {
+            // Let queued interactive requests run before starting the next person
+            await yieldToEventLoop();
+          }
+          return this.personOpeners(person, tone_options, fetchOptions);
+        },
+        (settled, person, index) => {
+          const result: PersonOpenersResult = settled.status === 'fulfilled'
+            ? { index, first_name: person.first_name, last_name: person.last_name, ...settled.value }
+            : {
+              index,
+              first_name: person.first_name,
+              last_name: person.last_name,
+              error: {
+                type: settled.reason instanceof Error ? settled.reason.name : 'UNKNOWN_ERROR',
+                message: settled.reason instanceof Error ? settled.reason.message : String(settled.reason)
+              }
+            };
+          results.push(result);
+          onResult?.(result);
+        }
+      );
+
+      const failed = results.filter(result => result.error).length;
+      const response: BatchOpenersResponse = {
+        results: results.sort((a, b) => a.index - b.index),
+        succeeded: results.length - failed,
+        failed
+      };
+      return JSON.stringify(response, null, 2);
+
+    } catch (error) {
+      logger.error('Error in batch_openers:', error);
+      return JSON.stringify({
+        error: error instanceof Error ? error.name : 'UNKNOWN_ERROR',
+        message: error instanceof Error ? error.message : 'An unexpected error occurred',
+        timestamp: new Date().toISOString()
+      }, null, 2);
+    }
+  }
+
+  /**
+   * Contexts and openers for one person of a batch
+   */
+  private async personOpeners(
+    person: FetchContextsInput,
+    toneOptions: string[],
+    options: FetchOptions
+  ): Promise<{ contexts: FetchContextsResponse; openers: OpenerSuggestion[] }> {
+    options.deadline?.throwIfExpired(`contexts for ${person.first_name} ${person.last_name}`);
+    const { response, linkedinContext, apolloContext, postsSummary } = await this.buildContexts(person, options);
+    const openers = await this.generateOpeners(linkedinContext, apolloContext, postsSummary, toneOptions);
+    return { contexts: response, openers };
+  }
+
+  /**
+   * Define the social.get_person_posts MCP tool
+   */
+  getPersonPostsToolDefinition(): Tool {
+    return {
+      name: 'social.get_person_posts',
+      description: 'Fetch X and LinkedIn posts for one person concurrently and return a single merged bundle',
+      inputSchema: {
+        type: 'object',
+        properties: {
+          x_handle: {
+            type: 'string',
+            description: 'Twitter handle (without @)'
+          },
+          linkedin_url: {
+            type: 'string',
+            format: 'uri',
+            description: 'LinkedIn profile URL'
+          },
+          x_limit: {
+            type: 'number',
+            minimum: 1,
+            maximum: 100,
+            default: 20
+          },
+          linkedin_limit: {
+            type: 'number',
+            minimum: 1,
+            maximum: 50,
+            default: 10
+          },
+          ...RESPONSE_BUDGET_PROPERTIES,
+          ...RESPONSE_FORMAT_PROPERTIES
+        }
+      }
+    };
+  }
+
+  /**
+   * Execute social.get_person_posts tool
+   */
+  async executeGetPersonPosts(args: unknown, options: FetchOptions = {}): Promise<string> {
+    try {
+      const input = GetPersonPostsInputSchema.parse(args);
+      const { x_handle, linkedin_url, x_limit = 20, linkedin_limit = 10 } = input;
+      const handle = x_handle?.replace('@', '').trim();
+
+      logger.info(`Fetching person posts for ${[handle && `@${handle}`, linkedin_url].filter(Boolean).join(' + ')}`);
+
+      // Both platforms run concurrently, so latency is max(X, LinkedIn)
+      const [xResult, linkedinResult] = await Promise.allSettled([
+        handle ? this.xTools.fetchBundle(handle, x_limit, options) : Promise.resolve(undefined),
+        linkedin_url ? this.linkedinTools.fetchBundle(linkedin_url, linkedin_limit, options) : Promise.resolve(undefined)
+      ]);
+
+      const platformStatus: Partial<Record<Platform, PlatformStatus>> = {
+        [Platform.X]: this.toPlatformStatus(xResult),
+        [Platform.LINKEDIN]: this.toPlatformStatus(linkedinResult)
+      };
+
+      const xBundle = xResult.status === 'fulfilled' ? xResult.value : undefined;
+      const linkedinBundle = linkedinResult.status === 'fulfilled' ? linkedinResult.value : undefined;
+
+      if (!xBundle && !linkedinBundle) {
+        const reasons = Object.entries(platformStatus)
+          .filter(([, status]) => status?.status === 'error')
+          .map(([platform, status]) => `${platform}: ${status?.error}`);
+        throw new Error(`NOT_FOUND: No posts found for this person (${reasons.join('; ')})`);
+      }
+
+      const bundle = this.mergeBundles(xBundle, linkedinBundle, platformStatus, {
+        limit: (handle ? x_limit : 0) + (linkedin_url ? linkedin_limit : 0)
+      });
+
+      const warnings: string[] = [];
+      if (linkedin_url) {
+        warnings.push(LINKEDIN_COMPLIANCE_WARNING);
+      }
+      for (const [platform, status] of Object.entries(platformStatus)) {
+        if (status?.status === 'error') {
+          warnings.push(`${platform} fetch failed: ${status.error}`);
+        }
+      }
+
+      logger.info(`Merged ${bundle.posts.length} posts for ${bundle.person.name}`);
+
+      return formatBundleResponse({ ...bundle, warnings }, input);
+
+    } catch (error) {
+      logger.error('Error in get_person_posts:', error);
+      return JSON.stringify({
+        error: error instanceof Error ? error.name : 'UNKNOWN_ERROR',
+        message: error instanceof Error ? error.message : 'An unexpected error occurred',
+        timestamp: new Date().toISOString()
+      }, null, 2);
+    }
+  }
+
+  /**
+   * Define the social.search_topics MCP tool
+   */
+  getSearchTopicsToolDefinition(): Tool {
+    return {
+      name: 'social.search_topics',
+      description: 'Find the people (among everyone fetched so far) who post most about a topic, ranked by BM25',
+      inputSchema: {
+        type: 'object',
+        properties: {
+          query: {
+            type: 'string',
+            description: "Topic to search for, e.g. 'fundraising'"
+          },
+          k: {
+            type: 'number',
+            description: 'Number of people to return',
+            minimum: 1,
+            maximum: 50,
+            default: 10
+          },
+          posts_per_person: {
+            type: 'number',
+            description: 'Matching post IDs returned per person',
+            minimum: 1,
+            maximum: 20,
+            default: 5
+          }
+        },
+        required: ['query']
+      }
+    };
+  }
+
+  /**
+   * Execute social.search_topics tool
+   */
+  async executeSearchTopics(args: unknown): Promise<string> {
+    try {
+      const input = SearchTopicsInputSchema.parse(args);
+      const { query, k = 10, posts_per_person = 5 } = input;
+
+      // Pick up bundles cached before this process started (e.g. by the prefetch warmer)
+      // A failed seed (e.g. a cache read error) is forgotten so the next search retries it
+      this.postIndexSeeded ??= this.postIndex.seedFrom(getBundleCache()).catch(error => {
+        this.postIndexSeeded = undefined;
+        throw error;
+      });
+      await this.postIndexSeeded;
+
+      const started = process.hrtime.bigint();
+      const result = this.postIndex.search(query, k, posts_per_person);
+      const elapsedMs = Number(process.hrtime.bigint() - started) / 1e6;
+
+      logger.info(`Topic search "${query}" matched ${result.results.length} people in ${elapsedMs.toFixed(2)}ms`);
+      return JSON.stringify(result, null, 2);
+
+    } catch (error) {
+      logger.error('Error in search_topics:', error);
+      return JSON.stringify({
+        error: error instanceof Error ? error.name : 'UNKNOWN_ERROR',
+        message: error instanceof Error ? error.message : 'An unexpected error occurred',
+        timestamp: new Date().toISOString()
+      }, null, 2);
+    }
+  }
+
+  /**
+   * Define the social.filter_posts MCP tool
+   */
+  getFilterPostsToolDefinition(): Tool {
+    return {
+      name: 'social.filter_posts',
+      description: 'Filter every post fetched so far by recency, platform, engagement, theme, person or text; newest first',
+      inputSchema: {
+        type: 'object',
+        properties: {
+          since_days: {
+            type: 'number',
+            description: 'Only posts from the last N days',
+            minimum: 0
+          },
+          platform: {
+            type: 'string',
+            enum: ['x', 'linkedin'],
+            description: 'Only posts from this platform'
+          },
+          min_likes: {
+            type: 'number',
+            description: 'Minimum like count',
+            minimum: 0
+          },
+          min_reposts: {
+            type: 'number',
+            description: 'Minimum retweets/shares',
+            minimum: 0
+          },
+          min_replies: {
+            type: 'number',
+            description: 'Minimum replies/comments',
+            minimum: 0
+          },
+          themes: {
+            type: 'array',
+            items: { type: 'string' },
+            description: 'Posts must carry all of these inferred themes'
+          },
+          person_keys: {
+            type: 'array',
+            items: { type: 'string' },
+            description: "Restrict to these people, e.g. 'x:jack' or 'linkedin:linkedin.com/in/jane'"
+          },
+          text: {
+            type: 'string',
+            description: 'Case-insensitive text the post must contain'
+          },
+          limit: {
+            type: 'number',
+            description: 'Maximum posts to return, newest first',
+            minimum: 1,
+            maximum: 200,
+            default: 50
+          }
+        }
+      }
+    };
+  }
+
+  /**
+   * Execute social.filter_posts tool
+   */
+  async executeFilterPosts(args: unknown): Promise<string> {
+    try {
+      const input = FilterPostsInputSchema.parse(args ?? {});
+
+      // Archive bundles cached before this process started that the persisted archive lacks
+      this.postArchiveSeeded ??= this.postArchive.then(async archive => {
+        await archive.seedFrom(getBundleCache());
+        return archive;
+      }).catch(error => {
+        this.postArchiveSeeded = undefined;
+        throw error;
+      });
+      const archive = await this.postArchiveSeeded;
+
+      const started = process.hrtime.bigint();
+      const result = archive.filter({
+        sinceMs: input.since_days !== undefined ? Date.now() - input.since_days * 24 * 60 * 60 * 1000 : undefined,
+        platform: input.platform as Platform | undefined,
+        minLikes: input.min_likes,
+        minReposts: input.min_reposts,
+        minReplies: input.min_replies,
+        themes: input.themes,
+        personKeys: input.person_keys,
+        text: input.text
+      }, input.limit);
+      const elapsedMs = Number(process.hrtime.bigint() - started) / 1e6;
+
+      logger.info(`Filtered ${result.scanned} archived posts to ${result.matched} in ${elapsedMs.toFixed(2)}ms`);
+      return JSON.stringify(result, null, 2);
+
+    } catch (error) {
+      logger.error('Error in filter_posts:', error);
+      return JSON.stringify({
+        error: error instanceof Error ? error.name : 'UNKNOWN_ERROR',
+        message: error instanceof Error ? error.message : 'An unexpected error occurred',
+        timestamp: new Date().toISOString()
+      }, null, 2);
+    }
+  }
+
+  /**
+   * Map a settled platform fetch to its Meta status entry
+   */
+  private toPlatformStatus(result: PromiseSettledResult<Bundle | undefined>): PlatformStatus {
+    if (result.status === 'rejected') {
+      return {
+        status: 'error',
+        total_found: 0,
+        error: result.reason instanceof Error ? result.reason.message : String(result.reason)
+      };
+    }
+
+    if (!result.value) {
+      return { status: 'skipped', total_found: 0 };
+    }
+
+    return { status: 'ok', total_found: result.value.posts.length };
+  }
+
+  /**
+   * Merge per-platform bundles into one deduplicated, recency-ordered bundle
+   */
+  private mergeBundles(
+    xBundle: Bundle | undefined,
+    linkedinBundle: Bundle | undefined,
+    platformStatus: Partial<Record<Platform, PlatformStatus>>,
+    options: { limit: number }
+  ): Bundle {
+    const primary = (xBundle ?? linkedinBundle) as Bundle;
+
+    const person: Person = {
+      ...primary.person,
+      handle: xBundle?.person.handle ?? primary.person.handle,
+      profile_url: linkedinBundle?.person.profile_url ?? primary.person.profile_url,
+      headline_or_bio: linkedinBundle?.person.headline_or_bio || xBundle?.person.headline_or_bio || ''
+    };
+
+    const posts = NormalizationUtils.mergePosts(xBundle?.posts ?? [], linkedinBundle?.posts ?? []);
+
+    const meta: Meta = {
+      source: 'social-snapshot-hub',
+      fetched_at_iso: new Date().toISOString(),
+      limit: options.limit,
+      total_found: posts.length,
+      platform_status: platformStatus
+    };
+
+    return { person, posts, meta };
+  }
+
+  /**
+   * Fetch LinkedIn context with optional posts summary (also returned on its own for openers)
    */
   private async fetchLinkedInContext(
     linkedinUrl?: string,
-    includePostsSummary: boolean = true
-  ): Promise<string> {
+    includePostsSummary: boolean = true,
+    options: FetchOptions = {}
+  ): Promise<{ context: string; postsSummary?: string }> {
     if (!linkedinUrl) {
-      return 'LinkedIn URL not provided. Context unavailable.';
+      return { context: 'LinkedIn URL not provided. Context unavailable.' };
     }
 
+    let postsSummary: string | undefined;
     let context = `# LinkedIn Context\n\nThis context is derived from LinkedIn. Use only facts present here; do not infer private data.\n\n`;
 
     context += `**Profile URL:** ${linkedinUrl}\n\n`;
@@ -238,12 +724,12 @@ export class SocialTools {
         const postsResult = await this.linkedinTools.execute({
           profile_url: linkedinUrl,
           limit: 5
-        });
+        }, options);
 
         const bundle = JSON.parse(postsResult);
         if (bundle.posts && bundle.posts.length > 0) {
-          const themeSummary = ThemeInferenceEngine.generateThemeSummary(bundle.posts);
-          context += `**Recent Activity Summary:** ${themeSummary}\n\n`;
+          postsSummary = ThemeInferenceEngine.generateThemeSummary(bundle.posts);
+          context += `**Recent Activity Summary:** ${postsSummary}\n\n`;
 
           // Add a few recent post excerpts
           context += `**Recent Posts (excerpts):**\n`;
@@ -257,7 +743,7 @@ export class SocialTools {
       }
     }
 
-    return context;
+    return { context, postsSummary };
   }
 
   /**
@@ -377,14 +863,14 @@ ${apolloContext}
   /**
    * Get a stored resource by URI
    */
-  getResource(uri: string): string | undefined {
+  getResource(uri: string): Promise<string | undefined> {
     return this.resourceStorage.get(uri);
   }
 
   /**
-   * List all available resource URIs
+   * List one page of stored resource URIs under a prefix (e.g. resource://contexts/combined/)
    */
-  listResources(): string[] {
-    return Array.from(this.resourceStorage.keys());
+  listResources(prefix?: string, cursor?: string, pageSize?: number): ResourcePage {
+    return this.resourceStorage.list(prefix, cursor, pageSize);
   }
 }
\ No newline at end of file
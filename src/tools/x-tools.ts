@@ -4,9 +4,17 @@
 
 import { Tool } from '@modelcontextprotocol/sdk/types.js';
 import pino from 'pino';
-import { ApifyAdapter } from '../adapters/index.js';
-import { Bundle, Person, Meta, Platform, GetPostsInputSchema } from '../models/index.js';
-import { ThemeInferenceEngine, NormalizationUtils } from '../utils/index.js';
+import { ApifyAdapter, FetchOptions } from '../adapters/index.js';
+import { Bundle, Person, Meta, Platform, ErrorType, GetPostsInputSchema } from '../models/index.js';
+import {
+  PROGRESSIVE_FETCH_PROPERTIES,
+  RESPONSE_BUDGET_PROPERTIES,
+  RESPONSE_FORMAT_PROPERTIES,
+  ProgressiveResult,
+  fetchProgressively,
+  formatBundleResponse
+} from '../utils/index.js';
+import { getBundleCache, bundleCacheKey, bundleForLimit, isFresh, publishBundle, staleBundle } from '../storage/index.js';
 import { appConfig } from '../config.js';
 
 const logger = pino({ name: 'x-tools' });
@@ -38,7 +46,10 @@ export class XTools {
             minimum: 1,
             maximum: 100,
             default: 20
-          }
+          },
+          ...PROGRESSIVE_FETCH_PROPERTIES,
+          ...RESPONSE_BUDGET_PROPERTIES,
+          ...RESPONSE_FORMAT_PROPERTIES
         },
         required: ['handle']
       }
@@ -48,64 +59,15 @@ export class XTools {
   /**
    * Execute the get_x_posts tool
    */
-  async execute(args: unknown): Promise<string> {
+  async execute(args: unknown, options: FetchOptions = {}): Promise<string> {
     try {
       // Validate input
       const input = GetPostsInputSchema.parse(args);
-      const { handle, limit = 20 } = input;
-
-      const cleanHandle = handle.replace('@', '').trim();
-
-      if (!cleanHandle) {
-        throw new Error('INVALID_INPUT: Handle cannot be empty');
-      }
-
-      logger.info(`Fetching ${limit} X posts for @${cleanHandle}`);
-
-      // Estimate cost
-      const costEstimate = this.apify.estimateCost(Platform.X, limit);
-      logger.info(`Estimated cost: $${costEstimate.cost} ${costEstimate.currency}`);
-
-      // Fetch posts from Apify
-      const rawPosts = await this.apify.fetchXPosts(cleanHandle, limit);
-
-      if (rawPosts.length === 0) {
-        throw new Error('NOT_FOUND: No recent posts found');
-      }
-
-      // Normalize posts
-      const posts = rawPosts.map(post => NormalizationUtils.normalizePost(post));
-
-      // Apply theme inference
-      ThemeInferenceEngine.inferThemesBulk(posts);
+      const { handle, limit = 20, progressive } = input;
 
-      // Create person object
-      const person: Person = {
-        name: `@${cleanHandle}`,
-        platform: Platform.X,
-        handle: cleanHandle,
-        profile_url: `https://twitter.com/${cleanHandle}`,
-        headline_or_bio: ''
-      };
+      const bundle = await this.fetchBundle(handle, limit, { ...options, progressive: progressive ?? options.progressive });
 
-      // Create metadata
-      const meta: Meta = {
-        source: 'social-snapshot-hub',
-        fetched_at_iso: new Date().toISOString(),
-        limit,
-        total_found: posts.length
-      };
-
-      // Create bundle
-      const bundle: Bundle = {
-        person,
-        posts,
-        meta
-      };
-
-      logger.info(`Successfully fetched ${posts.length} X posts for @${cleanHandle}`);
-
-      return JSON.stringify(bundle, null, 2);
+      return formatBundleResponse(bundle, input);
 
     } catch (error) {
       logger.error('Error in get_x_posts:', error);
@@ -125,4 +87,94 @@ export class XTools {
       }, null, 2);
     }
   }
+
+  /**
+   * Fetch, normalize and theme X posts into a Bundle (throws on failure)
+   */
+  async fetchBundle(handle: string, limit: number = 20, options: FetchOptions = {}): Promise<Bundle> {
+    const cleanHandle = handle.replace('@', '').trim();
+
+    if (!cleanHandle) {
+      throw new Error('INVALID_INPUT: Handle cannot be empty');
+    }
+
+    const cache = getBundleCache();
+    const cacheKey = bundleCacheKey(Platform.X, cleanHandle);
+
+    const progressive = options.progressive ?? appConfig.progressiveFetch;
+
+    const cached = await cache.get(cacheKey);
+    if (!options.refresh) {
+      // A progressive fetch that stopped at its first page answers later progressive calls too
+      const wanted = progressive && cached?.bundle.meta.progressive ? Math.min(limit, cached.bundle.meta.limit) : limit;
+      const cachedBundle = cached && isFresh(cached) ? bundleForLimit(cached, wanted) : undefined;
+      if (cached && cachedBundle) {
+        logger.info(`Serving cached bundle for ${cacheKey}`);
+        publishBundle(cacheKey, cached.bundle);
+        return cachedBundle;
+      }
+    }
+
+    logger.info(`Fetching ${limit} X posts for @${cleanHandle}`);
+
+    // Estimate cost
+    const costEstimate = this.apify.estimateCost(Platform.X, limit);
+    logger.info(`Estimated cost: $${costEstimate.cost} ${costEstimate.currency}`);
+
+    // Fetch posts from Apify (normalized and themed as the dataset streams in)
+    let fetched: ProgressiveResult;
+    try {
+      fetched = progressive
+        ? await fetchProgressively(limit, appConfig.progressiveFirstPage, pageLimit => this.apify.fetchXPosts(cleanHandle, pageLimit, options))
+        : { posts: await this.apify.fetchXPosts(cleanHandle, limit, options), coveredLimit: limit };
+    } catch (error) {
+      // While the actor's circuit is open an expired cached bundle beats an error, and an event pack copy beats any failed fetch
+      if (cached && error instanceof Error && (cached.offline || error.name === ErrorType.CIRCUIT_OPEN)) {
+        logger.warn(`Serving stale bundle for ${cacheKey}: ${error.message}`);
+        return staleBundle(cached, limit);
+      }
+      throw error;
+    }
+
+    if (fetched.expandError) {
+      logger.warn(`Expanding ${cacheKey} to ${limit} posts failed, keeping the first page: ${fetched.expandError.message}`);
+    }
+    const posts = fetched.posts;
+
+    if (posts.length === 0) {
+      throw new Error('NOT_FOUND: No recent posts found');
+    }
+
+    // Create person object
+    const person: Person = {
+      name: `@${cleanHandle}`,
+      platform: Platform.X,
+      handle: cleanHandle,
+      profile_url: `https://twitter.com/${cleanHandle}`,
+      headline_or_bio: ''
+    };
+
+    // Create metadata
+    const meta: Meta = {
+      source: 'social-snapshot-hub',
+      fetched_at_iso: new Date().toISOString(),
+      limit: fetched.coveredLimit,
+      total_found: posts.length,
+      ...(fetched.report ? { progressive: fetched.report } : {})
+    };
+
+    logger.info(`Successfully fetched ${posts.length} X posts for @${cleanHandle}`);
+
+    const bundle: Bundle = {
+      person,
+      posts,
+      meta
+    };
+
+    await cache.set(cacheKey, bundle).catch(error => {
+      logger.warn(`Failed to cache bundle for ${cacheKey}:`, error);
+    });
+    publishBundle(cacheKey, bundle);
+    return bundle;
+  }
 }
\ No newline at end of file
@@ -0,0 +1,36 @@
+import assert from 'node:assert/strict';
+import { test } from 'node:test';
+import { AdaptiveLimiter, Lane } from './circuit-breaker.js';
+import { Deadline } from './deadline.js';
+
+function limiter(initialLimit: number): AdaptiveLimiter {
+  return new AdaptiveLimiter({ initialLimit, minLimit: 1, maxLimit: 10, latencyTolerance: 3, backgroundMinShare: 0.25 });
+}
+
+/**
+ * Queue acquires behind one held slot, free it, and record the order the queued calls run in
+ */
+async function grantOrder(adaptive: AdaptiveLimiter, lanes: Lane[]): Promise<number[]> {
+  const holder = await adaptive.acquire(Deadline.none(), 'background');
+  const order: number[] = [];
+  const calls = lanes.map((lane, index) => adaptive.acquire(Deadline.none(), lane).then(release => {
+    order.push(index);
+    release();
+  }));
+  holder();
+  await Promise.all(calls);
+  return order;
+}
+
+test('interactive call goes ahead of queued background work at a limit of 1', async () => {
+  const order = await grantOrder(limiter(1), ['background', 'background', 'background', 'background', 'background', 'interactive']);
+  assert.equal(order[0], 5);
+});
+
+test('queued background work keeps its reserve above a limit of 1', async () => {
+  const adaptive = limiter(2);
+  const interactive = await adaptive.acquire(Deadline.none(), 'interactive');
+  const order = await grantOrder(adaptive, ['interactive', 'background']);
+  interactive();
+  assert.deepEqual(order, [1, 0]);
+});
@@ -0,0 +1,311 @@
+/**
+ * Circuit breaker and AIMD concurrency limit for calls to a flaky upstream
+ */
+
+import { ErrorType } from '../models/index.js';
+import { Deadline } from './deadline.js';
+
+export type CircuitState = 'closed' | 'open' | 'half_open';
+
+export interface CircuitBreakerOptions {
+  // Consecutive tripping failures that open the circuit
+  failureThreshold: number;
+  // How long the circuit stays open before one probe call is let through
+  cooldownMs: number;
+}
+
+/**
+ * Closed: calls flow and tripping failures are counted.
+ * Open: calls fail fast with CIRCUIT_OPEN until the cooldown passes.
+ * Half-open: a single probe decides whether to close again or re-open.
+ */
+export class CircuitBreaker {
+  private state: CircuitState = 'closed';
+  private failures = 0;
+  private openedAt = 0;
+  private probeInFlight = false;
+
+  constructor(private readonly name: string, private readonly options: CircuitBreakerOptions) {}
+
+  /**
+   * Current state, moving open → half-open once the cooldown has passed
+   */
+  getState(now: number = Date.now()): CircuitState {
+    if (this.state === 'open' && now - this.openedAt >= this.options.cooldownMs) {
+      this.state = 'half_open';
+      this.probeInFlight = false;
+    }
+    return this.state;
+  }
+
+  /**
+   * Milliseconds until an open circuit lets a probe through (0 unless open)
+   */
+  retryAfterMs(now: number = Date.now()): number {
+    return this.getState(now) === 'open' ? this.openedAt + this.options.cooldownMs - now : 0;
+  }
+
+  /**
+   * Throw CIRCUIT_OPEN unless a call may go ahead (in half-open, only the first caller may)
+   */
+  enter(now: number = Date.now()): void {
+    const state = this.getState(now);
+    if (state === 'closed') {
+      return;
+    }
+    if (state === 'half_open' && !this.probeInFlight) {
+      this.probeInFlight = true;
+      return;
+    }
+
+    const error = new Error(
+      `${ErrorType.CIRCUIT_OPEN}: ${this.name} is failing, not calling it for another ${Math.ceil(this.retryAfterMs(now) / 1000)}s`
+    );
+    error.name = ErrorType.CIRCUIT_OPEN;
+    throw error;
+  }
+
+  recordSuccess(): void {
+    this.state = 'closed';
+    this.failures = 0;
+    this.probeInFlight = false;
+  }
+
+  /**
+   * Count a failure that says the upstream is unhealthy (rate limits, failed runs)
+   */
+  recordFailure(now: number = Date.now()): void {
+    this.failures++;
+    if (this.state === 'half_open' || this.failures >= this.options.failureThreshold) {
+      this.state = 'open';
+      this.openedAt = now;
+      this.probeInFlight = false;
+    }
+  }
+
+  /**
+   * A call that ended without telling us anything about upstream health (e.g. bad input)
+   */
+  recordNeutral(): void {
+    if (this.state === 'half_open') {
+      this.probeInFlight = false;
+    }
+  }
+}
+
+export interface AdaptiveLimitOptions {
+  initialLimit: number;
+  minLimit: number;
+  maxLimit: number;
+  // A call slower than this multiple of the smoothed latency counts as congestion
+  latencyTolerance: number;
+  // Fraction of the limit kept for background work while it has calls waiting (0 disables)
+  backgroundMinShare?: number;
+}
+
+/**
+ * Interactive calls (live tools/call requests) go ahead of background work
+ * (prefetching, cache refresh, batch jobs)
+ */
+export type Lane = 'interactive' | 'background';
+
+export const LANES: readonly Lane[] = ['interactive', 'background'];
+
+export interface LaneSnapshot {
+  in_flight: number;
+  queued: number;
+  // Smoothed time from asking for a slot to getting one
+  wait_ms: number;
+  // How long the oldest queued call has been waiting
+  oldest_wait_ms: number;
+}
+
+// Weight of each new sample in the smoothed latency and wait times
+const LATENCY_SMOOTHING = 0.2;
+
+interface LaneWaiter {
+  queuedAt: number;
+  // Called with the slot's release function, or undefined if the deadline passed first
+  grant: (release: (() => void) | undefined) => void;
+}
+
+interface LaneState {
+  inFlight: number;
+  waiters: LaneWaiter[];
+  smoothedWaitMs: number;
+}
+
+/**
+ * Additive-increase / multiplicative-decrease concurrency limit.
+ *
+ * Each success at normal latency grows the limit by 1/limit (about +1 per
+ * round of calls); an upstream error or a call far slower than usual halves it.
+ *
+ * Slots are handed out by lane: a free slot goes to a waiting interactive call
+ * first, except that background work waiting for a slot is always allowed
+ * backgroundMinShare of the limit (at least one slot, but never the only one),
+ * so it is not starved while interactive calls keep one slot for themselves.
+ */
+export class AdaptiveLimiter {
+  private limit: number;
+  private inFlight = 0;
+  private smoothedLatencyMs: number | undefined;
+  private lanes: Record<Lane, LaneState> = {
+    interactive: { inFlight: 0, waiters: [], smoothedWaitMs: 0 },
+    background: { inFlight: 0, waiters: [], smoothedWaitMs: 0 }
+  };
+
+  constructor(private readonly options: AdaptiveLimitOptions) {
+    this.limit = options.initialLimit;
+  }
+
+  /**
+   * Wait for a slot in the given lane within the deadline; returns the function that releases it
+   */
+  async acquire(deadline: Deadline, lane: Lane = 'interactive'): Promise<() => void> {
+    const state = this.lanes[lane];
+    if (state.waiters.length === 0 && this.admits(lane)) {
+      this.recordWait(lane, 0);
+      return this.take(lane);
+    }
+    deadline.throwIfExpired('wait for an actor slot');
+
+    const queuedAt = Date.now();
+    const release = await new Promise<(() => void) | undefined>(resolve => {
+      const onAbort = (): void => {
+        state.waiters = state.waiters.filter(candidate => candidate !== waiter);
+        resolve(undefined);
+      };
+      const waiter: LaneWaiter = {
+        queuedAt,
+        grant: granted => {
+          deadline.signal.removeEventListener('abort', onAbort);
+          resolve(granted);
+        }
+      };
+      state.waiters.push(waiter);
+      deadline.signal.addEventListener('abort', onAbort, { once: true });
+    });
+
+    this.recordWait(lane, Date.now() - queuedAt);
+    if (!release) {
+      throw Deadline.exceededError('wait for an actor slot');
+    }
+    return release;
+  }
+
+  /**
+   * Take a slot only if one is free right now (used for optional extra work like hedged runs)
+   */
+  tryAcquire(lane: Lane = 'interactive'): (() => void) | undefined {
+    return this.lanes[lane].waiters.length === 0 && this.admits(lane) ? this.take(lane) : undefined;
+  }
+
+  /**
+   * Feed back how a call went: its latency, and whether the upstream pushed back
+   */
+  record(latencyMs: number, overloaded: boolean): void {
+    const previous = this.smoothedLatencyMs;
+    const congested = overloaded || (previous !== undefined && latencyMs > previous * this.options.latencyTolerance);
+
+    if (congested) {
+      this.limit = Math.max(this.options.minLimit, this.limit / 2);
+    } else {
+      this.limit = Math.min(this.options.maxLimit, this.limit + 1 / this.limit);
+      this.dispatch();
+    }
+
+    if (!overloaded) {
+      this.smoothedLatencyMs = previous === undefined ? latencyMs : previous + LATENCY_SMOOTHING * (latencyMs - previous);
+    }
+  }
+
+  snapshot(now: number = Date.now()): {
+    limit: number;
+    in_flight: number;
+    queued: number;
+    latency_ms?: number;
+    lanes: Record<Lane, LaneSnapshot>;
+  } {
+    const lanes = Object.fromEntries(LANES.map(lane => {
+      const state = this.lanes[lane];
+      const oldest = state.waiters[0];
+      return [lane, {
+        in_flight: state.inFlight,
+        queued: state.waiters.length,
+        wait_ms: Math.round(state.smoothedWaitMs),
+        oldest_wait_ms: oldest ? now - oldest.queuedAt : 0
+      }];
+    })) as Record<Lane, LaneSnapshot>;
+
+    return {
+      limit: Math.floor(this.limit),
+      in_flight: this.inFlight,
+      queued: this.lanes.interactive.waiters.length + this.lanes.background.waiters.length,
+      ...(this.smoothedLatencyMs !== undefined ? { latency_ms: Math.round(this.smoothedLatencyMs) } : {}),
+      lanes
+    };
+  }
+
+  /**
+   * Slots background work is entitled to while it has calls waiting; at a limit of 1
+   * (e.g. after a rate limit) there is none, so one batch cannot hold the only slot
+   */
+  private backgroundReserve(): number {
+    const share = this.options.backgroundMinShare ?? 0;
+    const limit = Math.floor(this.limit);
+    return share > 0 ? Math.min(limit - 1, Math.max(1, Math.floor(limit * share))) : 0;
+  }
+
+  /**
+   * Whether a call in this lane may take a free slot now
+   */
+  private admits(lane: Lane): boolean {
+    const free = Math.floor(this.limit) - this.inFlight;
+    if (free <= 0) {
+      return false;
+    }
+
+    const background = this.lanes.background;
+    const reserve = this.backgroundReserve();
+    if (lane === 'interactive') {
+      // Leave the background reserve free when background work is queued for it
+      const owed = background.waiters.length > 0 ? Math.max(0, reserve - background.inFlight) : 0;
+      return free > owed;
+    }
+    return background.inFlight < reserve || this.lanes.interactive.waiters.length === 0;
+  }
+
+  /**
+   * Hand free slots to queued calls, interactive first (after any background reserve)
+   */
+  private dispatch(): void {
+    for (;;) {
+      const lane = LANES.find(candidate => this.lanes[candidate].waiters.length > 0 && this.admits(candidate));
+      if (!lane) {
+        return;
+      }
+      const waiter = this.lanes[lane].waiters.shift() as LaneWaiter;
+      waiter.grant(this.take(lane));
+    }
+  }
+
+  private recordWait(lane: Lane, waitMs: number): void {
+    const state = this.lanes[lane];
+    state.smoothedWaitMs += LATENCY_SMOOTHING * (waitMs - state.smoothedWaitMs);
+  }
+
+  private take(lane: Lane): () => void {
+    this.inFlight++;
+    this.lanes[lane].inFlight++;
+    let released = false;
+    return () => {
+      if (!released) {
+        released = true;
+        this.inFlight--;
+        this.lanes[lane].inFlight--;
+        this.dispatch();
+      }
+    };
+  }
+}
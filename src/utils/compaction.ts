@@ -0,0 +1,258 @@
+/**
+ * Fit bundles into a response size budget for chat clients with limited context
+ */
+
+import { Bundle, CompactionReport, Meta, Post, PostField } from '../models/index.js';
+import { projectPost } from './projection.js';
+
+// Rough chars-per-token ratio for English JSON; good enough to turn max_tokens into a byte budget
+const CHARS_PER_TOKEN = 4;
+
+// Longest post text kept in a compacted response
+const MAX_TEXT_CHARS = 400;
+
+// Ranking weights: newer, more engaged, more thematic posts win
+const RECENCY_WEIGHT = 0.5;
+const ENGAGEMENT_WEIGHT = 0.3;
+const THEME_WEIGHT = 0.2;
+const RECENCY_HALF_LIFE_DAYS = 14;
+
+/**
+ * A post with empty fields removed, long text truncated and (optionally) only some fields kept
+ */
+export type CompactPost = Partial<Post>;
+
+export type CompactedBundle<T extends Bundle> = Omit<T, 'posts'> & { posts: CompactPost[] };
+
+/**
+ * JSON-schema properties shared by every tool that accepts a response budget
+ */
+export const RESPONSE_BUDGET_PROPERTIES = {
+  max_chars: {
+    type: 'number',
+    description: 'Maximum response size in characters; posts are ranked and trimmed to fit',
+    minimum: 200
+  },
+  max_tokens: {
+    type: 'number',
+    description: 'Maximum response size in tokens (approximate); posts are ranked and trimmed to fit',
+    minimum: 50
+  }
+} as const;
+
+interface Candidate {
+  score: number;
+  cost: number;
+  index: number;
+  createdAt: number;
+  post: CompactPost;
+  source: Post;
+}
+
+/**
+ * Binary min-heap on score, so the weakest kept post is always on top
+ */
+class CandidateHeap {
+  private items: Candidate[] = [];
+
+  get size(): number {
+    return this.items.length;
+  }
+
+  push(item: Candidate): void {
+    const items = this.items;
+    items.push(item);
+    let i = items.length - 1;
+    while (i > 0) {
+      const parent = (i - 1) >> 1;
+      if ((items[parent] as Candidate).score <= item.score) {
+        break;
+      }
+      items[i] = items[parent] as Candidate;
+      i = parent;
+    }
+    items[i] = item;
+  }
+
+  pop(): Candidate | undefined {
+    const items = this.items;
+    const top = items[0];
+    const last = items.pop();
+    if (top === undefined || last === undefined || items.length === 0) {
+      return top;
+    }
+
+    let i = 0;
+    for (;;) {
+      const left = 2 * i + 1;
+      const right = left + 1;
+      let smallest = i;
+      let smallestScore = last.score;
+      if (left < items.length && (items[left] as Candidate).score < smallestScore) {
+        smallest = left;
+        smallestScore = (items[left] as Candidate).score;
+      }
+      if (right < items.length && (items[right] as Candidate).score < smallestScore) {
+        smallest = right;
+      }
+      if (smallest === i) {
+        break;
+      }
+      items[i] = items[smallest] as Candidate;
+      i = smallest;
+    }
+    items[i] = last;
+    return top;
+  }
+
+  drain(): Candidate[] {
+    return this.items.splice(0);
+  }
+}
+
+/**
+ * Character budget from max_chars / max_tokens (the tighter one wins); undefined means unbudgeted
+ */
+export function resolveCharBudget(maxChars?: number, maxTokens?: number): number | undefined {
+  const budgets = [maxChars, maxTokens !== undefined ? maxTokens * CHARS_PER_TOKEN : undefined]
+    .filter((budget): budget is number => budget !== undefined);
+  return budgets.length > 0 ? Math.floor(Math.min(...budgets)) : undefined;
+}
+
+/**
+ * Drop empty fields and truncate long text; reports whether the text was cut
+ */
+function compactPost(post: Post): { post: CompactPost; truncated: boolean } {
+  const compact: CompactPost = {
+    platform: post.platform,
+    post_id: post.post_id,
+    created_at_iso: post.created_at_iso
+  };
+  let truncated = false;
+
+  if (post.url) {
+    compact.url = post.url;
+  }
+  if (post.text) {
+    if (post.text.length > MAX_TEXT_CHARS) {
+      compact.text = `${post.text.slice(0, MAX_TEXT_CHARS).replace(/\s+\S*$/, '')}…`;
+      truncated = true;
+    } else {
+      compact.text = post.text;
+    }
+  }
+  if (post.hashtags.length > 0) {
+    compact.hashtags = post.hashtags;
+  }
+  if (post.mentions.length > 0) {
+    compact.mentions = post.mentions;
+  }
+  const engagement = Object.fromEntries(Object.entries(post.engagement).filter(([, value]) => value > 0));
+  if (Object.keys(engagement).length > 0) {
+    compact.engagement = engagement;
+  }
+  if (post.inferred_themes.length > 0) {
+    compact.inferred_themes = post.inferred_themes;
+  }
+
+  return { post: compact, truncated };
+}
+
+/**
+ * Rank a post by recency, engagement and theme coverage (each term in 0..1)
+ */
+function scorePost(post: Post, now: number): number {
+  const ageDays = Math.max(0, now - Date.parse(post.created_at_iso)) / (24 * 60 * 60 * 1000);
+  const recency = Number.isNaN(ageDays) ? 0 : Math.pow(0.5, ageDays / RECENCY_HALF_LIFE_DAYS);
+
+  const interactions = Object.values(post.engagement).reduce((total, value) => total + Math.max(0, value), 0);
+  const logInteractions = Math.log1p(interactions);
+  const engagement = logInteractions / (1 + logInteractions);
+
+  const themes = Math.min(post.inferred_themes.length, 3) / 3;
+
+  return RECENCY_WEIGHT * recency + ENGAGEMENT_WEIGHT * engagement + THEME_WEIGHT * themes;
+}
+
+/**
+ * Keep the best-ranked posts that fit in `budgetChars` of compact JSON.
+ *
+ * One pass over the posts: each is compacted, scored and pushed onto a min-heap;
+ * whenever the kept posts exceed the budget the lowest-scored one is evicted.
+ * Survivors are returned newest first, and meta.compaction reports what was trimmed.
+ * `finishMeta` may rewrite meta from the surviving posts (before the output is measured);
+ * it must not make meta longer, since the budget was planned around the original.
+ */
+export function compactBundle<T extends Bundle>(
+  result: T,
+  budgetChars: number,
+  fields?: readonly PostField[],
+  now: number = Date.now(),
+  finishMeta?: (meta: Meta, kept: readonly Post[]) => Meta
+): CompactedBundle<T> {
+  const postsIn = result.posts.length;
+
+  // Everything but the posts, with a worst-case report so the envelope estimate is an upper bound
+  const worstCaseReport: CompactionReport = {
+    budget_chars: budgetChars,
+    output_chars: budgetChars * 10,
+    posts_in: postsIn,
+    posts_kept: postsIn,
+    posts_dropped: postsIn,
+    texts_truncated: postsIn
+  };
+  const envelopeChars = JSON.stringify({
+    ...result,
+    posts: [],
+    meta: { ...result.meta, compaction: worstCaseReport }
+  }).length;
+
+  const postBudget = budgetChars - envelopeChars;
+  const heap = new CandidateHeap();
+  const truncatedIndexes = new Set<number>();
+  let keptChars = 0;
+
+  result.posts.forEach((post, index) => {
+    const compacted = compactPost(post);
+    const kept = fields ? projectPost(compacted.post, fields) : compacted.post;
+    // +1 for the separating comma
+    const cost = JSON.stringify(kept).length + 1;
+    if (compacted.truncated && (!fields || fields.includes('text'))) {
+      truncatedIndexes.add(index);
+    }
+
+    heap.push({ score: scorePost(post, now), cost, index, createdAt: Date.parse(post.created_at_iso), post: kept, source: post });
+    keptChars += cost;
+
+    while (keptChars > postBudget && heap.size > 0) {
+      keptChars -= (heap.pop() as Candidate).cost;
+    }
+  });
+
+  const kept = heap.drain().sort((a, b) => b.createdAt - a.createdAt || a.index - b.index);
+
+  const report: CompactionReport = {
+    budget_chars: budgetChars,
+    output_chars: 0,
+    posts_in: postsIn,
+    posts_kept: kept.length,
+    posts_dropped: postsIn - kept.length,
+    texts_truncated: kept.filter(candidate => truncatedIndexes.has(candidate.index)).length
+  };
+
+  const meta = finishMeta ? finishMeta(result.meta, kept.map(candidate => candidate.source)) : result.meta;
+  const compacted: CompactedBundle<T> = {
+    ...result,
+    posts: kept.map(candidate => candidate.post),
+    meta: { ...meta, compaction: report }
+  };
+
+  // Report the final serialized size (accounting for the digits of the number itself)
+  const placeholderLength = JSON.stringify(compacted).length;
+  report.output_chars = placeholderLength - 1 + String(placeholderLength).length;
+  if (String(report.output_chars).length !== String(placeholderLength).length) {
+    report.output_chars++;
+  }
+
+  return compacted;
+}
@@ -0,0 +1,50 @@
+/**
+ * Bounded-concurrency helpers for batch work
+ */
+
+/**
+ * Let pending I/O callbacks (other requests, health checks) run before continuing
+ */
+export function yieldToEventLoop(): Promise<void> {
+  return new Promise(resolve => setImmediate(resolve));
+}
+
+/**
+ * Run fn over items with at most `concurrency` calls in flight.
+ * Results keep input order; onSettled fires as each item finishes.
+ * Throws if concurrency is not a finite number >= 1.
+ */
+export async function mapWithConcurrency<T, R>(
+  items: readonly T[],
+  concurrency: number,
+  fn: (item: T, index: number) => Promise<R>,
+  onSettled?: (result: PromiseSettledResult<R>, item: T, index: number) => void
+): Promise<PromiseSettledResult<R>[]> {
+  if (!Number.isFinite(concurrency) || concurrency < 1) {
+    throw new Error(`Concurrency must be a finite number of at least 1, got ${concurrency}`);
+  }
+
+  const results: PromiseSettledResult<R>[] = new Array(items.length);
+  let next = 0;
+
+  async function worker(): Promise<void> {
+    while (next < items.length) {
+      const index = next++;
+      const item = items[index] as T;
+      let result: PromiseSettledResult<R>;
+
+      try {
+        result = { status: 'fulfilled', value: await fn(item, index) };
+      } catch (error) {
+        result = { status: 'rejected', reason: error };
+      }
+
+      results[index] = result;
+      onSettled?.(result, item, index);
+    }
+  }
+
+  const workers = Array.from({ length: Math.max(1, Math.min(concurrency, items.length)) }, () => worker());
+  await Promise.all(workers);
+  return results;
+}
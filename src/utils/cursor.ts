@@ -0,0 +1,105 @@
+/**
+ * Stateless "since" cursors for delta responses
+ *
+ * A cursor is base64url of: version u8, scope hash u32, issued-at u32 (unix seconds),
+ * then one u32 content hash per post the client has seen. Nothing is stored server-side,
+ * so any worker (or a restarted server) can answer a follow-up call.
+ */
+
+import { Bundle, DeltaReport, Person, Post } from '../models/index.js';
+
+const CURSOR_VERSION = 1;
+const HEADER_BYTES = 9;
+
+export interface DecodedCursor {
+  scope: number;
+  issuedAt: Date;
+  postHashes: Set<number>;
+}
+
+function fnv1a(input: string, hash: number = 0x811c9dc5): number {
+  for (let i = 0; i < input.length; i++) {
+    hash ^= input.charCodeAt(i);
+    hash = Math.imul(hash, 0x01000193) >>> 0;
+  }
+  return hash;
+}
+
+/**
+ * Identifies whose posts a cursor covers, so a cursor for one person is not applied to another
+ */
+function scopeHash(person: Person): number {
+  return fnv1a([person.platform, person.handle, person.profile_url, person.name]
+    .map(part => (part || '').toLowerCase())
+    .join('\u0000'));
+}
+
+/**
+ * Hash of everything a client would see change: identity, text, counters and themes
+ */
+export function postContentHash(post: Post): number {
+  const engagement = Object.keys(post.engagement)
+    .sort()
+    .map(key => `${key}=${post.engagement[key]}`)
+    .join(',');
+  return fnv1a([
+    post.platform,
+    post.post_id || post.url,
+    post.text,
+    engagement,
+    post.inferred_themes.join(',')
+  ].join('\u0000'));
+}
+
+export function encodeCursor(person: Person, posts: readonly Post[], now: number = Date.now()): string {
+  const buffer = Buffer.alloc(HEADER_BYTES + posts.length * 4);
+  buffer.writeUInt8(CURSOR_VERSION, 0);
+  buffer.writeUInt32LE(scopeHash(person), 1);
+  buffer.writeUInt32LE(Math.floor(now / 1000), 5);
+  posts.forEach((post, index) => buffer.writeUInt32LE(postContentHash(post), HEADER_BYTES + index * 4));
+  return buffer.toString('base64url');
+}
+
+export function decodeCursor(cursor: string): DecodedCursor {
+  const buffer = Buffer.from(cursor, 'base64url');
+  if (buffer.length < HEADER_BYTES || (buffer.length - HEADER_BYTES) % 4 !== 0 || buffer.readUInt8(0) !== CURSOR_VERSION) {
+    throw new Error('INVALID_INPUT: Malformed cursor; call again without one to start over');
+  }
+
+  const postHashes = new Set<number>();
+  for (let offset = HEADER_BYTES; offset < buffer.length; offset += 4) {
+    postHashes.add(buffer.readUInt32LE(offset));
+  }
+
+  return {
+    scope: buffer.readUInt32LE(1),
+    issuedAt: new Date(buffer.readUInt32LE(5) * 1000),
+    postHashes
+  };
+}
+
+/**
+ * Attach a fresh cursor to a bundle-shaped result and, given the client's previous
+ * cursor, keep only posts that are new or changed since it was issued.
+ * A cursor for a different person is ignored (the full bundle is returned, marked as a reset).
+ */
+export function applyCursor<T extends Bundle>(result: T, cursor: string | undefined, now: number = Date.now()): T {
+  const meta = { ...result.meta, cursor: encodeCursor(result.person, result.posts, now) };
+  if (!cursor) {
+    return { ...result, meta };
+  }
+
+  const previous = decodeCursor(cursor);
+  if (previous.scope !== scopeHash(result.person)) {
+    const delta: DeltaReport = { since_iso: previous.issuedAt.toISOString(), changed_posts: result.posts.length, unchanged_posts: 0, reset: true };
+    return { ...result, meta: { ...meta, delta } };
+  }
+
+  const posts = result.posts.filter(post => !previous.postHashes.has(postContentHash(post)));
+  const delta: DeltaReport = {
+    since_iso: previous.issuedAt.toISOString(),
+    changed_posts: posts.length,
+    unchanged_posts: result.posts.length - posts.length
+  };
+  return { ...result, posts, meta: { ...meta, delta } };
+}
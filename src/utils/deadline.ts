@@ -0,0 +1,150 @@
+/**
+ * Per-request deadlines propagated from the MCP call down to Apify runs
+ */
+
+import { ErrorType } from '../models/index.js';
+
+export class Deadline {
+  private readonly controller = new AbortController();
+  private timer: NodeJS.Timeout | undefined;
+
+  private constructor(private readonly expiresAt: number, parentSignal?: AbortSignal) {
+    if (Number.isFinite(expiresAt)) {
+      this.timer = setTimeout(() => this.controller.abort(), Math.max(0, expiresAt - Date.now()));
+      this.timer.unref();
+    }
+
+    if (parentSignal) {
+      if (parentSignal.aborted) {
+        this.controller.abort();
+      } else {
+        parentSignal.addEventListener('abort', () => this.controller.abort(), { once: true });
+      }
+    }
+  }
+
+  /**
+   * Create a deadline that expires budgetMs from now (optionally linked to a caller's abort signal)
+   */
+  static fromBudget(budgetMs: number, parentSignal?: AbortSignal): Deadline {
+    return new Deadline(Date.now() + Math.max(0, budgetMs), parentSignal);
+  }
+
+  /**
+   * Create a deadline that never expires
+   */
+  static none(): Deadline {
+    return new Deadline(Number.POSITIVE_INFINITY);
+  }
+
+  /**
+   * Milliseconds left before the deadline (0 once expired or cancelled)
+   */
+  remainingMs(): number {
+    if (this.controller.signal.aborted) {
+      return 0;
+    }
+    return Math.max(0, this.expiresAt - Date.now());
+  }
+
+  isExpired(): boolean {
+    return this.remainingMs() <= 0;
+  }
+
+  /**
+   * Abort signal fired when the deadline passes or the caller cancels
+   */
+  get signal(): AbortSignal {
+    return this.controller.signal;
+  }
+
+  /**
+   * Throw a DEADLINE_EXCEEDED error if no time is left for the given operation
+   */
+  throwIfExpired(operation: string): void {
+    if (this.isExpired()) {
+      throw Deadline.exceededError(operation);
+    }
+  }
+
+  /**
+   * Release the expiry timer once the request is finished
+   */
+  dispose(): void {
+    if (this.timer) {
+      clearTimeout(this.timer);
+      this.timer = undefined;
+    }
+  }
+
+  static exceededError(operation: string): Error {
+    const error = new Error(`${ErrorType.DEADLINE_EXCEEDED}: Request deadline exceeded during ${operation}`);
+    error.name = ErrorType.DEADLINE_EXCEEDED;
+    return error;
+  }
+}
+
+export interface RetryOptions {
+  deadline: Deadline;
+  maxAttempts: number;
+  baseDelayMs: number;
+  maxDelayMs: number;
+  // Shortest time an attempt needs to have a chance of succeeding
+  minAttemptMs: number;
+  isRetryable: (error: Error) => boolean;
+  onRetry?: (error: Error, attempt: number, delayMs: number) => void;
+}
+
+/**
+ * Sleep for the given time, resolving early if the signal aborts
+ */
+export function sleep(ms: number, signal?: AbortSignal): Promise<void> {
+  return new Promise(resolve => {
+    if (signal?.aborted) {
+      resolve();
+      return;
+    }
+    const timer = setTimeout(done, ms);
+    function done(): void {
+      clearTimeout(timer);
+      signal?.removeEventListener('abort', done);
+      resolve();
+    }
+    signal?.addEventListener('abort', done, { once: true });
+  });
+}
+
+/**
+ * Retry an operation with full-jitter exponential backoff, giving up early
+ * when the remaining deadline can no longer fit another attempt
+ */
+export async function retryWithBackoff<T>(
+  operation: (attempt: number) => Promise<T>,
+  options: RetryOptions
+): Promise<T> {
+  const { deadline, maxAttempts, baseDelayMs, maxDelayMs, minAttemptMs, isRetryable, onRetry } = options;
+
+  for (let attempt = 1; ; attempt++) {
+    deadline.throwIfExpired('retry');
+
+    try {
+      return await operation(attempt);
+    } catch (error) {
+      const err = error as Error;
+
+      if (attempt >= maxAttempts || !isRetryable(err)) {
+        throw err;
+      }
+
+      const delayMs = Math.round(Math.random() * Math.min(maxDelayMs, baseDelayMs * 2 ** (attempt - 1)));
+
+      // No point sleeping if the next attempt cannot finish before the deadline
+      if (deadline.remainingMs() < delayMs + minAttemptMs) {
+        throw err;
+      }
+
+      onRetry?.(err, attempt, delayMs);
+      await sleep(delayMs, deadline.signal);
+    }
+  }
+}
@@ -1,2 +1,10 @@
 export * from './theme-inference.js';
-export * from './normalize.js';
\ No newline at end of file
+export * from './normalize.js';
+export * from './deadline.js';
+export * from './concurrency.js';
+export * from './circuit-breaker.js';
+export * from './compaction.js';
+export * from './projection.js';
+export * from './cursor.js';
+export * from './response-format.js';
+export * from './progressive.js';
\ No newline at end of file
@@ -88,6 +88,46 @@ export class NormalizationUtils {
     };
   }
 
+  /**
+   * Sort posts newest first by created_at_iso
+   */
+  static sortByRecency(posts: Post[]): Post[] {
+    return posts
+      .map(post => ({ post, time: Date.parse(post.created_at_iso) || 0 }))
+      .sort((a, b) => b.time - a.time)
+      .map(({ post }) => post);
+  }
+
+  /**
+   * Merge posts from several sources, dropping duplicates and ordering newest first.
+   * A post is a duplicate if it has the same platform and post_id as an earlier one,
+   * or if it is a cross-post whose cleaned text matches a newer post on another platform.
+   */
+  static mergePosts(...sources: Post[][]): Post[] {
+    const seenIds = new Set<string>();
+    const seenTexts = new Map<string, Post['platform']>();
+    const merged: Post[] = [];
+
+    for (const post of this.sortByRecency(sources.flat())) {
+      const idKey = `${post.platform}:${post.post_id || post.url}`;
+      const textKey = post.text.toLowerCase();
+
+      const textPlatform = textKey ? seenTexts.get(textKey) : undefined;
+
+      if (seenIds.has(idKey) || (textPlatform !== undefined && textPlatform !== post.platform)) {
+        continue;
+      }
+
+      seenIds.add(idKey);
+      if (textKey && textPlatform === undefined) {
+        seenTexts.set(textKey, post.platform);
+      }
+      merged.push(post);
+    }
+
+    return merged;
+  }
+
   /**
    * Calculate overlap score between two text strings
    */
@@ -0,0 +1,70 @@
+/**
+ * Progressive fetching: scrape a small first page and only fetch the full limit
+ * when the first page's themes are weak or unstable
+ */
+
+import { Post, ProgressiveReport } from '../models/index.js';
+import { ThemeInferenceEngine } from './theme-inference.js';
+
+/**
+ * JSON-schema property for tools that support progressive fetching
+ */
+export const PROGRESSIVE_FETCH_PROPERTIES = {
+  progressive: {
+    type: 'boolean',
+    description: 'Scrape a small first page and fetch the full limit only if its themes are unclear (faster, cheaper)'
+  }
+} as const;
+
+export interface ProgressiveResult {
+  posts: Post[];
+  // Largest limit these posts fully answer (what the bundle may be cached as)
+  coveredLimit: number;
+  report?: ProgressiveReport;
+  // Set when the expansion failed and the first page is returned instead
+  expandError?: Error;
+}
+
+/**
+ * Fetch `limit` posts, starting with a `firstPage`-sized scrape. The first page is
+ * kept when its themes are confident and stable, or when the profile has no more posts.
+ */
+export async function fetchProgressively(
+  limit: number,
+  firstPage: number,
+  fetchPage: (pageLimit: number) => Promise<Post[]>
+): Promise<ProgressiveResult> {
+  if (limit <= firstPage) {
+    return { posts: await fetchPage(limit), coveredLimit: limit };
+  }
+
+  const first = await fetchPage(firstPage);
+  const signal = ThemeInferenceEngine.assessThemeSignal(first);
+  const report = (expanded: boolean): ProgressiveReport => ({
+    requested_limit: limit,
+    first_page: firstPage,
+    expanded,
+    theme_coverage: signal.coverage,
+    top_theme_share: signal.top_share,
+    stable: signal.stable
+  });
+
+  // A short first page means the profile has nothing more to give
+  if (first.length < firstPage) {
+    return { posts: first, coveredLimit: limit, report: report(false) };
+  }
+  if (signal.confident) {
+    return { posts: first, coveredLimit: firstPage, report: report(false) };
+  }
+
+  try {
+    return { posts: await fetchPage(limit), coveredLimit: limit, report: report(true) };
+  } catch (error) {
+    return {
+      posts: first,
+      coveredLimit: firstPage,
+      report: report(false),
+      expandError: error instanceof Error ? error : new Error(String(error))
+    };
+  }
+}
@@ -0,0 +1,18 @@
+/**
+ * Field projection for post responses
+ */
+
+import { Post, PostField } from '../models/index.js';
+
+/**
+ * Copy only the requested fields of a post (fields it lacks are skipped)
+ */
+export function projectPost(post: Partial<Post>, fields: readonly PostField[]): Partial<Post> {
+  const projected: Partial<Record<PostField, unknown>> = {};
+  for (const field of fields) {
+    if (post[field] !== undefined) {
+      projected[field] = post[field];
+    }
+  }
+  return projected as Partial<Post>;
+}
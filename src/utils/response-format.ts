@@ -0,0 +1,65 @@
+/**
+ * Response shaping for the post tools: budgets, field projection and compact encoding
+ */
+
+import { Bundle, PostField } from '../models/index.js';
+import { compactBundle, resolveCharBudget } from './compaction.js';
+import { applyCursor, encodeCursor } from './cursor.js';
+import { projectPost } from './projection.js';
+
+export interface ResponseFormat {
+  fields?: PostField[] | undefined;
+  compact?: boolean | undefined;
+  max_chars?: number | undefined;
+  max_tokens?: number | undefined;
+  cursor?: string | undefined;
+}
+
+/**
+ * JSON-schema properties shared by every tool that accepts a response format
+ */
+export const RESPONSE_FORMAT_PROPERTIES = {
+  fields: {
+    type: 'array',
+    items: {
+      type: 'string',
+      enum: ['platform', 'post_id', 'url', 'created_at_iso', 'text', 'hashtags', 'mentions', 'engagement', 'inferred_themes']
+    },
+    description: 'Only return these post fields, e.g. ["text", "created_at_iso", "inferred_themes"]'
+  },
+  compact: {
+    type: 'boolean',
+    description: 'Return JSON without indentation',
+    default: false
+  },
+  cursor: {
+    type: 'string',
+    description: 'meta.cursor from a previous call for the same person; only new or changed posts are returned'
+  }
+} as const;
+
+/**
+ * Serialize a bundle-shaped tool result: `cursor` drops posts the client already has,
+ * a budget ranks and trims posts (and implies compact output), `fields` projects each
+ * post, `compact` drops indentation. The returned meta.cursor covers only the posts the
+ * client then holds (those it already had plus those returned), so posts a budget left
+ * out count as new on the next delta call and are sent then.
+ */
+export function formatBundleResponse<T extends Bundle>(bundle: T, format: ResponseFormat): string {
+  const now = Date.now();
+  const result = applyCursor(bundle, format.cursor, now);
+  const budget = resolveCharBudget(format.max_chars, format.max_tokens);
+  if (budget !== undefined) {
+    // Posts applyCursor left out are ones the client already has; of the rest, only the kept ones were sent
+    const offered = new Set(result.posts);
+    return JSON.stringify(compactBundle(result, budget, format.fields, now, (meta, kept) => {
+      const sent = new Set(kept);
+      const held = bundle.posts.filter(post => !offered.has(post) || sent.has(post));
+      return { ...meta, cursor: encodeCursor(bundle.person, held, now) };
+    }));
+  }
+
+  const fields = format.fields;
+  const body = fields ? { ...result, posts: result.posts.map(post => projectPost(post, fields)) } : result;
+  return format.compact ? JSON.stringify(body) : JSON.stringify(body, null, 2);
+}
@@ -10,6 +10,20 @@ export interface Theme {
   weight: number;
 }
 
+export interface ThemeSignal {
+  // Share of posts with at least one theme
+  coverage: number;
+  // Share of posts carrying the most common theme
+  top_share: number;
+  // The most common theme leads in both halves of the page too
+  stable: boolean;
+  confident: boolean;
+}
+
+// A page is clear enough when most posts are themed and one theme recurs
+const MIN_THEME_COVERAGE = 0.6;
+const MIN_TOP_THEME_SHARE = 0.4;
+
 export class ThemeInferenceEngine {
   private static readonly THEMES: Theme[] = [
     {
@@ -54,6 +68,13 @@ export class ThemeInferenceEngine {
     }
   ];
 
+  /**
+   * Names of all themes the engine can assign
+   */
+  static themeNames(): string[] {
+    return this.THEMES.map(theme => theme.name);
+  }
+
   /**
    * Infer themes from a single post
    */
@@ -112,6 +133,33 @@ export class ThemeInferenceEngine {
       .map(([theme]) => theme);
   }
 
+  /**
+   * How clearly a page of (themed) posts points at its dominant theme
+   */
+  static assessThemeSignal(posts: Post[]): ThemeSignal {
+    if (posts.length === 0) {
+      return { coverage: 0, top_share: 0, stable: false, confident: false };
+    }
+
+    const dominant = this.getDominantThemes(posts);
+    const top = dominant[0];
+    const themed = posts.filter(post => post.inferred_themes.length > 0).length;
+    const withTop = top ? posts.filter(post => post.inferred_themes.includes(top)).length : 0;
+
+    const middle = Math.ceil(posts.length / 2);
+    const halves = [posts.slice(0, middle), posts.slice(middle)].filter(half => half.length > 0);
+    const stable = top !== undefined && halves.every(half => this.getDominantThemes(half)[0] === top);
+
+    const coverage = themed / posts.length;
+    const topShare = withTop / posts.length;
+    return {
+      coverage: Math.round(coverage * 100) / 100,
+      top_share: Math.round(topShare * 100) / 100,
+      stable,
+      confident: stable && coverage >= MIN_THEME_COVERAGE && topShare >= MIN_TOP_THEME_SHARE
+    };
+  }
+
   /**
    * Generate theme summary for context
    */
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+"""Golden parity: the Python pipeline must produce the bundles the TS pipeline produced
+
+golden/bundles.json is written by the TS path (`node dist/cli/golden.js golden/captures.jsonl
+--out golden/bundles.json`) from the raw Apify items in golden/captures.jsonl. Here the same
+items are served to the Python engine and its bundles compared field for field, apart from the
+fetch time. shared/theme_inference.py mirrors the TS theme rules, so inferred_themes are compared too.
+"""
+
+import asyncio
+import copy
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+
+from shared.models import Post
+from shared.theme_inference import ThemeInferenceEngine
+from social_mcp_server.config import Config
+from social_mcp_server.engine import SocialEngine, SocialFetchError
+from social_mcp_server.serialize import bundle_to_dict
+
+GOLDEN_DIR = Path(__file__).parent / "golden"
+GOLDEN = json.loads((GOLDEN_DIR / "bundles.json").read_text(encoding="utf-8"))
+CAPTURED_RUNS = [
+    record
+    for record in map(json.loads, (GOLDEN_DIR / "captures.jsonl").read_text(encoding="utf-8").splitlines())
+    if record["type"] == "apify_run"
+]
+
+
+def apify_stand_in() -> httpx.MockTransport:
+    """Answer the engine's Apify API calls with the captured run for the same actor and input"""
+    runs = {}
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        parts = request.url.path.strip("/").split("/")
+        if request.method == "POST" and parts[1:2] == ["acts"]:
+            actor_id = parts[2].replace("~", "/")
+            run_input = json.loads(request.content)
+            record = next(r for r in CAPTURED_RUNS if r["actor_id"] == actor_id and r["input"] == run_input)
+            run_id = f"run-{len(runs) + 1}"
+            runs[run_id] = record["items"]
+            return httpx.Response(201, json={"data": {"id": run_id, "status": "RUNNING", "defaultDatasetId": run_id}})
+        if request.method == "GET" and parts[1:2] == ["actor-runs"]:
+            return httpx.Response(200, json={"data": {"id": parts[2], "status": "SUCCEEDED", "defaultDatasetId": parts[2]}})
+        if request.method == "GET" and parts[1:2] == ["datasets"]:
+            return httpx.Response(200, text="\n".join(json.dumps(item) for item in runs[parts[2]]))
+        return httpx.Response(404, json={"error": {"message": "Route not found"}})
+
+    return httpx.MockTransport(handle)
+
+
+async def fetch_case(case: dict):
+    """Bundle (as a dict) or error type the Python engine gives for a golden case"""
+    async with httpx.AsyncClient(base_url="https://api.apify.com/v2", transport=apify_stand_in()) as client:
+        engine = SocialEngine(Config(apify_token="golden", apify_retry_base_ms=1), client=client)
+        try:
+            if case["platform"] == "x":
+                bundle = await engine.x_bundle(case["target"], case["limit"])
+            else:
+                bundle = await engine.linkedin_bundle(case["target"], case["limit"])
+        except SocialFetchError as error:
+            return error.error_type.value
+        return bundle_to_dict(bundle)
+
+
+def without_volatile_fields(bundle: dict) -> dict:
+    comparable = copy.deepcopy(bundle)
+    del comparable["meta"]["fetched_at_iso"]
+    return comparable
+
+
+@pytest.mark.parametrize("case", GOLDEN["cases"], ids=lambda case: f"{case['platform']}-{case['target']}")
+def test_python_bundle_matches_typescript(case):
+    result = asyncio.run(fetch_case(case))
+
+    if "error" in case:
+        assert result == case["error"]
+        return
+    assert isinstance(result, dict), f"Python pipeline failed with {result}"
+    assert without_volatile_fields(result) == without_volatile_fields(case["bundle"])
+
+
+@pytest.mark.parametrize("case", [case for case in GOLDEN["cases"] if "bundle" in case],
+                         ids=lambda case: f"{case['platform']}-{case['target']}")
+def test_python_themes_come_from_shared_engine(case):
+    result = asyncio.run(fetch_case(case))
+
+    for post in result["posts"]:
+        assert post["inferred_themes"] == ThemeInferenceEngine.infer_themes(Post(**post))
+
+
+def test_golden_covers_every_captured_run():
+    assert len(GOLDEN["cases"]) == len(CAPTURED_RUNS)
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-v"]))
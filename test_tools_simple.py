@@ -45,7 +45,7 @@ async def test_tools():
         # Try calling a tool to see if it handles missing token properly
         try:
             get_x_posts = tools['get_x_posts'].fn
-            result = get_x_posts("test_handle", 5)
+            result = await get_x_posts("test_handle", 5)
             print(f"   Tool response (no token): {result[:100]}...")
             if "APIFY_TOKEN" in result:
                 print("   ✅ Tool correctly validates token requirement")